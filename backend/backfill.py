@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Backfill several seasons in parallel, resuming interrupted runs
+Usage: python backfill.py SEASON [SEASON ...] [--processes N] [--chunk-days N] [--strategy S] [--restart]
+Example: python backfill.py 20152016 20162017 20172018 --processes 3
+
+Each season is synced by its own worker process in date chunks through the
+bulk upsert path. Every chunk that synced without a failed fetch or write
+is checkpointed in sync_checkpoints, so re-running the same command skips
+work already done and retries the rest - including the current season's
+last chunk, cut short at today, once it covers more days. Each process
+has its own upstream rate limit (SYNC_REQUESTS_PER_SECOND).
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.database.__init__ import init_database
+from src.database.config import DATABASE_URL, SessionLocal, engine
+from src.database.queries import clear_checkpoints, get_completed_chunks, mark_chunk_complete
+from src.database.sync_service import DatabaseSyncService
+
+# Days per checkpointed chunk
+DEFAULT_CHUNK_DAYS = 14
+
+def season_chunks(season: str, chunk_days: int):
+    """(start, end) date chunks covering a season's September..August, up to today"""
+    year = int(season[:4])
+    first, last = date(year, 9, 1), min(date(year + 1, 8, 31), datetime.now().date())
+    chunks = []
+    start = first
+    while start <= last:
+        end = min(start + timedelta(days=chunk_days - 1), last)
+        chunks.append((start, end))
+        start = end + timedelta(days=1)
+    return chunks
+
+def _init_worker():
+    # Pooled connections inherited through fork belong to the parent - never reuse them here
+    engine.dispose(close=False)
+
+def backfill_season(season: str, chunk_days: int, strategy: str = None, client_factory=None) -> dict:
+    """Sync every unfinished chunk of one season; runs inside a worker process"""
+    started = time.perf_counter()
+    db = SessionLocal()
+    sync_service = DatabaseSyncService(
+        client=client_factory() if client_factory else None,
+        fetch_strategy=strategy
+    )
+    stats = {'season': season, 'days': 0, 'games': 0, 'chunks': 0, 'skipped': 0, 'failed': 0, 'upstream_calls': 0}
+
+    try:
+        done = get_completed_chunks(db, season)
+        for start, end in season_chunks(season, chunk_days):
+            # A chunk cut off at today last time has grown since - sync it again
+            if start in done and done[start] >= end:
+                stats['skipped'] += 1
+                continue
+
+            errors_before = sync_service.fetch_errors
+            games = sync_service.sync_games_for_date_range(
+                db, datetime.combine(start, datetime.min.time()), datetime.combine(end, datetime.min.time()), season
+            )
+            stats['upstream_calls'] += sync_service.last_upstream_calls
+            stats['games'] += games
+            if sync_service.fetch_errors != errors_before or not sync_service.last_sync_complete:
+                # Some of the chunk's games were lost - leave it unchecked so the next run retries it
+                stats['failed'] += 1
+                continue
+            mark_chunk_complete(db, season, start, end, games)
+            stats['chunks'] += 1
+            stats['days'] += (end - start).days + 1
+    finally:
+        db.close()
+
+    stats['seconds'] = time.perf_counter() - started
+    return stats
+
+def backfill(seasons, processes: int = None, chunk_days: int = DEFAULT_CHUNK_DAYS, strategy: str = None,
+             restart: bool = False, client_factory=None) -> list:
+    """Backfill seasons across a process pool and print a throughput summary"""
+    init_database()
+
+    db = SessionLocal()
+    try:
+        # Teams first, once - every worker's games reference them
+        teams_service = DatabaseSyncService(client=client_factory() if client_factory else None)
+        print(f"Synced {teams_service.sync_teams(db)} teams")
+        if restart:
+            for season in seasons:
+                clear_checkpoints(db, season)
+    finally:
+        db.close()
+
+    processes = processes or min(len(seasons), os.cpu_count() or 1)
+    if DATABASE_URL.startswith("sqlite") and processes > 1:
+        # SQLite allows one writer at a time - parallel workers would just hit lock timeouts
+        print("SQLite database: running seasons one at a time")
+        processes = 1
+
+    print(f"Backfilling {len(seasons)} seasons with {processes} processes ({chunk_days}-day chunks)")
+    started = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker) as executor:
+        futures = {
+            executor.submit(backfill_season, season, chunk_days, strategy, client_factory): season
+            for season in seasons
+        }
+        for future in as_completed(futures):
+            try:
+                stats = future.result()
+            except Exception as e:
+                print(f"✗ {futures[future]} failed: {e} (re-run to resume)")
+                continue
+            results.append(stats)
+            print(f"✓ {stats['season']}: {stats['games']} games over {stats['days']} days "
+                  f"({stats['chunks']} chunks synced, {stats['skipped']} already done) in {stats['seconds']:.1f}s")
+            if stats['failed']:
+                print(f"  ! {stats['failed']} chunks had failed fetches or writes (re-run to retry them)")
+
+    elapsed = time.perf_counter() - started
+    days = sum(s['days'] for s in results)
+    games = sum(s['games'] for s in results)
+    calls = sum(s['upstream_calls'] for s in results)
+    print("\n" + "=" * 60)
+    print(f"Backfill finished in {elapsed:.1f}s: {len(results)}/{len(seasons)} seasons, "
+          f"{days} days, {games} games, {calls} upstream calls")
+    print(f"Throughput: {days / elapsed:.1f} days/sec, {games / elapsed:.1f} games/sec")
+    print("=" * 60)
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill NHL seasons in parallel with resumable checkpoints")
+    parser.add_argument("seasons", nargs="+", help="Seasons to sync, e.g. 20232024")
+    parser.add_argument("--processes", type=int, default=None, help="Worker processes (default: one per season, up to CPU count)")
+    parser.add_argument("--chunk-days", type=int, default=DEFAULT_CHUNK_DAYS, help="Days per checkpointed chunk")
+    parser.add_argument("--strategy", default=None, help="Fetch strategy: weekly, team_season or daily")
+    parser.add_argument("--restart", action="store_true", help="Ignore checkpoints and sync everything again")
+    args = parser.parse_args()
+
+    backfill(args.seasons, args.processes, args.chunk_days, args.strategy, args.restart)
+
+if __name__ == "__main__":
+    main()
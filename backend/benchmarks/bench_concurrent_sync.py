@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Benchmark serial vs concurrent date-range sync against a fake client
+Usage: python benchmarks/bench_concurrent_sync.py [LATENCY_SECONDS] [WORKERS]
+Example: python benchmarks/bench_concurrent_sync.py 0.05 8
+
+Uses DATABASE_URL if set, otherwise a throwaway SQLite file.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+)
+
+from src.database import init_database, drop_all_tables
+from src.database.config import SessionLocal
+from src.database.sync_service import DatabaseSyncService
+from fake_nhl_client import FakeNHLClient
+
+def run(client, workers, season, start_date, end_date):
+    drop_all_tables()
+    init_database()
+    db = SessionLocal()
+    try:
+        service = DatabaseSyncService(
+            client=client, max_workers=workers, requests_per_second=0, fetch_strategy="daily"
+        )
+        service.sync_teams(db)
+        started = time.perf_counter()
+        games = service.sync_games_for_date_range(db, start_date, end_date, season)
+        return time.perf_counter() - started, games
+    finally:
+        db.close()
+
+def main():
+    latency = float(sys.argv[1]) if len(sys.argv) > 1 else 0.05
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    season = "20242025"
+    start_date, end_date = datetime(2024, 10, 1), datetime(2025, 4, 30)
+
+    client = FakeNHLClient(seasons=(season,), latency=latency)
+    serial_time, serial_games = run(client, 1, season, start_date, end_date)
+    concurrent_time, concurrent_games = run(client, workers, season, start_date, end_date)
+
+    print("=" * 60)
+    print(f"Upstream latency: {latency * 1000:.0f} ms/call")
+    print(f"Serial:          {serial_time:6.2f}s  ({serial_games} games)")
+    print(f"{workers} workers:       {concurrent_time:6.2f}s  ({concurrent_games} games)")
+    print(f"Speedup:         {serial_time / concurrent_time:6.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Compare upstream call counts of the sync fetch strategies
+Usage: python benchmarks/bench_fetch_strategies.py [LATENCY_SECONDS]
+Example: python benchmarks/bench_fetch_strategies.py 0.02
+
+Runs a full-season backfill (Oct 1 to Sep 30, like setup_database.py run
+in the summer) and a 10-day catch-up sync with every strategy. Uses
+DATABASE_URL if set, otherwise a throwaway SQLite file.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+)
+
+from src.database import init_database, drop_all_tables
+from src.database.config import SessionLocal
+from src.database.sync_service import DatabaseSyncService, FETCH_STRATEGIES
+from fake_nhl_client import FakeNHLClient
+
+SCENARIOS = [
+    ("full season", datetime(2024, 10, 1), datetime(2025, 9, 30)),
+    ("10-day catch-up", datetime(2025, 1, 10), datetime(2025, 1, 19)),
+]
+
+def run(client, strategy, start_date, end_date, season):
+    drop_all_tables()
+    init_database()
+    db = SessionLocal()
+    try:
+        service = DatabaseSyncService(client=client, requests_per_second=0, fetch_strategy=strategy)
+        service.sync_teams(db)
+        started = time.perf_counter()
+        games = service.sync_games_for_date_range(db, start_date, end_date, season)
+        return time.perf_counter() - started, games, service.last_upstream_calls
+    finally:
+        db.close()
+
+def main():
+    latency = float(sys.argv[1]) if len(sys.argv) > 1 else 0.02
+    season = "20242025"
+    client = FakeNHLClient(seasons=(season,), latency=latency)
+
+    results = []
+    for name, start_date, end_date in SCENARIOS:
+        for strategy in FETCH_STRATEGIES:
+            results.append((name, strategy) + run(client, strategy, start_date, end_date, season))
+
+    print("=" * 60)
+    print(f"{'scenario':<18}{'strategy':<14}{'calls':>7}{'games':>8}{'time':>9}")
+    for name, strategy, elapsed, games, calls in results:
+        print(f"{name:<18}{strategy:<14}{calls:>7}{games:>8}{elapsed:>8.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark batched multi-range standings against per-range engine calls
+Usage: python benchmarks/bench_range_batches.py [SEASONS]
+Example: python benchmarks/bench_range_batches.py 3
+
+Builds two workloads for the latest synthetic season - every rolling
+10-day window, and "last N days" for N=7..60 ending on each Sunday - then
+checks calculate_standings_ranges against calculate_standings for a
+sample of ranges and times the whole batch both ways. Uses DATABASE_URL
+if set, otherwise a throwaway SQLite file.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+)
+
+from src.database import game_store
+from src.database.config import SessionLocal
+from src.database.queries import calculate_standings, calculate_standings_ranges
+from seed_data import seed_seasons
+
+# Per-range engines timed against the batch (python is too slow for thousands of windows)
+PER_RANGE_ENGINES = ['sql', 'cumulative']
+PER_RANGE_SAMPLE = 200
+
+def workloads(season):
+    year = int(season[:4])
+    first, last = date(year, 10, 1), date(year + 1, 4, 30)
+    days = [first + timedelta(days=i) for i in range((last - first).days + 1)]
+
+    rolling = [(day, day + timedelta(days=9)) for day in days[:-9]]
+    last_n = [
+        (end - timedelta(days=n - 1), end)
+        for end in days if end.weekday() == 6
+        for n in range(7, 61)
+    ]
+    return {'rolling 10-day windows': rolling, 'last N days, N=7..60': last_n}
+
+def check_parity(db, season, ranges):
+    batch = calculate_standings_ranges(db, season, ranges)
+    for i, (start, end) in enumerate(ranges):
+        expected = {
+            row['teamAbbrev']['default']: (row['gamesPlayed'], row['points'], row['goalDifferential'])
+            for row in calculate_standings(db, start, end, season, engine='python')['standings']
+        }
+        actual = {
+            abbrev: (batch['gamesPlayed'][i][j], batch['points'][i][j], batch['goalDifferential'][i][j])
+            for j, abbrev in enumerate(batch['teams']) if batch['gamesPlayed'][i][j]
+        }
+        assert actual == expected, f"batch differs for {start}..{end}"
+
+def main():
+    season_count = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    seasons = [f"{year}{year + 1}" for year in range(2024 - season_count + 1, 2025)]
+    season = seasons[-1]
+
+    seed_seasons(seasons)
+    db = SessionLocal()
+    try:
+        for name, ranges in workloads(season).items():
+            check_parity(db, season, ranges[::max(1, len(ranges) // 25)])
+            print(f"\n{name}: {len(ranges)} ranges (parity OK)")
+
+            # Cold includes loading the columnar store from the games table
+            game_store._stores.clear()
+            started = time.perf_counter()
+            calculate_standings_ranges(db, season, ranges)
+            print(f"  {'batch (cold)':<22}{(time.perf_counter() - started) * 1000:10.2f} ms")
+
+            started = time.perf_counter()
+            calculate_standings_ranges(db, season, ranges)
+            print(f"  {'batch (warm)':<22}{(time.perf_counter() - started) * 1000:10.2f} ms")
+
+            sample = ranges[:PER_RANGE_SAMPLE]
+            for engine in PER_RANGE_ENGINES:
+                started = time.perf_counter()
+                for start, end in sample:
+                    calculate_standings(db, start, end, season, engine=engine)
+                projected = (time.perf_counter() - started) / len(sample) * len(ranges) * 1000
+                print(f"  {engine + ' per range':<22}{projected:10.2f} ms (projected from {len(sample)} ranges)")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
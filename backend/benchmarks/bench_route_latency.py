@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Load-test /api/nhl/standings and /api/nhl/teams with concurrent mixed traffic
+Usage: python benchmarks/bench_route_latency.py [REQUESTS] [CONCURRENCY] [--inline]
+Example: python benchmarks/bench_route_latency.py 400 10
+
+Serves the app in-process against a fake NHL client whose calls take
+100 ms, so the no-date /standings requests are slow. Reports /teams
+latency alone and under the mixed load. --inline runs service calls
+directly on the event loop (the old behaviour) for comparison.
+
+Uses DATABASE_URL if set, otherwise a throwaway SQLite file.
+"""
+
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+)
+
+import httpx
+from src.main import app
+from src.sports.nhl import routes
+from src.sports.nhl.services import NHLService
+from fake_nhl_client import FakeNHLClient
+from seed_data import seed_seasons
+
+SEASON = "20242025"
+
+MIXED_TRAFFIC = [
+    ("/api/nhl/teams", {}),
+    ("/api/nhl/standings", {"season": SEASON}),
+    ("/api/nhl/standings", {"season": SEASON, "start_date": "2024-10-01", "end_date": "2025-04-30"}),
+    ("/api/nhl/standings", {"season": SEASON, "start_date": "2024-12-01", "end_date": "2025-01-31",
+                            "division": "Atlantic"}),
+]
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+async def load(traffic, total, concurrency):
+    """Fire total requests drawn from traffic with bounded concurrency; latencies per path"""
+    latencies = {}
+    rng = random.Random(0)
+    queue = [rng.choice(traffic) for _ in range(total)]
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        async def worker():
+            while queue:
+                path, params = queue.pop()
+                started = time.perf_counter()
+                response = await client.get(path, params=params)
+                response.raise_for_status()
+                key = path + (" (range)" if "start_date" in params else "")
+                latencies.setdefault(key, []).append((time.perf_counter() - started) * 1000)
+
+        await asyncio.gather(*[worker() for _ in range(concurrency)])
+    return latencies
+
+def report(title, latencies):
+    print(f"\n{title}")
+    print(f"  {'endpoint':<34}{'n':>5}{'p50 ms':>10}{'p99 ms':>10}")
+    for key, values in sorted(latencies.items()):
+        print(f"  {key:<34}{len(values):>5}{statistics.median(values):>10.1f}{percentile(values, 99):>10.1f}")
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    total = int(args[0]) if args else 400
+    concurrency = int(args[1]) if len(args) > 1 else 10
+
+    seed_seasons((SEASON,))
+    client = FakeNHLClient(seasons=(SEASON,), latency=0.1)
+    routes.nhl_service = NHLService(client=client)
+
+    if "--inline" in sys.argv:
+        async def run_inline(func, *args, **kwargs):
+            return func(*args, **kwargs)
+        routes.run_blocking = run_inline
+
+    report("/teams alone", asyncio.run(load(MIXED_TRAFFIC[:1], total // 4, concurrency)))
+    report("Mixed /standings + /teams", asyncio.run(load(MIXED_TRAFFIC, total, concurrency)))
+
+if __name__ == "__main__":
+    main()
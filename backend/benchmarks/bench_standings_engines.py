@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the standings engines
+Usage: python benchmarks/bench_standings_engines.py [SEASONS] [REPEATS]
+Example: python benchmarks/bench_standings_engines.py 5 20
+
+Loads SEASONS synthetic seasons and times each engine on a full-season
+query. Parity between the engines is checked by tests/test_standings_engines.py.
+Uses DATABASE_URL if set, otherwise a throwaway SQLite file.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+)
+
+from src.database.config import SessionLocal
+from src.database.queries import calculate_standings
+from seed_data import seed_seasons
+
+ENGINES = ['python', 'sql', 'cumulative', 'vectorized']
+
+def main():
+    season_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    seasons = [f"{year}{year + 1}" for year in range(2024 - season_count + 1, 2025)]
+
+    seed_seasons(seasons)
+    db = SessionLocal()
+    try:
+        season = seasons[-1]
+        start, end = date(int(season[:4]), 10, 1), date(int(season[4:]), 6, 30)
+        print(f"\nFull-season standings, {season_count} seasons loaded, {repeats} runs each")
+        for engine in ENGINES:
+            started = time.perf_counter()
+            for _ in range(repeats):
+                calculate_standings(db, start, end, season, engine=engine)
+            elapsed = (time.perf_counter() - started) / repeats * 1000
+            print(f"  {engine:<12}{elapsed:8.2f} ms")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Local stand-in for nhlpy's NHLClient used by the benchmarks.
+Generates deterministic synthetic seasons and replays them through
+RecordedNHLClient, which sleeps on every call to mimic upstream latency,
+so no network access is needed.
+"""
+
+import os
+import random
+import sys
+from datetime import date, timedelta
+from itertools import groupby
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.sports.nhl.recorded_client import RecordedNHLClient
+
+TEAMS = [
+    ('BOS', 'Atlantic', 'Eastern'), ('BUF', 'Atlantic', 'Eastern'), ('DET', 'Atlantic', 'Eastern'),
+    ('FLA', 'Atlantic', 'Eastern'), ('MTL', 'Atlantic', 'Eastern'), ('OTT', 'Atlantic', 'Eastern'),
+    ('TBL', 'Atlantic', 'Eastern'), ('TOR', 'Atlantic', 'Eastern'), ('CAR', 'Metropolitan', 'Eastern'),
+    ('CBJ', 'Metropolitan', 'Eastern'), ('NJD', 'Metropolitan', 'Eastern'), ('NYI', 'Metropolitan', 'Eastern'),
+    ('NYR', 'Metropolitan', 'Eastern'), ('PHI', 'Metropolitan', 'Eastern'), ('PIT', 'Metropolitan', 'Eastern'),
+    ('WSH', 'Metropolitan', 'Eastern'), ('CHI', 'Central', 'Western'), ('COL', 'Central', 'Western'),
+    ('DAL', 'Central', 'Western'), ('MIN', 'Central', 'Western'), ('NSH', 'Central', 'Western'),
+    ('STL', 'Central', 'Western'), ('UTA', 'Central', 'Western'), ('WPG', 'Central', 'Western'),
+    ('ANA', 'Pacific', 'Western'), ('CGY', 'Pacific', 'Western'), ('EDM', 'Pacific', 'Western'),
+    ('LAK', 'Pacific', 'Western'), ('SEA', 'Pacific', 'Western'), ('SJS', 'Pacific', 'Western'),
+    ('VAN', 'Pacific', 'Western'), ('VGK', 'Pacific', 'Western'),
+]
+
+
+def synthetic_season(season: str, seed: int = 0):
+    """Build a list of raw schedule games shaped like the NHL API payload"""
+    rng = random.Random(f"{season}-{seed}")
+    start = date(int(season[:4]), 10, 8)
+    games = []
+    game_number = 1
+    for day in range(180):
+        game_date = start + timedelta(days=day)
+        teams = [t[0] for t in TEAMS]
+        rng.shuffle(teams)
+        for i in range(0, rng.randint(2, 14) * 2, 2):
+            home_score, away_score = rng.randint(0, 6), rng.randint(0, 6)
+            period_type = 'REG'
+            if home_score == away_score:
+                period_type = rng.choice(['OT', 'SO'])
+                home_score += rng.choice([0, 1])
+                away_score += 0 if home_score > away_score else 1
+            games.append({
+                'id': int(f"{season[:4]}02{game_number:04d}"),
+                'season': int(season),
+                'gameType': 2,
+                'gameState': 'OFF',
+                'startTimeUTC': f"{game_date.isoformat()}T23:00:00Z",
+                'homeTeam': {'abbrev': teams[i], 'score': home_score},
+                'awayTeam': {'abbrev': teams[i + 1], 'score': away_score},
+                'periodDescriptor': {'periodType': period_type},
+            })
+            game_number += 1
+    return games
+
+
+def synthetic_teams():
+    """teams.teams() payload for TEAMS"""
+    return [
+        {'abbr': abbrev, 'name': abbrev, 'franchise_id': i,
+         'division': {'name': division}, 'conference': {'name': conference}}
+        for i, (abbrev, division, conference) in enumerate(TEAMS, start=1)
+    ]
+
+
+def synthetic_standings(games):
+    """{date: league_standings payload} after every game date, shaped like the API feed"""
+    divisions = {abbrev: (division, conference) for abbrev, division, conference in TEAMS}
+    totals = {
+        abbrev: {'gamesPlayed': 0, 'wins': 0, 'losses': 0, 'otLosses': 0, 'points': 0,
+                 'goalFor': 0, 'goalAgainst': 0}
+        for abbrev in divisions
+    }
+    by_date = {}
+    for day, day_games in groupby(games, key=lambda game: game['startTimeUTC'][:10]):
+        for game in day_games:
+            home, away = game['homeTeam'], game['awayTeam']
+            overtime = game['periodDescriptor']['periodType'] != 'REG'
+            for team, goals_for, goals_against in ((home, home['score'], away['score']),
+                                                   (away, away['score'], home['score'])):
+                stats = totals[team['abbrev']]
+                stats['gamesPlayed'] += 1
+                stats['goalFor'] += goals_for
+                stats['goalAgainst'] += goals_against
+                if goals_for > goals_against:
+                    stats['wins'] += 1
+                    stats['points'] += 2
+                elif overtime:
+                    stats['otLosses'] += 1
+                    stats['points'] += 1
+                else:
+                    stats['losses'] += 1
+
+        ordered = sorted(totals.items(), key=lambda item: (-item[1]['points'], item[0]))
+        by_date[day] = {'standings': [
+            dict(stats, date=day, teamAbbrev={'default': abbrev}, teamName={'default': abbrev},
+                 divisionName=divisions[abbrev][0], conferenceName=divisions[abbrev][1],
+                 goalDifferential=stats['goalFor'] - stats['goalAgainst'], leagueSequence=rank)
+            for rank, (abbrev, stats) in enumerate(ordered, start=1)
+        ]}
+    return by_date
+
+
+class FakeNHLClient(RecordedNHLClient):
+    """Drop-in for NHLClient serving synthetic seasons with artificial latency"""
+
+    def __init__(self, seasons=("20242025",), latency: float = 0.05, error_rate: float = 0.0):
+        games_by_season = {season: synthetic_season(season) for season in seasons}
+        super().__init__(
+            games_by_season,
+            synthetic_teams(),
+            {season: synthetic_standings(games) for season, games in games_by_season.items()},
+            latency=latency,
+            error_rate=error_rate
+        )
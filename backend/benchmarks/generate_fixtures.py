@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Write NHL API fixtures for RecordedNHLClient
+Usage: python benchmarks/generate_fixtures.py OUT_DIR [SEASON ...] [--live]
+Example: python benchmarks/generate_fixtures.py fixtures/ 20232024 20242025
+
+Default is a deterministic synthetic season per SEASON (same data as
+FakeNHLClient). --live records the real API instead: teams, every team's
+season schedule (merged by game id) and the league standings after each
+game date - roughly 250 calls per season.
+
+Replay with NHL_CLIENT=recorded:OUT_DIR or RecordedNHLClient.from_fixtures().
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.sports.nhl.recorded_client import RecordedNHLClient
+from fake_nhl_client import FakeNHLClient
+
+def record_live(seasons) -> RecordedNHLClient:
+    """Capture the live API's responses for the given seasons"""
+    from nhlpy import NHLClient
+    client = NHLClient()
+    teams = client.teams.teams()
+
+    games_by_season, standings_by_season = {}, {}
+    for season in seasons:
+        games = {}
+        for team in teams:
+            for game in client.schedule.team_season_schedule(team['abbr'], season).get('games', []):
+                games[game['id']] = game
+        games_by_season[season] = sorted(games.values(), key=lambda game: game.get('startTimeUTC', ''))
+
+        game_dates = sorted({RecordedNHLClient.schedule_day(game) for game in games_by_season[season]})
+        standings_by_season[season] = {}
+        for i, day in enumerate(game_dates, start=1):
+            standings_by_season[season][day] = client.standings.league_standings(date=day)
+            if i % 25 == 0:
+                print(f"   {season}: standings for {i}/{len(game_dates)} dates recorded")
+        print(f"✓ Recorded {season}: {len(games)} games, {len(game_dates)} standings dates")
+
+    return RecordedNHLClient(games_by_season, teams, standings_by_season)
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    if not args:
+        print("Usage: python benchmarks/generate_fixtures.py OUT_DIR [SEASON ...] [--live]")
+        sys.exit(1)
+
+    out_dir, seasons = args[0], args[1:] or ["20242025"]
+    client = record_live(seasons) if "--live" in sys.argv else FakeNHLClient(seasons=seasons, latency=0)
+    client.save_fixtures(out_dir)
+
+    games = sum(len(games) for games in client.games_by_season.values())
+    print(f"✓ Wrote fixtures for {len(seasons)} seasons ({games} games) to {out_dir}")
+
+if __name__ == "__main__":
+    main()
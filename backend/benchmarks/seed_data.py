@@ -0,0 +1,29 @@
+"""
+Fill the benchmark database with synthetic seasons from FakeNHLClient.
+Goes through DatabaseSyncService, so games land via the bulk upsert path.
+"""
+
+from datetime import datetime
+
+from src.database import init_database, drop_all_tables
+from src.database.config import SessionLocal
+from src.database.sync_service import DatabaseSyncService
+from fake_nhl_client import FakeNHLClient
+
+def seed_seasons(seasons):
+    """Recreate all tables and load teams plus every game of the given seasons"""
+    drop_all_tables()
+    init_database()
+    client = FakeNHLClient(seasons=seasons, latency=0)
+    db = SessionLocal()
+    try:
+        sync = DatabaseSyncService(client=client, requests_per_second=0, fetch_strategy="team_season")
+        sync.sync_teams(db)
+        for season in seasons:
+            start_year = int(season[:4])
+            sync.sync_games_for_date_range(
+                db, datetime(start_year, 9, 1), datetime(start_year + 1, 8, 31), season
+            )
+    finally:
+        db.close()
+    return client
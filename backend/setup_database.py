@@ -12,6 +12,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.database.__init__ import init_database
 from src.database.config import SessionLocal
+from src.database.queries import season_last_day
 from src.database.sync_service import DatabaseSyncService
 from datetime import datetime
 
@@ -35,7 +36,7 @@ def setup():
         
         # Step 3: Sync current season games
         print("\n3. Syncing 2024-25 season games...")
-        print("   This may take 5-10 minutes...")
+        print("   This may take a minute or two...")
         
         season = "20242025"
         start_date = datetime(2024, 10, 1)
@@ -46,6 +47,12 @@ def setup():
         )
         print(f"   ✓ Synced {games_count} games")
         
+        # Step 4: Record the latest official standings so the default view is served locally
+        print("\n4. Saving league standings snapshot...")
+        sync_service.sync_standings_snapshots(
+            db, season, end_date=min(end_date.date(), season_last_day(season))
+        )
+        
         print("\n" + "=" * 60)
         print("✓ Database setup complete!")
         print("=" * 60)
@@ -0,0 +1,42 @@
+from functools import partial
+from typing import Optional
+import os
+import anyio
+
+# Upper bound on threads running blocking service work (DB queries, NHL API calls)
+BLOCKING_MAX_THREADS = int(os.getenv("BLOCKING_MAX_THREADS", "20"))
+
+_limiter: Optional[anyio.CapacityLimiter] = None
+
+def _get_limiter() -> anyio.CapacityLimiter:
+    # Created lazily - a CapacityLimiter has to be built inside the running event loop
+    global _limiter
+    if _limiter is None:
+        _limiter = anyio.CapacityLimiter(BLOCKING_MAX_THREADS)
+    return _limiter
+
+async def run_blocking(func, *args, **kwargs):
+    """
+    Run a blocking call on the bounded worker pool so the event loop stays
+    free to serve other requests while it waits on the DB or upstream API.
+    """
+    return await anyio.to_thread.run_sync(partial(func, *args, **kwargs), limiter=_get_limiter())
+
+_DONE = object()
+
+async def iterate_blocking(iterator):
+    """
+    Async view of a blocking iterator (e.g. rows off a DB cursor): each
+    next() runs on the bounded worker pool, one item at a time.
+    """
+    iterator = iter(iterator)
+    try:
+        while True:
+            item = await run_blocking(next, iterator, _DONE)
+            if item is _DONE:
+                return
+            yield item
+    finally:
+        # Client went away mid-stream: let a generator release its cursor/session now
+        if hasattr(iterator, 'close'):
+            await run_blocking(iterator.close)
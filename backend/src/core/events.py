@@ -0,0 +1,50 @@
+from typing import Dict, Set
+import asyncio
+import json
+import os
+
+# Seconds between keep-alive comments on idle event streams
+SSE_HEARTBEAT_SECONDS = int(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+
+# Events buffered per client before the oldest are dropped (slow readers can't hold memory)
+SSE_CLIENT_QUEUE_SIZE = int(os.getenv("SSE_CLIENT_QUEUE_SIZE", "100"))
+
+class EventBroadcaster:
+    """
+    Fans server-sent events out to every connected client, one bounded
+    asyncio queue per client. publish() must be called on the event loop.
+    """
+
+    def __init__(self, queue_size: int = SSE_CLIENT_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._clients: Set[asyncio.Queue] = set()
+        self.published = 0
+        self.dropped = 0
+
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
+
+    def publish(self, event: str, data: Dict):
+        message = f"event: {event}\ndata: {json.dumps(data)}\n\n"
+        self.published += 1
+        for queue in self._clients:
+            if queue.full():
+                queue.get_nowait()
+                self.dropped += 1
+            queue.put_nowait(message)
+
+    async def stream(self, heartbeat_seconds: int = SSE_HEARTBEAT_SECONDS):
+        """SSE text for one client until it disconnects"""
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._clients.add(queue)
+        try:
+            # Tell EventSource how long to wait before reconnecting
+            yield "retry: 5000\n\n"
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), timeout=heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+        finally:
+            self._clients.discard(queue)
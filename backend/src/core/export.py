@@ -0,0 +1,38 @@
+from datetime import date
+from typing import Iterable, Iterator, List
+import csv
+import io
+import json
+
+# Export format -> media type
+EXPORT_MEDIA_TYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv'
+}
+
+def _plain(value):
+    return value.isoformat() if isinstance(value, date) else value
+
+def encode_export(chunks: Iterable[List[dict]], columns: List[str], fmt: str) -> Iterator[str]:
+    """
+    Render chunks of row dicts as NDJSON lines or CSV (header first), one
+    string per chunk, so a streaming response sends each chunk as it comes.
+    """
+    if fmt not in EXPORT_MEDIA_TYPES:
+        raise ValueError(f"Unknown export format '{fmt}', expected one of {list(EXPORT_MEDIA_TYPES)}")
+
+    if fmt == 'ndjson':
+        for chunk in chunks:
+            yield ''.join(json.dumps({c: _plain(row[c]) for c in columns}) + '\n' for row in chunk)
+        return
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    # Header goes out before the query runs
+    yield buffer.getvalue()
+    for chunk in chunks:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([_plain(row[c]) for c in columns] for row in chunk)
+        yield buffer.getvalue()
@@ -0,0 +1,32 @@
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from hashlib import sha256
+from typing import Optional
+
+def make_etag(*parts) -> str:
+    """Strong ETag derived from whatever identifies the response's content"""
+    return '"' + sha256(repr(parts).encode()).hexdigest()[:32] + '"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the client's If-None-Match already names this ETag"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [value.strip() for value in header.split(",")]
+    return "*" in candidates or etag in candidates
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag})
+
+def conditional_json(request: Request, content, etag: Optional[str] = None) -> Response:
+    """
+    JSON response carrying an ETag. Without a precomputed ETag one is
+    hashed from the rendered body, which still saves the bytes on a match.
+    """
+    response = JSONResponse(jsonable_encoder(content))
+    etag = etag or make_etag(response.body)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return response
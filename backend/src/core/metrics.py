@@ -0,0 +1,197 @@
+"""
+Minimal in-process metrics with Prometheus text exposition.
+Counters and histograms are recorded by timing hooks on the hot paths;
+gauges are read from callbacks when /api/metrics is scraped.
+"""
+
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Tuple
+import threading
+import time
+
+# Latency buckets in seconds (1 ms .. 30 s)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_registry: List["_Metric"] = []
+_gauge_callbacks: List[Tuple[str, str, Callable[[], Dict[Tuple, float]], Tuple[str, ...]]] = []
+
+def _format_labels(names: Iterable[str], values: Iterable) -> str:
+    escape = lambda v: str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    pairs = [f'{name}="{escape(value)}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def _key(self, labels: Dict) -> Tuple:
+        return tuple(labels.get(name, "") for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[Tuple, float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = dict(self._values)
+        return super().render() + [
+            f"{self.name}{_format_labels(self.labelnames, key)} {value}" for key, value in sorted(values.items())
+        ]
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+        # key -> (per-bucket counts, count, sum)
+        self._values: Dict[Tuple, List] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            series = self._values.setdefault(key, [[0] * len(self.buckets), 0, 0.0])
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][i] += 1
+            series[1] += 1
+            series[2] += value
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the duration of the with-block, whether or not it raises"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = {key: (list(b), c, s) for key, (b, c, s) in self._values.items()}
+        lines = super().render()
+        for key, (bucket_counts, count, total) in sorted(values.items()):
+            for bound, bucket_count in zip(self.buckets, bucket_counts):
+                labels = _format_labels(self.labelnames + ("le",), key + (bound,))
+                lines.append(f"{self.name}_bucket{labels} {bucket_count}")
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames + ('le',), key + ('+Inf',))} {count}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {total}")
+        return lines
+
+def register_gauge_callback(name: str, documentation: str, callback: Callable[[], Dict[Tuple, float]],
+                            labelnames: Tuple[str, ...] = ()):
+    """Gauge whose values are read from callback() -> {label values tuple: value} at scrape time"""
+    _gauge_callbacks.append((name, documentation, callback, tuple(labelnames)))
+
+def render_metrics() -> str:
+    lines = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    for name, documentation, callback, labelnames in _gauge_callbacks:
+        lines += [f"# HELP {name} {documentation}", f"# TYPE {name} gauge"]
+        try:
+            values = callback()
+        except Exception:
+            continue
+        for key, value in sorted(values.items()):
+            if value is not None:
+                lines.append(f"{name}{_format_labels(labelnames, key)} {value}")
+    return "\n".join(lines) + "\n"
+
+# --- Metrics recorded across the app ---
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds", "API request latency by route", ("method", "route", "status")
+)
+STANDINGS_CALCULATION_SECONDS = Histogram(
+    "standings_calculation_seconds", "Time spent computing standings from the database", ("engine",)
+)
+UPSTREAM_REQUEST_SECONDS = Histogram(
+    "nhl_upstream_request_seconds", "Latency of NHL API calls by endpoint", ("endpoint",)
+)
+UPSTREAM_REQUESTS = Counter(
+    "nhl_upstream_requests_total", "NHL API calls by endpoint", ("endpoint",)
+)
+UPSTREAM_ERRORS = Counter(
+    "nhl_upstream_errors_total", "Failed NHL API calls by endpoint", ("endpoint",)
+)
+DB_BULK_WRITE_SECONDS = Histogram(
+    "db_bulk_write_seconds", "Duration of bulk upsert batches by table", ("table",)
+)
+DB_BULK_ROWS = Counter(
+    "db_bulk_rows_total", "Rows passed through bulk upserts by table and outcome", ("table", "result")
+)
+SYNC_RUNS = Counter(
+    "sync_runs_total", "Game sync runs by season and fetch strategy", ("season", "strategy")
+)
+SYNC_ERRORS = Counter(
+    "sync_errors_total", "Errors swallowed during syncs by stage", ("stage",)
+)
+SYNC_LAST_RUN_GAMES = Gauge(
+    "sync_last_run_games", "Games written by the most recent sync of each season", ("season",)
+)
+SYNC_LAST_RUN_TIMESTAMP = Gauge(
+    "sync_last_run_timestamp_seconds", "Unix time the most recent sync of each season finished", ("season",)
+)
+
+class _InstrumentedAPI:
+    """Proxy for one nhlpy sub-API (schedule, standings, ...) that times every call"""
+
+    def __init__(self, api, prefix: str):
+        self._api = api
+        self._prefix = prefix
+
+    def __getattr__(self, name):
+        attr = getattr(self._api, name)
+        if not callable(attr):
+            return attr
+
+        endpoint = f"{self._prefix}.{name}"
+
+        def call(*args, **kwargs):
+            UPSTREAM_REQUESTS.inc(endpoint=endpoint)
+            with UPSTREAM_REQUEST_SECONDS.time(endpoint=endpoint):
+                try:
+                    return attr(*args, **kwargs)
+                except Exception:
+                    UPSTREAM_ERRORS.inc(endpoint=endpoint)
+                    raise
+        return call
+
+class InstrumentedClient:
+    """Wraps an NHLClient (or stand-in) so each upstream call is counted and timed"""
+
+    def __init__(self, client):
+        self._client = client
+
+    def __getattr__(self, name):
+        return _InstrumentedAPI(getattr(self._client, name), name)
+
+def instrument_client(client):
+    """Wrap a client once - already wrapped clients are returned as-is"""
+    return client if isinstance(client, InstrumentedClient) else InstrumentedClient(client)
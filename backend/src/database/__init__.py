@@ -1,16 +1,21 @@
+from sqlalchemy import text
 from .config import engine, Base
-from .models import Team, Game
+from .migrations import upgrade_database
+from .models import Team, Game, GameParticipant, TeamDailyCumulative, SyncGeneration, StandingsSnapshot, StandingsSnapshotDay, SyncCheckpoint, SyncLedgerDay
 
 def init_database():
-    """Initialize database tables"""
+    """Initialize database tables by applying every pending migration"""
     print("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
+    upgrade_database()
     print("Database tables created successfully!")
 
 def drop_all_tables():
     """Drop all tables (use with caution!)"""
     print("Dropping all tables...")
     Base.metadata.drop_all(bind=engine)
+    # Forget applied migrations too, so init_database() starts over
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE IF EXISTS alembic_version"))
     print("All tables dropped!")
 
 if __name__ == "__main__":
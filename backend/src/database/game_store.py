@@ -0,0 +1,161 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, select
+from typing import Dict, Optional, Tuple
+import threading
+import numpy as np
+from .models import Game, SyncGeneration
+from .team_directory import get_team_directory
+
+# Same rule as standings_queries (not imported from there: queries imports this module)
+COMPLETED_STATES = ['OFF', 'FINAL']
+
+# Per-team stat columns of the prefix-sum tensor, in order
+STATS = (
+    'gamesPlayed', 'wins', 'regulationWins', 'regulationPlusOtWins',
+    'losses', 'otLosses', 'points', 'goalFor', 'goalAgainst'
+)
+
+# Codes stored in SeasonGameStore.period
+REGULATION, OVERTIME, SHOOTOUT = 0, 1, 2
+PERIOD_CODES = {'OT': OVERTIME, 'SO': SHOOTOUT}
+
+class SeasonGameStore:
+    """
+    Columnar copy of one season's completed games between known teams,
+    sorted by date: dates, team indices (into `teams`), scores and
+    period codes (REGULATION/OVERTIME/SHOOTOUT) as NumPy arrays.
+    """
+
+    def __init__(self, season: str, teams: Tuple[str, ...], dates, home, away, home_score, away_score, period,
+                 version=None):
+        self.season = season
+        self.teams = teams
+        # Sync generations (season, teams) the store was loaded at
+        self.version = version
+        self.dates = dates
+        self.home = home
+        self.away = away
+        self.home_score = home_score
+        self.away_score = away_score
+        self.period = period
+        self._prefix = None
+
+    @classmethod
+    def from_db(cls, db: Session, season: str, version=None) -> "SeasonGameStore":
+        teams = tuple(get_team_directory(db).by_abbrev)
+        rows = db.execute(
+            select(
+                Game.game_date, Game.home_team_abbrev, Game.away_team_abbrev,
+                Game.home_score, Game.away_score, Game.period_type
+            ).where(and_(
+                Game.season == season,
+                Game.game_state.in_(COMPLETED_STATES),
+                Game.home_team_abbrev.in_(teams),
+                Game.away_team_abbrev.in_(teams)
+            )).order_by(Game.game_date)
+        ).all()
+
+        index = {abbrev: i for i, abbrev in enumerate(teams)}
+        return cls(
+            season, teams,
+            dates=np.array([row.game_date for row in rows], dtype='datetime64[D]'),
+            home=np.array([index[row.home_team_abbrev] for row in rows], dtype=np.int16),
+            away=np.array([index[row.away_team_abbrev] for row in rows], dtype=np.int16),
+            home_score=np.array([row.home_score for row in rows], dtype=np.int32),
+            away_score=np.array([row.away_score for row in rows], dtype=np.int32),
+            period=np.array([PERIOD_CODES.get(row.period_type, REGULATION) for row in rows], dtype=np.int8),
+            version=version
+        )
+
+    def prefix_sums(self, team_mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Cumulative per-team stats after each game: shape (games + 1, teams, STATS),
+        row 0 all zeros. With team_mask only games between masked teams count
+        (the filtered-standings rule); the unmasked tensor is computed once.
+        """
+        if team_mask is None and self._prefix is not None:
+            return self._prefix
+
+        games = np.ones(len(self.dates), dtype=bool)
+        if team_mask is not None:
+            games = team_mask[self.home] & team_mask[self.away]
+
+        rows = np.flatnonzero(games)
+        home, away = self.home[rows], self.away[rows]
+        home_won = self.home_score[rows] > self.away_score[rows]
+        period = self.period[rows]
+        overtime = period != REGULATION
+
+        # Per-game deltas; home and away always differ so plain fancy indexing is safe
+        deltas = np.zeros((len(self.dates), len(self.teams), len(STATS)), dtype=np.int32)
+        for team, goals_for, goals_against, won in (
+            (home, self.home_score[rows], self.away_score[rows], home_won),
+            (away, self.away_score[rows], self.home_score[rows], ~home_won)
+        ):
+            lost_ot = ~won & overtime
+            deltas[rows, team] = np.stack([
+                np.ones_like(goals_for),
+                won, won & ~overtime, won & (period != SHOOTOUT),
+                ~won & ~overtime, lost_ot,
+                2 * won + lost_ot,
+                goals_for, goals_against
+            ], axis=1)
+
+        prefix = np.zeros((len(self.dates) + 1, len(self.teams), len(STATS)), dtype=np.int32)
+        np.cumsum(deltas, axis=0, out=prefix[1:])
+        if team_mask is None:
+            self._prefix = prefix
+        return prefix
+
+    def range_totals(self, starts, ends, team_mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Per-team stats for many inclusive date ranges at once: shape
+        (ranges, teams, STATS). Each range is two binary searches into the
+        sorted dates and one subtraction of prefix-sum rows.
+        """
+        prefix = self.prefix_sums(team_mask)
+        lo = np.searchsorted(self.dates, np.asarray(starts, dtype='datetime64[D]'), side='left')
+        hi = np.searchsorted(self.dates, np.asarray(ends, dtype='datetime64[D]'), side='right')
+        return prefix[hi] - prefix[lo]
+
+    def head_to_head(self, start, end, team_mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """(teams, teams) matrix of points each team earned against each opponent in the range"""
+        lo = np.searchsorted(self.dates, np.datetime64(start, 'D'), side='left')
+        hi = np.searchsorted(self.dates, np.datetime64(end, 'D'), side='right')
+        home, away = self.home[lo:hi], self.away[lo:hi]
+        if team_mask is not None:
+            games = team_mask[home] & team_mask[away]
+            home, away = home[games], away[games]
+            home_won = (self.home_score[lo:hi] > self.away_score[lo:hi])[games]
+            overtime = (self.period[lo:hi] != REGULATION)[games]
+        else:
+            home_won = self.home_score[lo:hi] > self.away_score[lo:hi]
+            overtime = self.period[lo:hi] != REGULATION
+
+        winner = np.where(home_won, home, away)
+        loser = np.where(home_won, away, home)
+        matrix = np.zeros((len(self.teams), len(self.teams)), dtype=np.int32)
+        np.add.at(matrix, (winner, loser), 2)
+        np.add.at(matrix, (loser, winner), overtime.astype(np.int32))
+        return matrix
+
+_stores: Dict[str, SeasonGameStore] = {}
+_lock = threading.Lock()
+
+def get_season_store(db: Session, season: str) -> SeasonGameStore:
+    """
+    The season's columnar store, reloaded whenever the season's games or the
+    teams have been re-synced since it was built.
+    """
+    generations = dict(db.execute(
+        select(SyncGeneration.scope, SyncGeneration.generation)
+        .where(SyncGeneration.scope.in_([season, 'teams']))
+    ).all())
+    version = (generations.get(season, 0), generations.get('teams', 0))
+
+    store = _stores.get(season)
+    if store is None or store.version != version:
+        store = SeasonGameStore.from_db(db, season, version)
+        with _lock:
+            _stores[season] = store
+    return store
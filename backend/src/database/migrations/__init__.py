@@ -0,0 +1,22 @@
+"""
+Schema migrations (Alembic). Revisions live in versions/; the same chain
+runs from init_database() and from the command line:
+
+    cd backend && alembic upgrade head
+    cd backend && alembic revision --autogenerate -m "describe the change"
+"""
+
+import os
+from alembic import command
+from alembic.config import Config
+
+MIGRATIONS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def migration_config() -> Config:
+    config = Config()
+    config.set_main_option("script_location", MIGRATIONS_DIR)
+    return config
+
+def upgrade_database(revision: str = "head"):
+    """Apply every migration up to revision"""
+    command.upgrade(migration_config(), revision)
@@ -0,0 +1,49 @@
+"""
+Alembic environment. Runs against DATABASE_URL (src.database.config) on
+its own connection: migrations may build indexes for longer than the app's
+statement timeout allows, but never queue behind a lock for long.
+"""
+
+import os
+import re
+import sys
+from alembic import context
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from src.database.config import Base, DATABASE_URL
+from src.database.migrations.ops import MIGRATION_LOCK_TIMEOUT_MS
+from src.database import models  # noqa: F401 - registers every table on Base.metadata
+
+def include_object(obj, name, type_, reflected, compare_to):
+    # Season partitions of games (games_20242025) are created at runtime, not by migrations
+    if type_ == 'table' and reflected and re.fullmatch(r"games_\d+", name):
+        return False
+    # Indexes declared for another dialect only (Index.ddl_if)
+    ddl_if = getattr(obj, '_ddl_if', None) if type_ == 'index' and not reflected else None
+    return ddl_if is None or ddl_if.dialect in (None, context.get_context().dialect.name)
+
+def run_migrations_online():
+    connect_args = {}
+    if DATABASE_URL.startswith("postgresql"):
+        connect_args["options"] = f"-c statement_timeout=0 -c lock_timeout={MIGRATION_LOCK_TIMEOUT_MS}"
+    engine = create_engine(DATABASE_URL, poolclass=NullPool, connect_args=connect_args)
+
+    with engine.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=Base.metadata,
+            include_object=include_object,
+            # One transaction per revision, so a failure keeps the revisions before it
+            transaction_per_migration=True,
+            render_as_batch=connection.dialect.name == 'sqlite'
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+
+if context.is_offline_mode():
+    # Revisions look at what the database already has (tables created before migrations)
+    raise SystemExit("Offline (--sql) migrations aren't supported - revisions inspect the live database")
+run_migrations_online()
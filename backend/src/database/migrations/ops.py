@@ -0,0 +1,124 @@
+"""
+Helpers for migrations that must run against a live database: index
+builds that don't block writes and backfills committed in small batches.
+"""
+
+from typing import Iterable, Optional
+import os
+from alembic import op
+from sqlalchemy import text
+
+# Rows per backfill batch - each batch is its own short transaction
+MIGRATION_BATCH_SIZE = int(os.getenv("MIGRATION_BATCH_SIZE", "5000"))
+
+# Give up on a DDL lock instead of queueing every query behind it (0 = wait forever)
+MIGRATION_LOCK_TIMEOUT_MS = int(os.getenv("MIGRATION_LOCK_TIMEOUT_MS", "5000"))
+
+def has_table(name: str) -> bool:
+    return op.get_bind().dialect.has_table(op.get_bind(), name)
+
+def _index_valid(bind, name: str) -> Optional[bool]:
+    """None if the index doesn't exist, else whether PostgreSQL finished building it"""
+    return bind.execute(
+        text("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"), {'name': name}
+    ).scalar()
+
+def _partitions(bind, table: str) -> Optional[list]:
+    """Partition names of a partitioned table, None for a plain one"""
+    partitioned = bind.execute(
+        text("SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table))"),
+        {'table': table}
+    ).scalar()
+    if not partitioned:
+        return None
+    return bind.execute(
+        text("SELECT inhrelid::regclass::text FROM pg_inherits WHERE inhparent = to_regclass(:table) ORDER BY 1"),
+        {'table': table}
+    ).scalars().all()
+
+def _build_concurrently(bind, name: str, table: str, definition: str):
+    # A concurrent build waits out running transactions without blocking anyone - let it
+    op.execute("SET lock_timeout = 0")
+    if _index_valid(bind, name) is False:
+        # Left behind by an interrupted build - it is maintained but never used
+        op.execute(f"DROP INDEX CONCURRENTLY {name}")
+    op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} {definition}")
+    op.execute(f"SET lock_timeout = {MIGRATION_LOCK_TIMEOUT_MS}")
+
+def create_index_online(
+    name: str,
+    table: str,
+    columns: Iterable[str],
+    include: Iterable[str] = (),
+    where: Optional[str] = None
+):
+    """
+    Add an index without blocking writes. PostgreSQL builds it CONCURRENTLY;
+    a partitioned table (which can't be indexed concurrently) gets the index
+    on the parent only, then built concurrently on each partition and
+    attached - partitions created later inherit it. Other databases build
+    it normally. Safe to re-run after a failure.
+    """
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        op.create_index(name, table, list(columns), if_not_exists=True, sqlite_where=text(where) if where else None)
+        return
+
+    definition = f"({', '.join(columns)})"
+    if include:
+        definition += f" INCLUDE ({', '.join(include)})"
+    if where:
+        definition += f" WHERE {where}"
+
+    with op.get_context().autocommit_block():
+        partitions = _partitions(bind, table)
+        if partitions is None:
+            _build_concurrently(bind, name, table, definition)
+            return
+        if _index_valid(bind, name):
+            return
+
+        # Invalid (so unused) until every partition's index is attached
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON ONLY {table} {definition}")
+        attached = set(bind.execute(
+            text("SELECT inhrelid::regclass::text FROM pg_inherits WHERE inhparent = to_regclass(:name)"),
+            {'name': name}
+        ).scalars())
+        for partition in partitions:
+            partition_index = f"{partition}_{name}"[:63]
+            if partition_index in attached:
+                continue
+            _build_concurrently(bind, partition_index, partition, definition)
+            op.execute(f"ALTER INDEX {name} ATTACH PARTITION {partition_index}")
+
+def backfill_in_batches(
+    statement: str,
+    table: str,
+    key: str = 'id',
+    batch_size: int = MIGRATION_BATCH_SIZE
+) -> int:
+    """
+    Run statement once per batch_size rows of table in key order (an
+    integer column), binding :low (exclusive) and :high (inclusive) bounds. Each batch commits on
+    its own, so no lock is held for longer than one batch. Returns the
+    number of batches.
+    """
+    bind = op.get_bind()
+    next_bound = text(
+        f"SELECT {key} FROM {table} WHERE {key} > :low ORDER BY {key} LIMIT 1 OFFSET {batch_size - 1}"
+    )
+    low = bind.execute(text(f"SELECT MIN({key}) FROM {table}")).scalar()
+    last = bind.execute(text(f"SELECT MAX({key}) FROM {table}")).scalar()
+    if low is None:
+        return 0
+
+    batches = 0
+    with op.get_context().autocommit_block():
+        low = low - 1
+        while low < last:
+            high = bind.execute(next_bound, {'low': low}).scalar()
+            high = last if high is None else high
+            bind.execute(text(statement), {'low': low, 'high': high})
+            batches += 1
+            low = high
+    return batches
@@ -0,0 +1,136 @@
+"""
+Key games by (id, season), LIST-partitioned by season on PostgreSQL
+
+Brings a games table created before migrations existed to the current
+layout. PostgreSQL: rows are copied into a new partitioned table in
+batches while the old one keeps serving, then the tables are swapped in
+one short transaction (writes wait for it, reads don't). SQLite: the
+table is rebuilt - it can't change a primary key in place, and with id a
+rowid alias a unique index can't serve ON CONFLICT (id, season) either.
+game_participants referenced games by id alone; it is derived data, so
+it is dropped along with the old table, recreated by 0002 and backfilled
+by 0004.
+
+Revision ID: 0001_season_keyed_games
+Revises:
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from src.database.migrations.ops import backfill_in_batches, has_table
+
+revision = '0001_season_keyed_games'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+GAME_COLUMNS = (
+    'id, game_date, season, game_type, game_state, home_team_abbrev, away_team_abbrev, '
+    'home_score, away_score, period_type'
+)
+
+# Secondary indexes of games as created by create_all before migrations
+GAME_INDEXES = {
+    'ix_games_game_date': '(game_date)',
+    'ix_games_season': '(season)',
+    'idx_game_date_season': '(game_date, season)',
+    'idx_season_teams': '(season, home_team_abbrev, away_team_abbrev)'
+}
+
+def create_games_table(name: str, **kwargs):
+    op.create_table(
+        name,
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('game_date', sa.Date(), nullable=False),
+        sa.Column('season', sa.String(length=10), nullable=False),
+        sa.Column('game_type', sa.Integer(), nullable=False),
+        sa.Column('game_state', sa.String(length=20), nullable=False),
+        sa.Column('home_team_abbrev', sa.String(length=5), nullable=False),
+        sa.Column('away_team_abbrev', sa.String(length=5), nullable=False),
+        sa.Column('home_score', sa.Integer(), nullable=True),
+        sa.Column('away_score', sa.Integer(), nullable=True),
+        sa.Column('period_type', sa.String(length=10), nullable=True),
+        sa.ForeignKeyConstraint(['home_team_abbrev'], ['teams.abbrev']),
+        sa.ForeignKeyConstraint(['away_team_abbrev'], ['teams.abbrev']),
+        sa.PrimaryKeyConstraint('id', 'season', name=f'{name}_pkey'),
+        **kwargs
+    )
+
+def _drop_game_participants():
+    if has_table('game_participants'):
+        op.drop_table('game_participants')
+
+def _is_partitioned(bind) -> bool:
+    return bind.execute(sa.text(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass('games'))"
+    )).scalar()
+
+def _partition_games(bind):
+    # Left over from an attempt that failed before the swap
+    op.execute("DROP TABLE IF EXISTS games_partitioned")
+    create_games_table('games_partitioned', postgresql_partition_by='LIST (season)')
+    for season in bind.execute(sa.text("SELECT DISTINCT season FROM games")).scalars():
+        if not season.isdigit():
+            raise ValueError(f"Invalid season '{season}'")
+        op.execute(f"CREATE TABLE games_{season} PARTITION OF games_partitioned FOR VALUES IN ('{season}')")
+
+    # The old table keeps taking reads and writes meanwhile
+    backfill_in_batches(
+        f"INSERT INTO games_partitioned ({GAME_COLUMNS}) SELECT {GAME_COLUMNS} FROM games "
+        "WHERE id > :low AND id <= :high ON CONFLICT DO NOTHING",
+        table='games'
+    )
+    # Nothing reads the new table yet, so building its indexes blocks nobody
+    for index, columns in GAME_INDEXES.items():
+        op.execute(f"CREATE INDEX {index}_partitioned ON games_partitioned {columns}")
+
+    # Swap: block writes, take over what the sync wrote during the copy, rename
+    op.execute("LOCK TABLE games IN EXCLUSIVE MODE")
+    newest = bind.execute(sa.text("SELECT MAX(season) FROM games")).scalar()
+    updates = ', '.join(
+        f"{column} = excluded.{column}" for column in GAME_COLUMNS.split(', ') if column not in ('id', 'season')
+    )
+    op.execute(
+        f"INSERT INTO games_partitioned ({GAME_COLUMNS}) SELECT {GAME_COLUMNS} FROM games "
+        f"WHERE season = '{newest}' ON CONFLICT (id, season) DO UPDATE SET {updates}"
+    )
+    op.execute(
+        f"INSERT INTO games_partitioned ({GAME_COLUMNS}) SELECT {GAME_COLUMNS} FROM games "
+        "ON CONFLICT DO NOTHING"
+    )
+    _drop_game_participants()
+    op.execute("DROP TABLE games")
+    op.execute("ALTER TABLE games_partitioned RENAME TO games")
+    op.execute("ALTER TABLE games RENAME CONSTRAINT games_partitioned_pkey TO games_pkey")
+    for index in GAME_INDEXES:
+        op.execute(f"ALTER INDEX {index}_partitioned RENAME TO {index}")
+
+def _rebuild_games(bind):
+    create_games_table('games_rebuilt')
+    op.execute(f"INSERT INTO games_rebuilt ({GAME_COLUMNS}) SELECT {GAME_COLUMNS} FROM games")
+    _drop_game_participants()
+    op.execute("DROP TABLE games")
+    op.execute("ALTER TABLE games_rebuilt RENAME TO games")
+    for index, columns in GAME_INDEXES.items():
+        op.execute(f"CREATE INDEX {index} ON games {columns}")
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if not inspector.has_table('games'):
+        return
+
+    if bind.dialect.name == 'postgresql':
+        if _is_partitioned(bind):
+            return
+        convert = _partition_games
+    elif inspector.get_pk_constraint('games')['constrained_columns'] == ['id']:
+        convert = _rebuild_games
+    else:
+        return
+    convert(bind)
+
+def downgrade():
+    # The old layout can't hold the same game ID in two seasons - nothing to go back to
+    pass
@@ -0,0 +1,152 @@
+"""
+Create the tables a database doesn't have yet
+
+Baseline of the schema: a new database gets every table here, one set up
+by create_all before migrations existed gets whichever tables were added
+since. Existing tables are left alone. The covering indexes come in 0003
+so they can be built online on tables that already hold data.
+
+Revision ID: 0002_create_missing_tables
+Revises: 0001_season_keyed_games
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from src.database.migrations.ops import has_table
+
+revision = '0002_create_missing_tables'
+down_revision = '0001_season_keyed_games'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    if not has_table('teams'):
+        op.create_table(
+            'teams',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('abbrev', sa.String(length=5), nullable=False),
+            sa.Column('name', sa.String(length=100), nullable=False),
+            sa.Column('franchise_id', sa.Integer(), nullable=True),
+            sa.Column('division', sa.String(length=50), nullable=True),
+            sa.Column('conference', sa.String(length=50), nullable=True),
+            sa.Column('metadata_json', sa.JSON(), nullable=True),
+            sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_teams_abbrev', 'teams', ['abbrev'], unique=True)
+        op.create_index('ix_teams_franchise_id', 'teams', ['franchise_id'])
+        op.create_index('ix_teams_id', 'teams', ['id'])
+
+    if not has_table('games'):
+        # PostgreSQL: one partition per season, created on first write (see partitioning.py)
+        op.create_table(
+            'games',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('game_date', sa.Date(), nullable=False),
+            sa.Column('season', sa.String(length=10), nullable=False),
+            sa.Column('game_type', sa.Integer(), nullable=False),
+            sa.Column('game_state', sa.String(length=20), nullable=False),
+            sa.Column('home_team_abbrev', sa.String(length=5), nullable=False),
+            sa.Column('away_team_abbrev', sa.String(length=5), nullable=False),
+            sa.Column('home_score', sa.Integer(), nullable=True),
+            sa.Column('away_score', sa.Integer(), nullable=True),
+            sa.Column('period_type', sa.String(length=10), nullable=True),
+            sa.ForeignKeyConstraint(['home_team_abbrev'], ['teams.abbrev']),
+            sa.ForeignKeyConstraint(['away_team_abbrev'], ['teams.abbrev']),
+            sa.PrimaryKeyConstraint('id', 'season'),
+            postgresql_partition_by='LIST (season)'
+        )
+        op.create_index('ix_games_game_date', 'games', ['game_date'])
+        op.create_index('ix_games_season', 'games', ['season'])
+        op.create_index('idx_game_date_season', 'games', ['game_date', 'season'])
+        op.create_index('idx_season_teams', 'games', ['season', 'home_team_abbrev', 'away_team_abbrev'])
+
+    if not has_table('game_participants'):
+        op.create_table(
+            'game_participants',
+            sa.Column('team_abbrev', sa.String(length=5), nullable=False),
+            sa.Column('game_date', sa.Date(), nullable=False),
+            sa.Column('game_id', sa.Integer(), nullable=False),
+            sa.Column('season', sa.String(length=10), nullable=False),
+            sa.Column('game_type', sa.Integer(), nullable=False),
+            sa.Column('game_state', sa.String(length=20), nullable=False),
+            sa.Column('opponent_abbrev', sa.String(length=5), nullable=False),
+            sa.Column('is_home', sa.Boolean(), nullable=False),
+            sa.Column('goals_for', sa.Integer(), nullable=True),
+            sa.Column('goals_against', sa.Integer(), nullable=True),
+            sa.Column('period_type', sa.String(length=10), nullable=True),
+            sa.ForeignKeyConstraint(['game_id', 'season'], ['games.id', 'games.season']),
+            sa.ForeignKeyConstraint(['team_abbrev'], ['teams.abbrev']),
+            sa.ForeignKeyConstraint(['opponent_abbrev'], ['teams.abbrev']),
+            sa.PrimaryKeyConstraint('team_abbrev', 'game_date', 'game_id'),
+            sqlite_with_rowid=False
+        )
+        op.create_index('idx_participant_team_season', 'game_participants', ['team_abbrev', 'season', 'opponent_abbrev'])
+        op.create_index('idx_participant_game', 'game_participants', ['game_id'])
+
+    if not has_table('team_daily_cumulative'):
+        op.create_table(
+            'team_daily_cumulative',
+            sa.Column('season', sa.String(length=10), nullable=False),
+            sa.Column('team_abbrev', sa.String(length=5), nullable=False),
+            sa.Column('game_date', sa.Date(), nullable=False),
+            sa.Column('games_played', sa.Integer(), nullable=False),
+            sa.Column('wins', sa.Integer(), nullable=False),
+            sa.Column('regulation_wins', sa.Integer(), nullable=False),
+            sa.Column('regulation_plus_ot_wins', sa.Integer(), nullable=False),
+            sa.Column('losses', sa.Integer(), nullable=False),
+            sa.Column('ot_losses', sa.Integer(), nullable=False),
+            sa.Column('goals_for', sa.Integer(), nullable=False),
+            sa.Column('goals_against', sa.Integer(), nullable=False),
+            sa.Column('points', sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(['team_abbrev'], ['teams.abbrev']),
+            sa.PrimaryKeyConstraint('season', 'team_abbrev', 'game_date')
+        )
+
+    if not has_table('sync_generations'):
+        op.create_table(
+            'sync_generations',
+            sa.Column('scope', sa.String(length=20), nullable=False),
+            sa.Column('generation', sa.Integer(), nullable=False),
+            sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+            sa.PrimaryKeyConstraint('scope')
+        )
+
+    if not has_table('standings_snapshots'):
+        op.create_table(
+            'standings_snapshots',
+            sa.Column('season', sa.String(length=10), nullable=False),
+            sa.Column('team_abbrev', sa.String(length=5), nullable=False),
+            sa.Column('as_of_date', sa.Date(), nullable=False),
+            sa.Column('payload', sa.JSON(), nullable=False),
+            sa.PrimaryKeyConstraint('season', 'team_abbrev', 'as_of_date')
+        )
+
+    if not has_table('sync_checkpoints'):
+        op.create_table(
+            'sync_checkpoints',
+            sa.Column('season', sa.String(length=10), nullable=False),
+            sa.Column('chunk_start', sa.Date(), nullable=False),
+            sa.Column('chunk_end', sa.Date(), nullable=False),
+            sa.Column('games_synced', sa.Integer(), nullable=False),
+            sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+            sa.PrimaryKeyConstraint('season', 'chunk_start')
+        )
+
+    if not has_table('sync_ledger'):
+        op.create_table(
+            'sync_ledger',
+            sa.Column('season', sa.String(length=10), nullable=False),
+            sa.Column('schedule_date', sa.Date(), nullable=False),
+            sa.Column('is_final', sa.Boolean(), nullable=False),
+            sa.Column('pending_game_ids', sa.JSON(), nullable=False),
+            sa.Column('checked_at', sa.DateTime(timezone=True), nullable=True),
+            sa.PrimaryKeyConstraint('season', 'schedule_date')
+        )
+
+def downgrade():
+    for table in (
+        'sync_ledger', 'sync_checkpoints', 'standings_snapshots', 'sync_generations',
+        'team_daily_cumulative', 'game_participants', 'games', 'teams'
+    ):
+        op.drop_table(table)
@@ -0,0 +1,50 @@
+"""
+Covering indexes for the standings and matchup queries, built online
+
+PostgreSQL: a partial index over completed games carrying every column
+the standings engines read, and a covering index on game_participants
+for matchups - both built CONCURRENTLY (per partition for games), so the
+API keeps serving and syncing while they build. SQLite binds the state
+list as parameters, which rules out a partial index - it gets a plain
+index over all of those columns instead.
+
+Revision ID: 0003_covering_indexes
+Revises: 0002_create_missing_tables
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+from src.database.migrations.ops import create_index_online
+
+revision = '0003_covering_indexes'
+down_revision = '0002_create_missing_tables'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        create_index_online(
+            'idx_games_completed_covering', 'games', ['season', 'game_date'],
+            include=['home_team_abbrev', 'away_team_abbrev', 'home_score', 'away_score', 'period_type'],
+            where="game_state IN ('OFF', 'FINAL')"
+        )
+        create_index_online(
+            'idx_participant_team_date_covering', 'game_participants', ['team_abbrev', 'game_date'],
+            include=[
+                'game_id', 'season', 'game_type', 'game_state', 'opponent_abbrev',
+                'is_home', 'goals_for', 'goals_against', 'period_type'
+            ]
+        )
+    else:
+        create_index_online(
+            'idx_games_range_covering', 'games',
+            ['season', 'game_date', 'game_state', 'home_team_abbrev', 'away_team_abbrev',
+             'home_score', 'away_score', 'period_type']
+        )
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('idx_participant_team_date_covering', 'game_participants')
+        op.drop_index('idx_games_completed_covering', 'games')
+    else:
+        op.drop_index('idx_games_range_covering', 'games')
@@ -0,0 +1,48 @@
+"""
+Backfill game_participants from games
+
+Fills the per-team view of games when the table is empty (just created
+by 0002) and games is not, a batch of games at a time, so the sync can
+keep writing while it runs. Rows the sync writes meanwhile are kept.
+
+Revision ID: 0004_backfill_game_participants
+Revises: 0003_covering_indexes
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from src.database.migrations.ops import backfill_in_batches
+
+revision = '0004_backfill_game_participants'
+down_revision = '0003_covering_indexes'
+branch_labels = None
+depends_on = None
+
+PARTICIPANT_COLUMNS = (
+    'team_abbrev, game_date, game_id, season, game_type, game_state, '
+    'opponent_abbrev, is_home, goals_for, goals_against, period_type'
+)
+
+def perspective(team: str, opponent: str, is_home: str, goals_for: str, goals_against: str) -> str:
+    return (
+        f"INSERT INTO game_participants ({PARTICIPANT_COLUMNS}) "
+        f"SELECT {team}, game_date, id, season, game_type, game_state, "
+        f"{opponent}, {is_home}, {goals_for}, {goals_against}, period_type FROM games "
+        "WHERE id > :low AND id <= :high ON CONFLICT DO NOTHING"
+    )
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.execute(sa.text("SELECT 1 FROM game_participants LIMIT 1")).first():
+        return
+
+    backfill_in_batches(
+        perspective('home_team_abbrev', 'away_team_abbrev', 'TRUE', 'home_score', 'away_score'), table='games'
+    )
+    backfill_in_batches(
+        perspective('away_team_abbrev', 'home_team_abbrev', 'FALSE', 'away_score', 'home_score'), table='games'
+    )
+
+def downgrade():
+    pass
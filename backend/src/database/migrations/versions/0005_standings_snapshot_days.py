@@ -0,0 +1,41 @@
+"""
+Record which dates have standings snapshots
+
+Snapshot rows are only written where a team's row changed, so the dates
+themselves weren't recorded and a date that was never captured looked
+like one where nothing changed. Dates that already have a snapshot row
+are marked captured; captured dates where nothing changed at all can't
+be told apart and are captured again on demand.
+
+Revision ID: 0005_standings_snapshot_days
+Revises: 0004_backfill_game_participants
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from src.database.migrations.ops import has_table
+
+revision = '0005_standings_snapshot_days'
+down_revision = '0004_backfill_game_participants'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    if has_table('standings_snapshot_days'):
+        return
+
+    op.create_table(
+        'standings_snapshot_days',
+        sa.Column('season', sa.String(length=10), nullable=False),
+        sa.Column('as_of_date', sa.Date(), nullable=False),
+        sa.Column('captured_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('season', 'as_of_date')
+    )
+    op.execute(
+        "INSERT INTO standings_snapshot_days (season, as_of_date) "
+        "SELECT DISTINCT season, as_of_date FROM standings_snapshots"
+    )
+
+def downgrade():
+    op.drop_table('standings_snapshot_days')
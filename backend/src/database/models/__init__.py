@@ -1,4 +1,14 @@
 from .team import Team
 from .game import Game
+from .game_participant import GameParticipant
+from .team_daily_cumulative import TeamDailyCumulative
+from .sync_generation import SyncGeneration
+from .standings_snapshot import StandingsSnapshot
+from .standings_snapshot_day import StandingsSnapshotDay
+from .sync_checkpoint import SyncCheckpoint
+from .sync_ledger import SyncLedgerDay
 
-__all__ = ['Team', 'Game']
\ No newline at end of file
+__all__ = [
+    'Team', 'Game', 'GameParticipant', 'TeamDailyCumulative', 'SyncGeneration',
+    'StandingsSnapshot', 'StandingsSnapshotDay', 'SyncCheckpoint', 'SyncLedgerDay'
+]
\ No newline at end of file
@@ -1,14 +1,18 @@
-from sqlalchemy import Column, Integer, String, Date, Boolean, ForeignKey, Index
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from ..config import Base
-from datetime import date
 
 class Game(Base):
+    """
+    On PostgreSQL the table is LIST-partitioned by season (one partition per
+    season, created on first write - see partitioning.py), so the season is
+    part of the primary key.
+    """
     __tablename__ = "games"
 
     id = Column(Integer, primary_key=True)  # NHL game ID
     game_date = Column(Date, nullable=False, index=True)
-    season = Column(String(10), nullable=False, index=True)
+    season = Column(String(10), primary_key=True, index=True)
     game_type = Column(Integer, nullable=False)  # 2 = regular season, 3 = playoffs
     game_state = Column(String(20), nullable=False)
     
@@ -28,6 +32,20 @@ class Game(Base):
     __table_args__ = (
         Index('idx_game_date_season', 'game_date', 'season'),
         Index('idx_season_teams', 'season', 'home_team_abbrev', 'away_team_abbrev'),
+        # Every standings engine reads (date, teams, scores, period) of completed games in a
+        # season's date range - these indexes answer that without touching the table.
+        # PostgreSQL: partial index over completed games carrying the result columns
+        Index(
+            'idx_games_completed_covering', 'season', 'game_date',
+            postgresql_include=['home_team_abbrev', 'away_team_abbrev', 'home_score', 'away_score', 'period_type'],
+            postgresql_where=game_state.in_(['OFF', 'FINAL'])
+        ).ddl_if(dialect='postgresql'),
+        # SQLite binds the state list as parameters, which rules out partial indexes - cover it all
+        Index(
+            'idx_games_range_covering', 'season', 'game_date', 'game_state',
+            'home_team_abbrev', 'away_team_abbrev', 'home_score', 'away_score', 'period_type'
+        ).ddl_if(dialect='sqlite'),
+        {'postgresql_partition_by': 'LIST (season)'}
     )
     
     def to_dict(self):
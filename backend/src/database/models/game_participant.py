@@ -0,0 +1,55 @@
+from sqlalchemy import Column, Integer, String, Date, Boolean, ForeignKey, ForeignKeyConstraint, Index
+from ..config import Base
+
+class GameParticipant(Base):
+    """
+    One row per team per game - the games table seen from each side.
+    Keyed (team, date), so "every game team X played" is a range scan no
+    matter whether X was home or away. Derived from the games table -
+    rebuilt by the sync, never edited by hand.
+    """
+    __tablename__ = "game_participants"
+
+    team_abbrev = Column(String(5), ForeignKey('teams.abbrev'), primary_key=True)
+    game_date = Column(Date, primary_key=True)
+    game_id = Column(Integer, primary_key=True)
+
+    season = Column(String(10), nullable=False)
+    game_type = Column(Integer, nullable=False)  # 2 = regular season, 3 = playoffs
+    game_state = Column(String(20), nullable=False)
+    opponent_abbrev = Column(String(5), ForeignKey('teams.abbrev'), nullable=False)
+    is_home = Column(Boolean, nullable=False)
+    goals_for = Column(Integer)
+    goals_against = Column(Integer)
+    period_type = Column(String(10))  # REG, OT, SO
+
+    __table_args__ = (
+        # games is keyed (id, season) - partitioned by season on PostgreSQL
+        ForeignKeyConstraint(['game_id', 'season'], ['games.id', 'games.season']),
+        Index('idx_participant_team_season', 'team_abbrev', 'season', 'opponent_abbrev'),
+        Index('idx_participant_game', 'game_id'),
+        # PostgreSQL: carry every column a matchup reads so lookups are index-only scans
+        Index(
+            'idx_participant_team_date_covering', 'team_abbrev', 'game_date',
+            postgresql_include=[
+                'game_id', 'season', 'game_type', 'game_state', 'opponent_abbrev',
+                'is_home', 'goals_for', 'goals_against', 'period_type'
+            ]
+        ).ddl_if(dialect='postgresql'),
+        # SQLite: store the table itself in (team, date, game) order - it is the index
+        {'sqlite_with_rowid': False}
+    )
+
+    def to_dict(self):
+        return {
+            "game_id": self.game_id,
+            "game_date": self.game_date.isoformat() if self.game_date else None,
+            "season": self.season,
+            "team_abbrev": self.team_abbrev,
+            "opponent_abbrev": self.opponent_abbrev,
+            "is_home": self.is_home,
+            "goals_for": self.goals_for,
+            "goals_against": self.goals_against,
+            "period_type": self.period_type,
+            "game_state": self.game_state
+        }
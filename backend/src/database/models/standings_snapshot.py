@@ -0,0 +1,18 @@
+from sqlalchemy import Column, String, Date, JSON
+from ..config import Base
+
+class StandingsSnapshot(Base):
+    """
+    A team's row of the official league standings feed as of a date.
+    Only stored when it differs from the team's previous snapshot, so the
+    standings on any captured date (StandingsSnapshotDay) are each team's
+    latest row on or before it.
+    """
+    __tablename__ = "standings_snapshots"
+
+    season = Column(String(10), primary_key=True)
+    team_abbrev = Column(String(5), primary_key=True)
+    as_of_date = Column(Date, primary_key=True)
+
+    # Feed row as returned by league_standings, minus per-day fields
+    payload = Column(JSON, nullable=False)
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, String, Date, DateTime
+from ..config import Base
+
+class StandingsSnapshotDay(Base):
+    """
+    A date whose official standings were captured into standings_snapshots.
+    Snapshot rows only exist where something changed, so this is what tells
+    a captured date with no changes apart from a date never captured.
+    """
+    __tablename__ = "standings_snapshot_days"
+
+    season = Column(String(10), primary_key=True)
+    as_of_date = Column(Date, primary_key=True)
+    captured_at = Column(DateTime(timezone=True))
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, String, Date, DateTime
+from ..config import Base
+
+class SyncCheckpoint(Base):
+    """
+    A date chunk of a season that a backfill finished syncing.
+    Interrupted backfills skip chunks recorded here when re-run.
+    """
+    __tablename__ = "sync_checkpoints"
+
+    season = Column(String(10), primary_key=True)
+    chunk_start = Column(Date, primary_key=True)
+    chunk_end = Column(Date, nullable=False)
+    games_synced = Column(Integer, nullable=False, default=0)
+    completed_at = Column(DateTime(timezone=True))
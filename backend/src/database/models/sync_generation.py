@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from ..config import Base
+
+class SyncGeneration(Base):
+    """
+    Data version counters bumped by DatabaseSyncService whenever a sync
+    changes stored data. Scope is a season ('20242025') or 'teams'.
+    Used for ETags and to spot writes made by other processes.
+    """
+    __tablename__ = "sync_generations"
+
+    scope = Column(String(20), primary_key=True)
+    generation = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True))
@@ -0,0 +1,16 @@
+from sqlalchemy import Column, String, Date, DateTime, Boolean, JSON
+from ..config import Base
+
+class SyncLedgerDay(Base):
+    """
+    Sync state of one schedule date of a season. A date is final once every
+    game on it is over (or postponed/cancelled); until then the IDs of its
+    unfinished games are kept so catch-up syncs know to fetch it again.
+    """
+    __tablename__ = "sync_ledger"
+
+    season = Column(String(10), primary_key=True)
+    schedule_date = Column(Date, primary_key=True)
+    is_final = Column(Boolean, nullable=False, default=False)
+    pending_game_ids = Column(JSON, nullable=False, default=list)
+    checked_at = Column(DateTime(timezone=True))
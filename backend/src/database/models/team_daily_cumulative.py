@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, String, Date, ForeignKey
+from ..config import Base
+
+class TeamDailyCumulative(Base):
+    """
+    Running season totals for a team as of the end of each date it played.
+    Standings for any range are cumulative(end) - cumulative(start - 1).
+    Derived from the games table - rebuilt by the sync, never edited by hand.
+    """
+    __tablename__ = "team_daily_cumulative"
+
+    season = Column(String(10), primary_key=True)
+    team_abbrev = Column(String(5), ForeignKey('teams.abbrev'), primary_key=True)
+    game_date = Column(Date, primary_key=True)
+    
+    games_played = Column(Integer, nullable=False, default=0)
+    wins = Column(Integer, nullable=False, default=0)
+    regulation_wins = Column(Integer, nullable=False, default=0)
+    regulation_plus_ot_wins = Column(Integer, nullable=False, default=0)
+    losses = Column(Integer, nullable=False, default=0)
+    ot_losses = Column(Integer, nullable=False, default=0)
+    goals_for = Column(Integer, nullable=False, default=0)
+    goals_against = Column(Integer, nullable=False, default=0)
+    points = Column(Integer, nullable=False, default=0)
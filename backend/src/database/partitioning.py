@@ -0,0 +1,42 @@
+"""
+Season partitions of the games table. On PostgreSQL games is LIST
+partitioned by season, one partition per season, created on first write;
+on other databases these helpers are no-ops. Existing tables are
+converted by migration 0001_season_keyed_games.
+"""
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+import threading
+
+_known_partitions = set()
+_lock = threading.Lock()
+
+def partition_name(season: str) -> str:
+    """Table name of a season's games partition"""
+    if not season.isdigit():
+        raise ValueError(f"Invalid season '{season}'")
+    return f"games_{season}"
+
+def _create_partition(conn, season: str):
+    conn.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {partition_name(season)} PARTITION OF games FOR VALUES IN ('{season}')"
+    ))
+
+def ensure_season_partition(db: Session, season: str):
+    """Create the season's games partition if it doesn't exist yet (PostgreSQL only)"""
+    if season in _known_partitions or db.get_bind().dialect.name != 'postgresql':
+        return
+
+    with _lock:
+        exists = lambda: db.execute(text("SELECT to_regclass(:name)"), {'name': partition_name(season)}).scalar()
+        if exists() is None:
+            try:
+                _create_partition(db, season)
+                db.commit()
+            except Exception:
+                # Another process may have created it first
+                db.rollback()
+                if exists() is None:
+                    raise
+        _known_partitions.add(season)
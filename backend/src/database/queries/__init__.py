@@ -8,12 +8,71 @@ from .team_queries import (
 from .game_queries import (
     get_games_by_date_range,
     get_game_by_id,
+    get_games_by_ids,
     upsert_game,
     bulk_upsert_games,
     calculate_standings_from_db,
+    calculate_standings,
     get_latest_game_date
 )
 
+from .standings_queries import calculate_standings_sql, calculate_standings_batch
+
+from .cumulative_queries import (
+    calculate_standings_cumulative,
+    has_team_daily_cumulative,
+    refresh_team_daily_cumulative
+)
+
+from .timeline_queries import calculate_standings_timeline
+
+from .vectorized_queries import (
+    calculate_standings_ranges,
+    calculate_standings_vectorized
+)
+
+from .participant_queries import (
+    has_game_participants,
+    refresh_game_participants,
+    get_matchup
+)
+
+from .export_queries import (
+    GAME_EXPORT_COLUMNS,
+    STANDINGS_EXPORT_COLUMNS,
+    iter_games_export,
+    iter_standings_export,
+    get_game_seasons
+)
+
+from .snapshot_queries import (
+    store_standings_snapshot,
+    get_standings_snapshot
+)
+
+from .checkpoint_queries import (
+    get_completed_chunks,
+    mark_chunk_complete,
+    clear_checkpoints
+)
+
+from .ledger_queries import (
+    season_first_day,
+    season_last_day,
+    record_sync_ledger,
+    get_ledger_end,
+    get_unfinished_dates,
+    get_pending_game_ids,
+    get_unfinished_days,
+    ledger_covers
+)
+
+from .sync_queries import (
+    TEAMS_SCOPE,
+    get_sync_generation,
+    bump_sync_generation
+)
+
 __all__ = [
     'get_all_teams',
     'get_team_by_abbrev',
@@ -21,8 +80,42 @@ __all__ = [
     'bulk_upsert_teams',
     'get_games_by_date_range',
     'get_game_by_id',
+    'get_games_by_ids',
     'upsert_game',
     'bulk_upsert_games',
     'calculate_standings_from_db',
+    'calculate_standings',
+    'calculate_standings_sql',
+    'calculate_standings_batch',
+    'calculate_standings_cumulative',
+    'has_team_daily_cumulative',
+    'refresh_team_daily_cumulative',
+    'calculate_standings_timeline',
+    'calculate_standings_ranges',
+    'calculate_standings_vectorized',
+    'has_game_participants',
+    'refresh_game_participants',
+    'get_matchup',
+    'GAME_EXPORT_COLUMNS',
+    'STANDINGS_EXPORT_COLUMNS',
+    'iter_games_export',
+    'iter_standings_export',
+    'get_game_seasons',
+    'store_standings_snapshot',
+    'get_standings_snapshot',
+    'get_completed_chunks',
+    'mark_chunk_complete',
+    'clear_checkpoints',
+    'season_first_day',
+    'season_last_day',
+    'record_sync_ledger',
+    'get_ledger_end',
+    'get_unfinished_dates',
+    'get_pending_game_ids',
+    'get_unfinished_days',
+    'ledger_covers',
+    'TEAMS_SCOPE',
+    'get_sync_generation',
+    'bump_sync_generation',
     'get_latest_game_date'
 ]
\ No newline at end of file
@@ -0,0 +1,86 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import JSON, String, cast, literal_column, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
+from typing import Dict, List, Optional
+from ...core.metrics import DB_BULK_ROWS, DB_BULK_WRITE_SECONDS
+
+# Rows per INSERT statement. Keeps us well under the bind-parameter limits of
+# both PostgreSQL (65535) and SQLite (32766) for the widest model we write.
+BATCH_SIZE = 500
+
+def _comparable(column):
+    """JSON has no equality operator in PostgreSQL, so compare its text form"""
+    if isinstance(column.type, JSON):
+        return cast(column, String)
+    return column
+
+def bulk_upsert(db: Session, model, rows: List[dict], key: str, conflict_columns: Optional[List[str]] = None) -> Dict:
+    """
+    Insert or update rows with one INSERT ... ON CONFLICT DO UPDATE per batch.
+
+    Existing rows are only rewritten when at least one value differs, so
+    re-syncing unchanged data costs no writes. Everything runs in a single
+    transaction. Returns inserted/updated/unchanged counts plus the keys of
+    every row that was inserted or updated.
+
+    conflict_columns names the unique constraint to upsert on when it is
+    wider than key (e.g. a partition column in the primary key); key must
+    still identify a row on its own.
+    """
+    result = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'changed': []}
+
+    # ON CONFLICT cannot touch the same row twice in one statement - last one wins
+    deduped = list({row[key]: row for row in rows}.values())
+    if not deduped:
+        return result
+
+    dialect = db.get_bind().dialect.name
+    if dialect == 'postgresql':
+        insert = postgresql.insert
+    elif dialect == 'sqlite':
+        insert = sqlite.insert
+    else:
+        raise NotImplementedError(f"Bulk upsert not supported for {dialect}")
+
+    table = model.__table__
+    key_column = table.c[key]
+    conflict_columns = conflict_columns or [key]
+
+    for i in range(0, len(deduped), BATCH_SIZE):
+        batch = deduped[i:i + BATCH_SIZE]
+        columns = [c for c in batch[0].keys() if c not in conflict_columns]
+
+        with DB_BULK_WRITE_SECONDS.time(table=table.name):
+            stmt = insert(table).values(batch)
+            changed = or_(*[
+                _comparable(table.c[c]).is_distinct_from(_comparable(stmt.excluded[c]))
+                for c in columns
+            ])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c[c] for c in conflict_columns],
+                set_={c: stmt.excluded[c] for c in columns},
+                where=changed
+            )
+
+            if dialect == 'postgresql':
+                # xmax is 0 only for freshly inserted tuples; unchanged rows are
+                # filtered by the WHERE clause and not returned at all
+                stmt = stmt.returning(key_column, literal_column('(xmax = 0)'))
+                returned = db.execute(stmt).all()
+                inserted = {k for k, is_insert in returned if is_insert}
+            else:
+                # SQLite has no xmax, so look up which keys already exist first
+                keys = [row[key] for row in batch]
+                existing = set(db.execute(select(key_column).where(key_column.in_(keys))).scalars())
+                returned = db.execute(stmt.returning(key_column)).all()
+                inserted = {k for (k,) in returned if k not in existing}
+
+        result['inserted'] += len(inserted)
+        result['updated'] += len(returned) - len(inserted)
+        result['unchanged'] += len(batch) - len(returned)
+        result['changed'].extend(row[0] for row in returned)
+
+    db.commit()
+    for outcome in ('inserted', 'updated', 'unchanged'):
+        DB_BULK_ROWS.inc(result[outcome], table=table.name, result=outcome)
+    return result
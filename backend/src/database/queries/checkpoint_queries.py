@@ -0,0 +1,27 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import delete, select
+from typing import Dict
+from datetime import date, datetime, timezone
+from ..models import SyncCheckpoint
+
+def get_completed_chunks(db: Session, season: str) -> Dict[date, date]:
+    """{chunk start: chunk end} of the season's chunks already synced by a backfill"""
+    return dict(db.execute(
+        select(SyncCheckpoint.chunk_start, SyncCheckpoint.chunk_end).where(SyncCheckpoint.season == season)
+    ).all())
+
+def mark_chunk_complete(db: Session, season: str, chunk_start: date, chunk_end: date, games_synced: int):
+    """Record a finished chunk (re-marking one just refreshes it)"""
+    db.merge(SyncCheckpoint(
+        season=season,
+        chunk_start=chunk_start,
+        chunk_end=chunk_end,
+        games_synced=games_synced,
+        completed_at=datetime.now(timezone.utc)
+    ))
+    db.commit()
+
+def clear_checkpoints(db: Session, season: str):
+    """Forget a season's progress so the next backfill starts over"""
+    db.execute(delete(SyncCheckpoint).where(SyncCheckpoint.season == season))
+    db.commit()
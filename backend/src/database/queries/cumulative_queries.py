@@ -0,0 +1,171 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, delete, func, insert, select
+from typing import Dict, Optional
+from datetime import date
+from ..models import Game, TeamDailyCumulative
+from ..team_directory import get_team_directory
+from .standings_queries import (
+    COMPLETED_STATES,
+    OVERTIME_PERIODS,
+    calculate_standings_sql,
+    head_to_head_points,
+    needs_head_to_head,
+    new_standings_row,
+    sort_standings
+)
+
+STAT_COLUMNS = [
+    'games_played', 'wins', 'regulation_wins', 'regulation_plus_ot_wins',
+    'losses', 'ot_losses', 'goals_for', 'goals_against', 'points'
+]
+
+# standings row key for each cumulative column
+STANDINGS_FIELDS = {
+    'games_played': 'gamesPlayed',
+    'wins': 'wins',
+    'regulation_wins': 'regulationWins',
+    'regulation_plus_ot_wins': 'regulationPlusOtWins',
+    'losses': 'losses',
+    'ot_losses': 'otLosses',
+    'goals_for': 'goalFor',
+    'goals_against': 'goalAgainst',
+    'points': 'points'
+}
+
+def has_team_daily_cumulative(db: Session, season: str) -> bool:
+    """Whether the cumulative table has been built for a season"""
+    return db.execute(
+        select(TeamDailyCumulative.season).where(TeamDailyCumulative.season == season).limit(1)
+    ).first() is not None
+
+def refresh_team_daily_cumulative(db: Session, season: str, since: Optional[date] = None) -> int:
+    """
+    Recompute cumulative rows for a season from `since` onwards.
+    Rows before `since` are kept and used as the starting totals, so a
+    catch-up sync only rewrites the last few days. Without `since` (or
+    when nothing is stored yet) the whole season is rebuilt.
+    Returns the number of rows written.
+    """
+    if since is None or not has_team_daily_cumulative(db, season):
+        since = date.min
+
+    # Starting totals: each team's last row before `since`
+    totals = {
+        row.team_abbrev: {c: getattr(row, c) for c in STAT_COLUMNS}
+        for row in _latest_rows(db, season, TeamDailyCumulative.game_date < since)
+    }
+
+    db.execute(delete(TeamDailyCumulative).where(and_(
+        TeamDailyCumulative.season == season,
+        TeamDailyCumulative.game_date >= since
+    )))
+
+    # Only games between known teams count, same as the standings engines
+    known_teams = list(get_team_directory(db).by_abbrev)
+    games = db.execute(
+        select(
+            Game.game_date, Game.home_team_abbrev, Game.away_team_abbrev,
+            Game.home_score, Game.away_score, Game.period_type
+        ).where(and_(
+            Game.season == season,
+            Game.game_date >= since,
+            Game.game_state.in_(COMPLETED_STATES),
+            Game.home_team_abbrev.in_(known_teams),
+            Game.away_team_abbrev.in_(known_teams)
+        )).order_by(Game.game_date)
+    ).all()
+
+    rows = {}
+    for game in games:
+        home_won = game.home_score > game.away_score
+        is_overtime = game.period_type in OVERTIME_PERIODS
+        for team, goals_for, goals_against, won in (
+            (game.home_team_abbrev, game.home_score, game.away_score, home_won),
+            (game.away_team_abbrev, game.away_score, game.home_score, not home_won)
+        ):
+            stats = totals.setdefault(team, {c: 0 for c in STAT_COLUMNS})
+            stats['games_played'] += 1
+            stats['goals_for'] += goals_for
+            stats['goals_against'] += goals_against
+            if won:
+                stats['wins'] += 1
+                stats['points'] += 2
+                if not is_overtime:
+                    stats['regulation_wins'] += 1
+                if game.period_type != 'SO':
+                    stats['regulation_plus_ot_wins'] += 1
+            elif is_overtime:
+                stats['ot_losses'] += 1
+                stats['points'] += 1
+            else:
+                stats['losses'] += 1
+            # Later games on the same date overwrite, leaving the end-of-day total
+            rows[(team, game.game_date)] = dict(stats, season=season, team_abbrev=team, game_date=game.game_date)
+
+    if rows:
+        db.execute(insert(TeamDailyCumulative), list(rows.values()))
+    db.commit()
+    return len(rows)
+
+def _latest_rows(db: Session, season: str, date_condition):
+    """Each team's most recent cumulative row matching the date condition"""
+    latest = select(
+        TeamDailyCumulative.team_abbrev,
+        func.max(TeamDailyCumulative.game_date).label('game_date')
+    ).where(and_(
+        TeamDailyCumulative.season == season,
+        date_condition
+    )).group_by(TeamDailyCumulative.team_abbrev).subquery()
+
+    return db.execute(
+        select(TeamDailyCumulative.team_abbrev, *[getattr(TeamDailyCumulative, c) for c in STAT_COLUMNS])
+        .join(latest, and_(
+            TeamDailyCumulative.team_abbrev == latest.c.team_abbrev,
+            TeamDailyCumulative.game_date == latest.c.game_date
+        ))
+        .where(TeamDailyCumulative.season == season)
+    ).all()
+
+def calculate_standings_cumulative(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    season: str,
+    division: Optional[str] = None,
+    conference: Optional[str] = None
+) -> Dict:
+    """
+    Calculate standings as cumulative(end_date) - cumulative(start_date - 1).
+    Two indexed lookups per team regardless of range length. Filtered
+    standings only count games inside the filter, which per-team totals
+    can't express, so those (and seasons not built yet) use the SQL engine.
+    Head-to-head points aren't cumulative either; they're fetched with one
+    pairwise query only when teams are still tied on their own records.
+    """
+    if division or conference or not has_team_daily_cumulative(db, season):
+        return calculate_standings_sql(db, start_date, end_date, season, division, conference)
+
+    at_end = {row.team_abbrev: row for row in _latest_rows(db, season, TeamDailyCumulative.game_date <= end_date)}
+    before_start = {row.team_abbrev: row for row in _latest_rows(db, season, TeamDailyCumulative.game_date < start_date)}
+
+    team_stats = {}
+    for team in get_team_directory(db).teams:
+        stats = new_standings_row(team.to_dict())
+        team_stats[team.abbrev] = stats
+        end_row = at_end.get(team.abbrev)
+        if not end_row:
+            continue
+
+        start_row = before_start.get(team.abbrev)
+        delta = {
+            c: getattr(end_row, c) - (getattr(start_row, c) if start_row else 0)
+            for c in STAT_COLUMNS
+        }
+        for column, field in STANDINGS_FIELDS.items():
+            stats[field] = delta[column]
+        stats['goalDifferential'] = delta['goals_for'] - delta['goals_against']
+
+    head_to_head = None
+    if needs_head_to_head(team_stats):
+        head_to_head = head_to_head_points(db, start_date, end_date, season, team_stats)
+    return {'standings': sort_standings(team_stats, head_to_head)}
@@ -0,0 +1,87 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, select
+from typing import Iterator, List, Optional
+from datetime import date
+import os
+from ..models import Game, GameParticipant, TeamDailyCumulative
+from .cumulative_queries import STAT_COLUMNS
+
+# Rows fetched from the server-side cursor (and emitted) per chunk
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "1000"))
+
+GAME_EXPORT_COLUMNS = [
+    'id', 'game_date', 'season', 'game_type', 'game_state',
+    'home_team_abbrev', 'away_team_abbrev', 'home_score', 'away_score', 'period_type'
+]
+
+STANDINGS_EXPORT_COLUMNS = ['season', 'game_date', 'team_abbrev'] + STAT_COLUMNS
+
+def _stream(db: Session, stmt, chunk_size: int) -> Iterator[List[dict]]:
+    """
+    Run stmt on a server-side cursor and yield its rows chunk_size at a
+    time, so memory stays at one chunk however many rows match.
+    """
+    result = db.execute(stmt, execution_options={'yield_per': chunk_size})
+    for partition in result.mappings().partitions():
+        yield [dict(row) for row in partition]
+
+def iter_games_export(
+    db: Session,
+    seasons: Optional[List[str]] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    team: Optional[str] = None,
+    chunk_size: int = EXPORT_CHUNK_SIZE
+) -> Iterator[List[dict]]:
+    """
+    Chunks of games rows in (date, id) order. The team filter goes through
+    game_participants, so it must be built for the seasons involved.
+    """
+    conditions = []
+    if seasons:
+        conditions.append(Game.season.in_(seasons))
+    if start_date:
+        conditions.append(Game.game_date >= start_date)
+    if end_date:
+        conditions.append(Game.game_date <= end_date)
+    if team:
+        conditions.append(Game.id.in_(
+            select(GameParticipant.game_id).where(GameParticipant.team_abbrev == team)
+        ))
+
+    stmt = select(*[Game.__table__.c[c] for c in GAME_EXPORT_COLUMNS]).where(and_(True, *conditions))
+    return _stream(db, stmt.order_by(Game.game_date, Game.id), chunk_size)
+
+def iter_standings_export(
+    db: Session,
+    seasons: Optional[List[str]] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    team: Optional[str] = None,
+    chunk_size: int = EXPORT_CHUNK_SIZE
+) -> Iterator[List[dict]]:
+    """
+    Chunks of season-to-date standings totals per team for every date it
+    played (team_daily_cumulative), in primary key order - no sort step
+    between the query and the first row.
+    """
+    conditions = []
+    if seasons:
+        conditions.append(TeamDailyCumulative.season.in_(seasons))
+    if start_date:
+        conditions.append(TeamDailyCumulative.game_date >= start_date)
+    if end_date:
+        conditions.append(TeamDailyCumulative.game_date <= end_date)
+    if team:
+        conditions.append(TeamDailyCumulative.team_abbrev == team)
+
+    stmt = select(
+        *[TeamDailyCumulative.__table__.c[c] for c in STANDINGS_EXPORT_COLUMNS]
+    ).where(and_(True, *conditions)).order_by(
+        TeamDailyCumulative.season, TeamDailyCumulative.team_abbrev, TeamDailyCumulative.game_date
+    )
+    return _stream(db, stmt, chunk_size)
+
+def get_game_seasons(db: Session) -> List[str]:
+    """Every season that has games stored"""
+    return list(db.execute(select(Game.season).distinct().order_by(Game.season)).scalars())
@@ -1,8 +1,23 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, func
 from typing import List, Optional, Dict
-from datetime import date, datetime
-from ..models import Game, Team
+from datetime import date
+import os
+from ..models import Game
+from ...core.metrics import STANDINGS_CALCULATION_SECONDS
+from ..team_directory import get_team_directory
+from .bulk_queries import bulk_upsert
+from ..partitioning import ensure_season_partition
+from .standings_queries import add_game_result, calculate_standings_sql, new_standings_row, sort_standings
+from .cumulative_queries import calculate_standings_cumulative
+from .vectorized_queries import calculate_standings_vectorized
+
+# Which engine calculate_standings uses unless told otherwise:
+#   cumulative - per-team lookups in team_daily_cumulative (falls back to sql)
+#   sql        - one grouped query, aggregation done by the database
+#   python     - load games and tally them in Python (calculate_standings_from_db)
+#   vectorized - prefix sums over the in-memory NumPy game store
+STANDINGS_ENGINE = os.getenv("STANDINGS_ENGINE", "cumulative")
 
 def get_games_by_date_range(
     db: Session, 
@@ -28,8 +43,15 @@ def get_game_by_id(db: Session, game_id: int) -> Optional[Game]:
     """Get specific game by ID"""
     return db.query(Game).filter(Game.id == game_id).first()
 
+def get_games_by_ids(db: Session, game_ids: List[int]) -> List[Game]:
+    """Get specific games by ID"""
+    if not game_ids:
+        return []
+    return db.query(Game).filter(Game.id.in_(game_ids)).all()
+
 def upsert_game(db: Session, game_data: dict) -> Game:
     """Insert or update game"""
+    ensure_season_partition(db, game_data['season'])
     game = db.query(Game).filter(Game.id == game_data['id']).first()
     
     if game:
@@ -45,12 +67,11 @@ def upsert_game(db: Session, game_data: dict) -> Game:
     db.refresh(game)
     return game
 
-def bulk_upsert_games(db: Session, games_data: List[dict]) -> List[Game]:
-    """Bulk insert or update games"""
-    games = []
-    for game_data in games_data:
-        games.append(upsert_game(db, game_data))
-    return games
+def bulk_upsert_games(db: Session, games_data: List[dict]) -> Dict:
+    """Bulk insert or update games - returns inserted/updated/unchanged counts"""
+    for season in {game['season'] for game in games_data}:
+        ensure_season_partition(db, season)
+    return bulk_upsert(db, Game, games_data, key='id', conflict_columns=['id', 'season'])
 
 def calculate_standings_from_db(
     db: Session,
@@ -67,35 +88,13 @@ def calculate_standings_from_db(
     # Get all games in range
     games = get_games_by_date_range(db, start_date, end_date, season)
     
-    # Get all teams for initialization
-    teams = db.query(Team).all()
-    
-    # Initialize team stats
+    # Initialize team stats for the filtered teams (from the in-memory directory)
     team_stats = {}
-    for team in teams:
-        # Apply filters
-        if division and team.division.lower() != division.lower():
-            continue
-        if conference and team.conference.lower() != conference.lower():
-            continue
-            
-        team_stats[team.abbrev] = {
-            'teamName': {'default': team.name},
-            'teamAbbrev': {'default': team.abbrev},
-            'team': team.to_dict(),
-            'gamesPlayed': 0,
-            'wins': 0,
-            'losses': 0,
-            'otLosses': 0,
-            'points': 0,
-            'goalFor': 0,
-            'goalAgainst': 0,
-            'goalDifferential': 0,
-            'divisionName': team.division,
-            'conferenceName': team.conference
-        }
+    for team in get_team_directory(db).select(division, conference):
+        team_stats[team.abbrev] = new_standings_row(team.to_dict())
     
-    # Process each game
+    # Process each game, building the pairwise points matrix for tiebreaks as we go
+    head_to_head = {}
     for game in games:
         home = game.home_team_abbrev
         away = game.away_team_abbrev
@@ -103,43 +102,36 @@ def calculate_standings_from_db(
         if home not in team_stats or away not in team_stats:
             continue
         
-        # Update games played and goals
-        team_stats[home]['gamesPlayed'] += 1
-        team_stats[away]['gamesPlayed'] += 1
-        team_stats[home]['goalFor'] += game.home_score
-        team_stats[home]['goalAgainst'] += game.away_score
-        team_stats[away]['goalFor'] += game.away_score
-        team_stats[away]['goalAgainst'] += game.home_score
-        
-        # Determine winner and points
-        is_overtime = game.period_type in ['OT', 'SO']
-        
-        if game.home_score > game.away_score:
-            team_stats[home]['wins'] += 1
-            team_stats[home]['points'] += 2
-            if is_overtime:
-                team_stats[away]['otLosses'] += 1
-                team_stats[away]['points'] += 1
-            else:
-                team_stats[away]['losses'] += 1
-        else:
-            team_stats[away]['wins'] += 1
-            team_stats[away]['points'] += 2
-            if is_overtime:
-                team_stats[home]['otLosses'] += 1
-                team_stats[home]['points'] += 1
-            else:
-                team_stats[home]['losses'] += 1
-        
-        # Update goal differential
-        team_stats[home]['goalDifferential'] = team_stats[home]['goalFor'] - team_stats[home]['goalAgainst']
-        team_stats[away]['goalDifferential'] = team_stats[away]['goalFor'] - team_stats[away]['goalAgainst']
+        add_game_result(
+            team_stats, head_to_head, home, away,
+            game.home_score, game.away_score, game.period_type
+        )
     
     # Convert to list and sort
-    standings_list = [s for s in team_stats.values() if s['gamesPlayed'] > 0]
-    standings_list.sort(key=lambda x: (-x['points'], -x['goalDifferential']))
+    return {'standings': sort_standings(team_stats, head_to_head)}
+
+def calculate_standings(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    season: str,
+    division: Optional[str] = None,
+    conference: Optional[str] = None,
+    engine: Optional[str] = None
+) -> Dict:
+    """Calculate standings with the configured engine (see STANDINGS_ENGINE)"""
+    engines = {
+        'cumulative': calculate_standings_cumulative,
+        'sql': calculate_standings_sql,
+        'python': calculate_standings_from_db,
+        'vectorized': calculate_standings_vectorized
+    }
+    engine = engine or STANDINGS_ENGINE
+    if engine not in engines:
+        raise ValueError(f"Unknown standings engine '{engine}', expected one of {list(engines)}")
     
-    return {'standings': standings_list}
+    with STANDINGS_CALCULATION_SECONDS.time(engine=engine):
+        return engines[engine](db, start_date, end_date, season, division, conference)
 
 def get_latest_game_date(db: Session, season: str) -> Optional[date]:
     """Get the most recent game date in database for a season"""
@@ -0,0 +1,72 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, delete, func, insert, select
+from typing import Dict, List, Optional, Tuple
+from datetime import date, datetime, timezone
+from ..models import SyncLedgerDay
+
+def season_first_day(season: str) -> date:
+    """First date a season's data is synced from (September 1, before preseason)"""
+    return date(int(season[:4]), 9, 1)
+
+def season_last_day(season: str) -> date:
+    """Last date a season's games can fall on (end of August, after the playoffs)"""
+    return date(int(season[4:]), 8, 31)
+
+def record_sync_ledger(db: Session, season: str, days: Dict[date, Tuple[bool, List[int]]]):
+    """Store (is_final, pending game IDs) for each schedule date just fetched"""
+    if not days:
+        return
+    db.execute(delete(SyncLedgerDay).where(and_(
+        SyncLedgerDay.season == season,
+        SyncLedgerDay.schedule_date.in_(list(days))
+    )))
+    now = datetime.now(timezone.utc)
+    db.execute(insert(SyncLedgerDay), [
+        {'season': season, 'schedule_date': day, 'is_final': is_final,
+         'pending_game_ids': pending, 'checked_at': now}
+        for day, (is_final, pending) in days.items()
+    ])
+    db.commit()
+
+def get_ledger_end(db: Session, season: str) -> Optional[date]:
+    """Last schedule date the season has been synced through; None if never synced"""
+    return db.execute(
+        select(func.max(SyncLedgerDay.schedule_date)).where(SyncLedgerDay.season == season)
+    ).scalar()
+
+def get_unfinished_dates(db: Session, season: str, through: date) -> List[date]:
+    """Synced dates up to `through` that still hold unfinished games"""
+    return list(db.execute(
+        select(SyncLedgerDay.schedule_date).where(and_(
+            SyncLedgerDay.season == season,
+            SyncLedgerDay.is_final.is_(False),
+            SyncLedgerDay.schedule_date <= through
+        )).order_by(SyncLedgerDay.schedule_date)
+    ).scalars())
+
+def get_pending_game_ids(db: Session, season: str) -> List[int]:
+    """IDs of the season's games last seen unfinished"""
+    rows = db.execute(
+        select(SyncLedgerDay.pending_game_ids).where(and_(
+            SyncLedgerDay.season == season,
+            SyncLedgerDay.is_final.is_(False)
+        ))
+    ).scalars()
+    return sorted({game_id for pending in rows for game_id in pending or []})
+
+def get_unfinished_days(db: Session, first_day: date, last_day: date) -> List[Tuple[str, date, List[int]]]:
+    """(season, schedule date, pending game IDs) for unfinished dates with games, across seasons"""
+    rows = db.execute(
+        select(SyncLedgerDay.season, SyncLedgerDay.schedule_date, SyncLedgerDay.pending_game_ids).where(and_(
+            SyncLedgerDay.is_final.is_(False),
+            SyncLedgerDay.schedule_date >= first_day,
+            SyncLedgerDay.schedule_date <= last_day
+        )).order_by(SyncLedgerDay.schedule_date)
+    ).all()
+    return [(season, day, pending) for season, day, pending in rows if pending]
+
+def ledger_covers(db: Session, season: str, through: date) -> bool:
+    """Whether every date of the season up to `through` is synced and final"""
+    through = min(through, season_last_day(season))
+    ledger_end = get_ledger_end(db, season)
+    return ledger_end is not None and ledger_end >= through and not get_unfinished_dates(db, season, through)
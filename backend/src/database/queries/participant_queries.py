@@ -0,0 +1,160 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, delete, insert, select
+from typing import Dict, Iterable, List, Optional
+from datetime import date
+from ..models import Game, GameParticipant
+from .standings_queries import COMPLETED_STATES, OVERTIME_PERIODS
+
+# Rows per executemany batch when rebuilding participants
+INSERT_BATCH_SIZE = 1000
+
+def has_game_participants(db: Session, season: str) -> bool:
+    """Whether the participants table has been built for a season"""
+    return db.execute(
+        select(GameParticipant.season).where(GameParticipant.season == season).limit(1)
+    ).first() is not None
+
+def refresh_game_participants(db: Session, season: str, dates: Optional[Iterable[date]] = None) -> int:
+    """
+    Rewrite participant rows for a season's games, either on the given
+    dates (what a sync just changed) or for the whole season.
+    Returns the number of rows written.
+    """
+    game_filter = [Game.season == season]
+    if dates is not None:
+        dates = list(dates)
+        if not dates:
+            return 0
+        game_filter.append(Game.game_date.in_(dates))
+
+    game_ids = select(Game.id).where(and_(*game_filter))
+    db.execute(delete(GameParticipant).where(GameParticipant.game_id.in_(game_ids)))
+
+    games = db.execute(
+        select(
+            Game.id, Game.game_date, Game.season, Game.game_type, Game.game_state,
+            Game.home_team_abbrev, Game.away_team_abbrev, Game.home_score, Game.away_score, Game.period_type
+        ).where(and_(*game_filter))
+    ).all()
+
+    rows = []
+    for game in games:
+        for team, opponent, goals_for, goals_against, is_home in (
+            (game.home_team_abbrev, game.away_team_abbrev, game.home_score, game.away_score, True),
+            (game.away_team_abbrev, game.home_team_abbrev, game.away_score, game.home_score, False)
+        ):
+            rows.append({
+                'team_abbrev': team,
+                'game_date': game.game_date,
+                'game_id': game.id,
+                'season': game.season,
+                'game_type': game.game_type,
+                'game_state': game.game_state,
+                'opponent_abbrev': opponent,
+                'is_home': is_home,
+                'goals_for': goals_for,
+                'goals_against': goals_against,
+                'period_type': game.period_type
+            })
+
+    for i in range(0, len(rows), INSERT_BATCH_SIZE):
+        db.execute(insert(GameParticipant), rows[i:i + INSERT_BATCH_SIZE])
+    db.commit()
+    return len(rows)
+
+def _empty_record() -> Dict:
+    return {
+        'gamesPlayed': 0,
+        'wins': 0,
+        'losses': 0,
+        'otLosses': 0,
+        'points': 0,
+        'regulationWins': 0,
+        'goalFor': 0,
+        'goalAgainst': 0,
+        'goalDifferential': 0
+    }
+
+def _add_to_record(record: Dict, result: str, goals_for: int, goals_against: int, period_type: Optional[str]):
+    record['gamesPlayed'] += 1
+    record['goalFor'] += goals_for
+    record['goalAgainst'] += goals_against
+    record['goalDifferential'] = record['goalFor'] - record['goalAgainst']
+    if result == 'W':
+        record['wins'] += 1
+        record['points'] += 2
+        if period_type not in OVERTIME_PERIODS:
+            record['regulationWins'] += 1
+    elif result == 'OTL':
+        record['otLosses'] += 1
+        record['points'] += 1
+    else:
+        record['losses'] += 1
+
+def get_matchup(
+    db: Session,
+    team: str,
+    opponents: Optional[List[str]],
+    seasons: List[str],
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    game_type: Optional[int] = None
+) -> Dict:
+    """
+    A team's record and games against a set of opponents (None = everyone)
+    over the given seasons, optionally narrowed to a date range and game
+    type. Read from game_participants with one (team, ...) range scan.
+    Records count completed games only; the games list also has upcoming ones.
+    """
+    conditions = [GameParticipant.team_abbrev == team, GameParticipant.season.in_(seasons)]
+    if opponents is not None:
+        conditions.append(GameParticipant.opponent_abbrev.in_(opponents))
+    if start_date:
+        conditions.append(GameParticipant.game_date >= start_date)
+    if end_date:
+        conditions.append(GameParticipant.game_date <= end_date)
+    if game_type is not None:
+        conditions.append(GameParticipant.game_type == game_type)
+
+    rows = db.execute(
+        select(
+            GameParticipant.game_id, GameParticipant.game_date, GameParticipant.season,
+            GameParticipant.game_type, GameParticipant.game_state, GameParticipant.opponent_abbrev,
+            GameParticipant.is_home, GameParticipant.goals_for, GameParticipant.goals_against,
+            GameParticipant.period_type
+        ).where(and_(*conditions)).order_by(GameParticipant.game_date, GameParticipant.game_id)
+    ).all()
+
+    record, home, away = _empty_record(), _empty_record(), _empty_record()
+    by_opponent = {}
+    games = []
+    for row in rows:
+        result = None
+        if row.game_state in COMPLETED_STATES:
+            if row.goals_for > row.goals_against:
+                result = 'W'
+            else:
+                result = 'OTL' if row.period_type in OVERTIME_PERIODS else 'L'
+            opponent_record = by_opponent.setdefault(row.opponent_abbrev, _empty_record())
+            for totals in (record, home if row.is_home else away, opponent_record):
+                _add_to_record(totals, result, row.goals_for, row.goals_against, row.period_type)
+
+        games.append({
+            'id': row.game_id,
+            'date': row.game_date.isoformat(),
+            'season': row.season,
+            'gameType': row.game_type,
+            'gameState': row.game_state,
+            'opponent': row.opponent_abbrev,
+            'home': row.is_home,
+            'goalsFor': row.goals_for,
+            'goalsAgainst': row.goals_against,
+            'periodType': row.period_type,
+            'result': result
+        })
+
+    return {
+        'record': dict(record, home=home, away=away),
+        'byOpponent': [dict(by_opponent[abbrev], opponent=abbrev) for abbrev in sorted(by_opponent)],
+        'games': games
+    }
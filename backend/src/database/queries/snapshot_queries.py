@@ -0,0 +1,111 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, select, update
+from typing import Dict, List, Optional
+from datetime import date, datetime, timezone
+from ..models import StandingsSnapshot, StandingsSnapshotDay
+from .ledger_queries import season_first_day, season_last_day
+
+# Feed fields that change every day without the standings changing
+VOLATILE_FIELDS = ('date',)
+
+def _latest_snapshot_rows(db: Session, season: str, as_of: Optional[date] = None) -> List[StandingsSnapshot]:
+    """Each team's most recent snapshot row on or before as_of (or overall)"""
+    conditions = [StandingsSnapshot.season == season]
+    if as_of:
+        conditions.append(StandingsSnapshot.as_of_date <= as_of)
+
+    latest = select(
+        StandingsSnapshot.team_abbrev,
+        func.max(StandingsSnapshot.as_of_date).label('as_of_date')
+    ).where(and_(*conditions)).group_by(StandingsSnapshot.team_abbrev).subquery()
+
+    return db.execute(
+        select(StandingsSnapshot).join(latest, and_(
+            StandingsSnapshot.team_abbrev == latest.c.team_abbrev,
+            StandingsSnapshot.as_of_date == latest.c.as_of_date
+        )).where(StandingsSnapshot.season == season)
+    ).scalars().all()
+
+def store_standings_snapshot(db: Session, season: str, as_of: date, standings: Dict) -> int:
+    """
+    Persist a league standings payload as of a date, writing only the team
+    rows that differ from each team's previous snapshot, and record the
+    date as captured. A date older than ones already captured is fine: the
+    next captured date keeps the rows it was reading. Returns the number of
+    rows written. Raises ValueError for a date outside the season.
+    """
+    if not season_first_day(season) <= as_of <= season_last_day(season):
+        raise ValueError(f"Snapshot date {as_of} is outside season {season}")
+    previous = {row.team_abbrev: row for row in _latest_snapshot_rows(db, season, as_of)}
+    next_day = db.execute(
+        select(func.min(StandingsSnapshotDay.as_of_date)).where(
+            StandingsSnapshotDay.season == season, StandingsSnapshotDay.as_of_date > as_of
+        )
+    ).scalar()
+    changed_before_next = set()
+    if next_day:
+        changed_before_next = set(db.execute(
+            select(StandingsSnapshot.team_abbrev).where(and_(
+                StandingsSnapshot.season == season,
+                StandingsSnapshot.as_of_date > as_of,
+                StandingsSnapshot.as_of_date <= next_day
+            ))
+        ).scalars())
+
+    written = 0
+    for team in standings.get('standings', []):
+        abbrev = team.get('teamAbbrev', {}).get('default')
+        if not abbrev:
+            continue
+        payload = {k: v for k, v in team.items() if k not in VOLATILE_FIELDS}
+
+        row = previous.get(abbrev)
+        if row is not None and row.payload == payload:
+            continue
+        # Read before the update below, which refreshes row
+        previous_payload = row.payload if row is not None else None
+        if row is not None and row.as_of_date == as_of:
+            db.execute(
+                update(StandingsSnapshot)
+                .where(and_(
+                    StandingsSnapshot.season == season,
+                    StandingsSnapshot.team_abbrev == abbrev,
+                    StandingsSnapshot.as_of_date == as_of
+                ))
+                .values(payload=payload)
+            )
+        else:
+            db.add(StandingsSnapshot(season=season, team_abbrev=abbrev, as_of_date=as_of, payload=payload))
+        written += 1
+
+        if next_day and previous_payload is not None and abbrev not in changed_before_next:
+            # The next captured date matched the old row, so none was stored there - pin it
+            db.add(StandingsSnapshot(
+                season=season, team_abbrev=abbrev, as_of_date=next_day, payload=previous_payload
+            ))
+            written += 1
+
+    db.merge(StandingsSnapshotDay(season=season, as_of_date=as_of, captured_at=datetime.now(timezone.utc)))
+    db.commit()
+    return written
+
+def get_standings_snapshot(db: Session, season: str, as_of: Optional[date] = None) -> Optional[Dict]:
+    """
+    Official standings as of a date (default: the latest captured date), in
+    the league feed's shape and order. None unless that date was captured -
+    the latest rows before an uncaptured date may be long out of date.
+    """
+    captured = select(func.max(StandingsSnapshotDay.as_of_date)).where(StandingsSnapshotDay.season == season)
+    if as_of:
+        captured = captured.where(StandingsSnapshotDay.as_of_date == as_of)
+    snapshot_date = db.execute(captured).scalar()
+    if snapshot_date is None:
+        return None
+
+    rows = _latest_snapshot_rows(db, season, snapshot_date)
+    if not rows:
+        return None
+
+    standings = [dict(row.payload, date=snapshot_date.isoformat()) for row in rows]
+    standings.sort(key=lambda team: (team.get('leagueSequence') or 0, -(team.get('points') or 0)))
+    return {'standings': standings, 'asOfDate': snapshot_date.isoformat()}
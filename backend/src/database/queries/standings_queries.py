@@ -0,0 +1,261 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, case, func, select, union_all
+from typing import Dict, Iterable, List, Optional
+from itertools import groupby
+from datetime import date
+from ..models import Game
+from ..team_directory import get_team_directory
+
+COMPLETED_STATES = ['OFF', 'FINAL']
+OVERTIME_PERIODS = ['OT', 'SO']
+
+# {team: {opponent: points team earned against opponent}}
+HeadToHead = Dict[str, Dict[str, int]]
+
+def new_standings_row(team: Dict) -> Dict:
+    """Empty standings entry for a team (team is Team.to_dict()-shaped)"""
+    return {
+        'teamName': {'default': team['name']},
+        'teamAbbrev': {'default': team['abbrev']},
+        'team': team,
+        'gamesPlayed': 0,
+        'wins': 0,
+        'losses': 0,
+        'otLosses': 0,
+        'points': 0,
+        'pointPctg': 0.0,
+        'regulationWins': 0,
+        'regulationPlusOtWins': 0,
+        'goalFor': 0,
+        'goalAgainst': 0,
+        'goalDifferential': 0,
+        'divisionName': team['division'],
+        'conferenceName': team['conference']
+    }
+
+def add_game_result(
+    team_stats: Dict[str, Dict],
+    head_to_head: HeadToHead,
+    home: str,
+    away: str,
+    home_score: int,
+    away_score: int,
+    period_type: Optional[str]
+):
+    """Apply one completed game to both teams' standings rows and the pairwise points"""
+    home_stats, away_stats = team_stats[home], team_stats[away]
+    for stats, goals_for, goals_against in ((home_stats, home_score, away_score), (away_stats, away_score, home_score)):
+        stats['gamesPlayed'] += 1
+        stats['goalFor'] += goals_for
+        stats['goalAgainst'] += goals_against
+        stats['goalDifferential'] = stats['goalFor'] - stats['goalAgainst']
+
+    winner, loser = (home, away) if home_score > away_score else (away, home)
+    team_stats[winner]['wins'] += 1
+    team_stats[winner]['points'] += 2
+    head_to_head.setdefault(winner, {})
+    head_to_head[winner][loser] = head_to_head[winner].get(loser, 0) + 2
+
+    if period_type not in OVERTIME_PERIODS:
+        team_stats[winner]['regulationWins'] += 1
+        team_stats[winner]['regulationPlusOtWins'] += 1
+        team_stats[loser]['losses'] += 1
+    else:
+        if period_type == 'OT':
+            team_stats[winner]['regulationPlusOtWins'] += 1
+        team_stats[loser]['otLosses'] += 1
+        team_stats[loser]['points'] += 1
+        head_to_head.setdefault(loser, {})
+        head_to_head[loser][winner] = head_to_head[loser].get(winner, 0) + 1
+
+def _record_key(stats: Dict):
+    """Tiebreakers that only need a team's own record"""
+    return (
+        -stats['points'],
+        -stats['pointPctg'],
+        -stats['regulationWins'],
+        -stats['regulationPlusOtWins'],
+        -stats['wins']
+    )
+
+def _ranked(team_stats: Dict[str, Dict]) -> List[Dict]:
+    """Teams that have played, with pointPctg filled in, ordered by _record_key"""
+    standings_list = [s for s in team_stats.values() if s['gamesPlayed'] > 0]
+    for stats in standings_list:
+        stats['pointPctg'] = stats['points'] / (2 * stats['gamesPlayed'])
+    standings_list.sort(key=_record_key)
+    return standings_list
+
+def needs_head_to_head(team_stats: Dict[str, Dict]) -> bool:
+    """Whether any teams are still tied after the record-only tiebreakers"""
+    keys = [_record_key(s) for s in _ranked(team_stats)]
+    return any(a == b for a, b in zip(keys, keys[1:]))
+
+def sort_standings(team_stats: Dict[str, Dict], head_to_head: Optional[HeadToHead] = None) -> List[Dict]:
+    """
+    Drop teams without games and order by the NHL tiebreakers: points,
+    points percentage, regulation wins, regulation + OT wins, wins,
+    head-to-head points among the tied teams, goal differential, goals for.
+    Teams still level keep their input (team id) order.
+    Head-to-head is the plain points total within the range - the league's
+    uneven-home-games adjustment isn't applied.
+    """
+    head_to_head = head_to_head or {}
+    standings_list = []
+    for _, group in groupby(_ranked(team_stats), key=_record_key):
+        group = list(group)
+        if len(group) > 1:
+            tied = [s['teamAbbrev']['default'] for s in group]
+            h2h_points = {
+                abbrev: sum(head_to_head.get(abbrev, {}).get(other, 0) for other in tied)
+                for abbrev in tied
+            }
+            group.sort(key=lambda s: (
+                -h2h_points[s['teamAbbrev']['default']],
+                -s['goalDifferential'],
+                -s['goalFor']
+            ))
+        standings_list.extend(group)
+    return standings_list
+
+def pairwise_query(start_date: date, end_date: date, season: str, abbrevs: Iterable[str]):
+    """
+    Per (team, opponent) totals for completed games between the given teams.
+    Each game is expanded into a home and an away perspective (UNION ALL)
+    and summed with conditional aggregates.
+    """
+    abbrevs = list(abbrevs)
+    in_range = and_(
+        Game.season == season,
+        Game.game_date >= start_date,
+        Game.game_date <= end_date,
+        Game.game_state.in_(COMPLETED_STATES),
+        Game.home_team_abbrev.in_(abbrevs),
+        Game.away_team_abbrev.in_(abbrevs)
+    )
+    # A missing period type counts as regulation, as in add_game_result
+    period_type = func.coalesce(Game.period_type, 'REG')
+    is_overtime = period_type.in_(OVERTIME_PERIODS)
+    is_shootout = period_type == 'SO'
+    home_won = Game.home_score > Game.away_score
+
+    def perspective(team, opponent, goals_for, goals_against, won):
+        return select(
+            team.label('team'),
+            opponent.label('opponent'),
+            goals_for.label('gf'),
+            goals_against.label('ga'),
+            case((won, 1), else_=0).label('win'),
+            case((and_(won, ~is_overtime), 1), else_=0).label('rw'),
+            case((and_(won, ~is_shootout), 1), else_=0).label('row'),
+            case((and_(~won, ~is_overtime), 1), else_=0).label('loss'),
+            case((and_(~won, is_overtime), 1), else_=0).label('otl')
+        ).where(in_range)
+
+    results = union_all(
+        perspective(Game.home_team_abbrev, Game.away_team_abbrev, Game.home_score, Game.away_score, home_won),
+        perspective(Game.away_team_abbrev, Game.home_team_abbrev, Game.away_score, Game.home_score, ~home_won)
+    ).subquery()
+
+    return select(
+        results.c.team,
+        results.c.opponent,
+        func.count().label('gp'),
+        func.sum(results.c.win).label('wins'),
+        func.sum(results.c.rw).label('rw'),
+        func.sum(results.c.row).label('row'),
+        func.sum(results.c.loss).label('losses'),
+        func.sum(results.c.otl).label('otl'),
+        func.sum(results.c.gf).label('gf'),
+        func.sum(results.c.ga).label('ga')
+    ).group_by(results.c.team, results.c.opponent)
+
+def _pairwise_results(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    season: str,
+    abbrevs: Iterable[str]
+):
+    return db.execute(pairwise_query(start_date, end_date, season, abbrevs)).all()
+
+def head_to_head_points(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    season: str,
+    abbrevs: Iterable[str]
+) -> HeadToHead:
+    """Pairwise points matrix for the range, from one grouped query"""
+    head_to_head = {}
+    for row in _pairwise_results(db, start_date, end_date, season, abbrevs):
+        head_to_head.setdefault(row.team, {})[row.opponent] = 2 * row.wins + row.otl
+    return head_to_head
+
+def _standings_from_pairwise(pairwise_rows, teams) -> Dict:
+    """
+    Standings for the given teams from (team, opponent) rows, counting only
+    games where both sides are among them - so one league-wide pairwise
+    result serves any division/conference view of the same window.
+    """
+    team_stats = {team.abbrev: new_standings_row(team.to_dict()) for team in teams}
+    head_to_head = {}
+    for row in pairwise_rows:
+        if row.team not in team_stats or row.opponent not in team_stats:
+            continue
+        stats = team_stats[row.team]
+        stats['gamesPlayed'] += row.gp
+        stats['wins'] += row.wins
+        stats['regulationWins'] += row.rw
+        stats['regulationPlusOtWins'] += row.row
+        stats['losses'] += row.losses
+        stats['otLosses'] += row.otl
+        stats['points'] += 2 * row.wins + row.otl
+        stats['goalFor'] += row.gf
+        stats['goalAgainst'] += row.ga
+        stats['goalDifferential'] = stats['goalFor'] - stats['goalAgainst']
+        head_to_head.setdefault(row.team, {})[row.opponent] = 2 * row.wins + row.otl
+
+    return {'standings': sort_standings(team_stats, head_to_head)}
+
+def calculate_standings_sql(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    season: str,
+    division: Optional[str] = None,
+    conference: Optional[str] = None
+) -> Dict:
+    """
+    Calculate standings with a single grouped query.
+    Rows come back per (team, opponent), so the same result set gives both
+    the team totals and the head-to-head points used for tiebreaks. Same
+    output as calculate_standings_from_db, including that filtered
+    standings only count games between teams inside the filter.
+    """
+    teams = get_team_directory(db).select(division, conference)
+    if not teams:
+        return {'standings': []}
+
+    abbrevs = [team.abbrev for team in teams]
+    return _standings_from_pairwise(_pairwise_results(db, start_date, end_date, season, abbrevs), teams)
+
+def calculate_standings_batch(db: Session, views: List[Dict]) -> List[Dict]:
+    """
+    Standings for many views at once. Each view is a dict of season,
+    start_date, end_date (dates), division and conference. Every distinct
+    (season, start, end) window is aggregated once for the whole league
+    and all of its views are cut from that result.
+    """
+    directory = get_team_directory(db)
+    windows = {}
+    results = []
+    for view in views:
+        window = (view['season'], view['start_date'], view['end_date'])
+        if window not in windows:
+            windows[window] = _pairwise_results(
+                db, view['start_date'], view['end_date'], view['season'], directory.by_abbrev
+            )
+        teams = directory.select(view.get('division'), view.get('conference'))
+        results.append(_standings_from_pairwise(windows[window], teams))
+    return results
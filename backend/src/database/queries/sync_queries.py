@@ -0,0 +1,26 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from datetime import datetime, timezone
+from ..models import SyncGeneration
+
+TEAMS_SCOPE = 'teams'
+
+def get_sync_generation(db: Session, scope: str) -> int:
+    """Current data version of a season (or 'teams'); 0 if never synced"""
+    generation = db.execute(
+        select(SyncGeneration.generation).where(SyncGeneration.scope == scope)
+    ).scalar()
+    return generation or 0
+
+def bump_sync_generation(db: Session, scope: str) -> int:
+    """Record that data in this scope changed - returns the new generation"""
+    now = datetime.now(timezone.utc)
+    result = db.execute(
+        update(SyncGeneration)
+        .where(SyncGeneration.scope == scope)
+        .values(generation=SyncGeneration.generation + 1, updated_at=now)
+    )
+    if result.rowcount == 0:
+        db.add(SyncGeneration(scope=scope, generation=1, updated_at=now))
+    db.commit()
+    return get_sync_generation(db, scope)
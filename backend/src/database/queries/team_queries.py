@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Dict, List, Optional
 from ..models import Team
+from .bulk_queries import bulk_upsert
 
 def get_all_teams(db: Session) -> List[Team]:
     """Get all teams from database"""
@@ -27,9 +28,6 @@ def upsert_team(db: Session, team_data: dict) -> Team:
     db.refresh(team)
     return team
 
-def bulk_upsert_teams(db: Session, teams_data: List[dict]) -> List[Team]:
-    """Bulk insert or update teams"""
-    teams = []
-    for team_data in teams_data:
-        teams.append(upsert_team(db, team_data))
-    return teams
\ No newline at end of file
+def bulk_upsert_teams(db: Session, teams_data: List[dict]) -> Dict:
+    """Bulk insert or update teams - returns inserted/updated/unchanged counts"""
+    return bulk_upsert(db, Team, teams_data, key='abbrev')
\ No newline at end of file
@@ -0,0 +1,79 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, select
+from typing import Dict, Optional
+from datetime import date
+from ..models import Game
+from ..team_directory import get_team_directory
+from .standings_queries import COMPLETED_STATES, add_game_result, new_standings_row, sort_standings
+
+def calculate_standings_timeline(
+    db: Session,
+    season: str,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    division: Optional[str] = None,
+    conference: Optional[str] = None
+) -> Dict:
+    """
+    Cumulative standings as of every game date, in one pass over the
+    season's games in date order. Same point rules and filter semantics
+    as calculate_standings_from_db (only games between teams inside the
+    filter count).
+
+    Columnar payload: `teams` lists abbrevs in id order and each of
+    `points`, `gamesPlayed` and `rank` holds one row per entry in `dates`,
+    aligned with `teams`. Ranks follow sort_standings ordering; teams that
+    haven't played yet have rank None. start_date/end_date only trim
+    which dates are returned - totals always accumulate from the start of
+    the season.
+    """
+    teams = get_team_directory(db).select(division, conference)
+    abbrevs = [team.abbrev for team in teams]
+    timeline = {'season': season, 'teams': abbrevs, 'dates': [], 'points': [], 'gamesPlayed': [], 'rank': []}
+    if not teams:
+        return timeline
+
+    conditions = [
+        Game.season == season,
+        Game.game_state.in_(COMPLETED_STATES),
+        Game.home_team_abbrev.in_(abbrevs),
+        Game.away_team_abbrev.in_(abbrevs)
+    ]
+    if end_date:
+        conditions.append(Game.game_date <= end_date)
+    games = db.execute(
+        select(
+            Game.game_date, Game.home_team_abbrev, Game.away_team_abbrev,
+            Game.home_score, Game.away_score, Game.period_type
+        ).where(and_(*conditions)).order_by(Game.game_date)
+    ).all()
+
+    # Running standings rows and pairwise points, updated game by game
+    team_stats = {team.abbrev: new_standings_row(team.to_dict()) for team in teams}
+    head_to_head = {}
+
+    def snapshot(game_date: date):
+        position = {
+            stats['teamAbbrev']['default']: rank
+            for rank, stats in enumerate(sort_standings(team_stats, head_to_head), start=1)
+        }
+        timeline['dates'].append(game_date.isoformat())
+        timeline['points'].append([team_stats[abbrev]['points'] for abbrev in abbrevs])
+        timeline['gamesPlayed'].append([team_stats[abbrev]['gamesPlayed'] for abbrev in abbrevs])
+        timeline['rank'].append([position.get(abbrev) for abbrev in abbrevs])
+
+    current_date = None
+    for game in games:
+        # A date's totals are complete once the next date starts
+        if current_date is not None and game.game_date != current_date and (not start_date or current_date >= start_date):
+            snapshot(current_date)
+        current_date = game.game_date
+
+        add_game_result(
+            team_stats, head_to_head, game.home_team_abbrev, game.away_team_abbrev,
+            game.home_score, game.away_score, game.period_type
+        )
+
+    if current_date is not None and (not start_date or current_date >= start_date):
+        snapshot(current_date)
+    return timeline
@@ -0,0 +1,76 @@
+from sqlalchemy.orm import Session
+from typing import Dict, Iterable, Optional, Tuple
+from datetime import date
+import numpy as np
+from ..game_store import STATS, get_season_store
+from ..team_directory import get_team_directory
+from .standings_queries import new_standings_row, sort_standings
+
+def _team_mask(db: Session, teams: Tuple[str, ...], division: Optional[str], conference: Optional[str]):
+    """Boolean mask over the store's teams for the filter, or None when unfiltered"""
+    if not division and not conference:
+        return None
+    selected = {team.abbrev for team in get_team_directory(db).select(division, conference)}
+    return np.array([abbrev in selected for abbrev in teams], dtype=bool)
+
+def calculate_standings_ranges(
+    db: Session,
+    season: str,
+    ranges: Iterable[Tuple[date, date]],
+    division: Optional[str] = None,
+    conference: Optional[str] = None
+) -> Dict:
+    """
+    Standings for many inclusive date ranges in one vectorized call, using
+    prefix sums over the season's columnar game store. Same point rules
+    and filter semantics as calculate_standings_from_db.
+
+    Columnar and unsorted: `teams` lists the (filtered) abbrevs and each
+    stat holds one row per entry in `ranges`, aligned with `teams`.
+    """
+    ranges = list(ranges)
+    store = get_season_store(db, season)
+    mask = _team_mask(db, store.teams, division, conference)
+    columns = np.arange(len(store.teams)) if mask is None else np.flatnonzero(mask)
+
+    totals = store.range_totals([r[0] for r in ranges], [r[1] for r in ranges], mask)[:, columns]
+    result = {
+        'season': season,
+        'teams': [store.teams[i] for i in columns],
+        'ranges': [{'startDate': start.isoformat(), 'endDate': end.isoformat()} for start, end in ranges]
+    }
+    for i, stat in enumerate(STATS):
+        result[stat] = totals[:, :, i].tolist()
+    result['goalDifferential'] = (totals[:, :, STATS.index('goalFor')] - totals[:, :, STATS.index('goalAgainst')]).tolist()
+    return result
+
+def calculate_standings_vectorized(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    season: str,
+    division: Optional[str] = None,
+    conference: Optional[str] = None
+) -> Dict:
+    """
+    Single-range standings from the columnar store, in the usual sorted
+    shape. Head-to-head tiebreak points come from a pairwise matrix built
+    over the same slice of games.
+    """
+    ranges = calculate_standings_ranges(db, season, [(start_date, end_date)], division, conference)
+    directory = get_team_directory(db)
+
+    team_stats = {}
+    for column, abbrev in enumerate(ranges['teams']):
+        stats = new_standings_row(directory.by_abbrev[abbrev].to_dict())
+        for stat in STATS + ('goalDifferential',):
+            stats[stat] = ranges[stat][0][column]
+        team_stats[abbrev] = stats
+    store = get_season_store(db, season)
+    mask = _team_mask(db, store.teams, division, conference)
+    matrix = store.head_to_head(start_date, end_date, mask)
+    head_to_head = {
+        store.teams[i]: {store.teams[j]: int(points) for j, points in enumerate(row) if points}
+        for i, row in enumerate(matrix)
+    }
+    return {'standings': sort_standings(team_stats, head_to_head)}
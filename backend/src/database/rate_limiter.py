@@ -0,0 +1,29 @@
+import threading
+import time
+from typing import Optional
+
+class RateLimiter:
+    """
+    Thread-safe requests-per-second cap.
+    Each call to wait() reserves the next free slot and sleeps until it
+    arrives, so N workers together never exceed the configured rate.
+    """
+
+    def __init__(self, requests_per_second: Optional[float]):
+        self.interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self):
+        """Block until the caller is allowed to make its next request"""
+        if not self.interval:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
@@ -0,0 +1,80 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+import logging
+import os
+import threading
+from ..core.metrics import SYNC_ERRORS
+from .config import SessionLocal
+
+# Worker threads for background syncs (one keeps upstream traffic polite)
+REFRESH_MAX_WORKERS = int(os.getenv("REFRESH_MAX_WORKERS", "1"))
+
+# A season that finished syncing this recently isn't re-synced on demand
+REFRESH_MIN_INTERVAL_SECONDS = int(os.getenv("REFRESH_MIN_INTERVAL_SECONDS", "300"))
+
+logger = logging.getLogger(__name__)
+
+class RefreshScheduler:
+    """
+    Runs season syncs in the background, off the request path.
+    Demands for the same season are single-flight: while a sync is running,
+    every caller gets the same Future instead of starting another one.
+    """
+
+    def __init__(self, sync_service, session_factory=SessionLocal):
+        self.sync_service = sync_service
+        self.session_factory = session_factory
+        self.min_interval = timedelta(seconds=REFRESH_MIN_INTERVAL_SECONDS)
+        self._executor = ThreadPoolExecutor(
+            max_workers=REFRESH_MAX_WORKERS, thread_name_prefix="season-refresh"
+        )
+        self._lock = threading.Lock()
+        self._running: Dict[str, Future] = {}
+        self._last_synced: Dict[str, datetime] = {}
+
+    def request_refresh(self, season: str, force: bool = False) -> Optional[Future]:
+        """
+        Schedule a sync of the season unless one is already running (its
+        Future is returned) or one finished within the minimum interval
+        (None is returned). force skips the interval check only.
+        """
+        with self._lock:
+            running = self._running.get(season)
+            if running:
+                return running
+
+            last_synced = self._last_synced.get(season)
+            if not force and last_synced and datetime.now(timezone.utc) - last_synced < self.min_interval:
+                return None
+
+            future = self._executor.submit(self._run, season)
+            self._running[season] = future
+            return future
+
+    def _run(self, season: str) -> int:
+        db = self.session_factory()
+        try:
+            return self.sync_service.sync_current_season(db, season)
+        except Exception:
+            # Nobody may ever look at the Future - make the failure visible here
+            logger.exception("Background sync of %s failed", season)
+            SYNC_ERRORS.inc(stage='refresh')
+            raise
+        finally:
+            db.close()
+            with self._lock:
+                self._running.pop(season, None)
+                self._last_synced[season] = datetime.now(timezone.utc)
+
+    def is_refreshing(self, season: str) -> bool:
+        with self._lock:
+            return season in self._running
+
+    def last_synced_at(self, season: str) -> Optional[datetime]:
+        with self._lock:
+            return self._last_synced.get(season)
+
+    def shutdown(self):
+        """Stop accepting work; queued syncs are cancelled, a running one finishes"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
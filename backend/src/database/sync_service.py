@@ -1,22 +1,86 @@
-from nhlpy import NHLClient
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import List, Optional, Tuple
+import logging
+import os
+import threading
+import time
+from .rate_limiter import RateLimiter
+from ..sports.nhl.client import NHLClientProtocol, create_nhl_client
+from ..core.metrics import SYNC_ERRORS, SYNC_LAST_RUN_GAMES, SYNC_LAST_RUN_TIMESTAMP, SYNC_RUNS, instrument_client
+from .team_directory import get_team_directory, load_team_directory
 from .queries import (
     bulk_upsert_teams,
     bulk_upsert_games,
-    get_latest_game_date
+    get_latest_game_date,
+    refresh_team_daily_cumulative,
+    refresh_game_participants,
+    store_standings_snapshot,
+    bump_sync_generation,
+    season_first_day,
+    season_last_day,
+    record_sync_ledger,
+    get_ledger_end,
+    get_unfinished_dates,
+    get_pending_game_ids,
+    TEAMS_SCOPE
 )
 
+# Upstream fetch concurrency and politeness limits
+SYNC_MAX_WORKERS = int(os.getenv("SYNC_MAX_WORKERS", "8"))
+SYNC_REQUESTS_PER_SECOND = float(os.getenv("SYNC_REQUESTS_PER_SECOND", "10"))
+
+# How schedule data is requested upstream:
+#   weekly      - one call per week, clamped to the season's first/last scheduled dates
+#   team_season - one call per team for the whole season (fixed cost, ~32 calls)
+#   daily       - one call per day (the original behaviour)
+FETCH_STRATEGIES = ('weekly', 'team_season', 'daily')
+SYNC_FETCH_STRATEGY = os.getenv("SYNC_FETCH_STRATEGY", "weekly")
+
+# Parsed games are buffered and written once this many are pending
+WRITE_BATCH_SIZE = 500
+
+logger = logging.getLogger(__name__)
+
+# A game needs no further syncing once it's over or won't be played on its date
+FINAL_GAME_STATES = ('OFF', 'FINAL')
+FINAL_SCHEDULE_STATES = ('PPD', 'CNCL')
+
 class DatabaseSyncService:
     """Service to sync NHL data to database"""
     
-    def __init__(self):
-        self.client = NHLClient()
+    def __init__(
+        self,
+        client: Optional[NHLClientProtocol] = None,
+        max_workers: Optional[int] = None,
+        requests_per_second: Optional[float] = None,
+        fetch_strategy: Optional[str] = None
+    ):
+        # Any NHLClientProtocol can be injected (e.g. recorded fixtures for benchmarks);
+        # every call is timed per endpoint for /api/metrics
+        self.client = instrument_client(client or create_nhl_client())
+        self.max_workers = max_workers or SYNC_MAX_WORKERS
+        self.rate_limiter = RateLimiter(
+            SYNC_REQUESTS_PER_SECOND if requests_per_second is None else requests_per_second
+        )
+        self.fetch_strategy = fetch_strategy or SYNC_FETCH_STRATEGY
+        # Upstream call accounting (total, and for the most recent sync)
+        self._calls_lock = threading.Lock()
+        self.upstream_calls = 0
+        self.last_upstream_calls = 0
+        # Failed upstream fetches (their chunks were skipped)
+        self.fetch_errors = 0
+        # Called as listener(season, changed_dates) after a sync writes games
+        self.write_listeners = []
+        # inserted/updated/unchanged counts from the most recent sync
+        self.last_sync_counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+        # False when the most recent sync lost games to a failed fetch or write
+        self.last_sync_complete = True
     
     def sync_teams(self, db: Session):
         """Sync all teams to database"""
-        teams_data = self.client.teams.teams()
+        teams_data = self._call_upstream(self.client.teams.teams)
         
         teams_to_upsert = []
         for team in teams_data:
@@ -29,7 +93,11 @@ class DatabaseSyncService:
                 'metadata_json': team
             })
         
-        bulk_upsert_teams(db, teams_to_upsert)
+        counts = bulk_upsert_teams(db, teams_to_upsert)
+        if counts['changed']:
+            bump_sync_generation(db, TEAMS_SCOPE)
+        load_team_directory(db)
+        self.last_sync_counts = self._tally({}, counts)
         return len(teams_to_upsert)
     
     def sync_games_for_date_range(
@@ -37,86 +105,434 @@ class DatabaseSyncService:
         db: Session, 
         start_date: datetime, 
         end_date: datetime,
-        season: str
+        season: str,
+        strategy: Optional[str] = None
     ):
-        """Sync games for a specific date range"""
-        current_date = start_date
+        """
+        Sync games for a specific date range.
+        Schedule chunks (weeks, team seasons or single days depending on the
+        fetch strategy) are fetched by a bounded pool of workers (rate
+        limited), while this thread is the single DB writer, flushing games
+        in batches.
+        """
+        strategy = self._resolve_strategy(strategy)
+        start_day, end_day = start_date.date(), end_date.date()
+        calls_before = self.upstream_calls
+        errors_before = self.fetch_errors
+        
+        if strategy == 'weekly':
+            chunks = self._iter_weekly(start_day, end_day, season)
+        elif strategy == 'team_season':
+            chunks = self._iter_team_season(db, start_day, end_day, season)
+        else:
+            chunks = self._iter_daily(start_day, end_day)
+        
         games_synced = 0
-        days_checked = 0
+        chunks_checked = 0
+        write_failed = False
+        counts = {'changed_dates': set()}
+        pending = []
+        # schedule date -> [(game id, finished?)] for the sync ledger
+        schedule = {}
         
-        print(f"   Syncing from {start_date.date()} to {end_date.date()}")
+        print(f"   Syncing from {start_day} to {end_day} ({strategy} strategy, {self.max_workers} workers)")
         
-        while current_date <= end_date:
-            date_str = current_date.strftime('%Y-%m-%d')
-            days_checked += 1
+        for games_list in chunks:
+            chunks_checked += 1
+            pending.extend(self._parse_games(games_list, season))
+            self._track_schedule(games_list, schedule)
             
-            if days_checked % 10 == 0:
-                print(f"   Progress: {days_checked} days checked, {games_synced} games synced...")
+            if len(pending) >= WRITE_BATCH_SIZE:
+                written, failed = self._write_games(db, pending, counts)
+                games_synced += written
+                write_failed = write_failed or failed
+                pending = []
             
+            if chunks_checked % 10 == 0:
+                print(f"   Progress: {chunks_checked} schedule chunks checked, {games_synced} games synced...")
+        
+        written, failed = self._write_games(db, pending, counts)
+        games_synced += written
+        write_failed = write_failed or failed
+        
+        # A failed fetch or write leaves holes we can't see, so nothing is marked final this run
+        complete = self.fetch_errors == errors_before and not write_failed
+        self._record_ledger(db, season, start_day, end_day, schedule, complete)
+        
+        if counts['changed_dates']:
+            # Keep the derived tables in step with the games just written
+            refresh_game_participants(db, season, counts['changed_dates'])
+            refresh_team_daily_cumulative(db, season, since=min(counts['changed_dates']))
+            bump_sync_generation(db, season)
+            for listener in self.write_listeners:
+                listener(season, counts['changed_dates'])
+        
+        self.last_sync_counts = self._tally({}, counts)
+        self.last_sync_complete = complete
+        self.last_upstream_calls = self.upstream_calls - calls_before
+        SYNC_RUNS.inc(season=season, strategy=strategy)
+        SYNC_LAST_RUN_GAMES.set(games_synced, season=season)
+        SYNC_LAST_RUN_TIMESTAMP.set(time.time(), season=season)
+        print(f"   Completed: {games_synced} total games synced using {self.last_upstream_calls} upstream calls ({strategy})")
+        print("   ({inserted} inserted, {updated} updated, {unchanged} unchanged)".format(**self.last_sync_counts))
+        return games_synced
+    
+    def sync_standings_snapshots(
+        self,
+        db: Session,
+        season: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> int:
+        """
+        Store official league standings snapshots for each day in the range
+        (default: just end_date, which defaults to today). Days are fetched
+        concurrently but stored in date order so only changes are written.
+        Returns the number of team rows written.
+        """
+        end_date = end_date or datetime.now().date()
+        start_date = start_date or end_date
+        
+        days = []
+        current_day = start_date
+        while current_day <= end_date:
+            days.append(current_day)
+            current_day += timedelta(days=1)
+        
+        fetch = lambda day: (day, self.client.standings.league_standings(date=day.isoformat()))
+        payloads = sorted(
+            (result for result in self._fetch_concurrently(fetch, days) if result),
+            key=lambda result: result[0]
+        )
+        
+        rows_written = 0
+        for day, standings in payloads:
+            rows_written += store_standings_snapshot(db, season, day, standings)
+        
+        print(f"   Standings snapshots: {len(payloads)} days fetched, {rows_written} team rows changed")
+        return rows_written
+    
+    @staticmethod
+    def _days_between(first_day: date, last_day: date) -> List[date]:
+        return [first_day + timedelta(days=i) for i in range((last_day - first_day).days + 1)]
+    
+    @staticmethod
+    def _contiguous_ranges(days: List[date]) -> List[tuple]:
+        """Group sorted dates into (first, last) runs of consecutive days"""
+        ranges = []
+        for day in days:
+            if ranges and day == ranges[-1][1] + timedelta(days=1):
+                ranges[-1] = (ranges[-1][0], day)
+            else:
+                ranges.append((day, day))
+        return ranges
+    
+    def _resolve_strategy(self, strategy: Optional[str]) -> str:
+        """Pick the requested fetch strategy, degrading to daily if the client can't do it"""
+        strategy = strategy or self.fetch_strategy
+        if strategy not in FETCH_STRATEGIES:
+            raise ValueError(f"Unknown fetch strategy '{strategy}', expected one of {FETCH_STRATEGIES}")
+        
+        required = {'weekly': 'weekly_schedule', 'team_season': 'team_season_schedule'}.get(strategy)
+        if required and not hasattr(self.client.schedule, required):
+            return 'daily'
+        return strategy
+    
+    def _call_upstream(self, fetch, *args):
+        """Make one rate-limited upstream call, counting it"""
+        self.rate_limiter.wait()
+        with self._calls_lock:
+            self.upstream_calls += 1
+        return fetch(*args)
+    
+    def _fetch_concurrently(self, fetch, keys: List):
+        """
+        Run fetch(key) for every key on the worker pool and yield the results
+        as they complete. Failed fetches yield an empty list so one bad chunk
+        doesn't crash the sync.
+        """
+        def guarded(key):
             try:
-                daily_games = self.client.schedule.daily_schedule(date=date_str)
-                games_list = daily_games if isinstance(daily_games, list) else daily_games.get('games', [])
-                
-                games_to_upsert = []
-                for game in games_list:
-                    # SKIP non-NHL games (game_type 2 = regular season, 3 = playoffs)
-                    game_type = game.get('gameType', 0)
-                    if game_type not in [2, 3]:
-                        continue
-                    
-                    start_time_str = game.get('startTimeUTC', '')
-                    if not start_time_str:
-                        continue
-                    
-                    try:
-                        game_date = datetime.fromisoformat(start_time_str.replace('Z', '+00:00')).date()
-                    except:
-                        continue
-                    
-                    home_abbrev = game.get('homeTeam', {}).get('abbrev')
-                    away_abbrev = game.get('awayTeam', {}).get('abbrev')
-                    
-                    if not home_abbrev or not away_abbrev:
-                        continue
-                    
-                    games_to_upsert.append({
-                        'id': game.get('id'),
-                        'game_date': game_date,
-                        'season': season,
-                        'game_type': game_type,
-                        'game_state': game.get('gameState', ''),
-                        'home_team_abbrev': home_abbrev,
-                        'away_team_abbrev': away_abbrev,
-                        'home_score': game.get('homeTeam', {}).get('score', 0),
-                        'away_score': game.get('awayTeam', {}).get('score', 0),
-                        'period_type': game.get('periodDescriptor', {}).get('periodType', 'REG')
-                    })
-                
-                if games_to_upsert:
-                    bulk_upsert_games(db, games_to_upsert)
-                    games_synced += len(games_to_upsert)
+                return self._call_upstream(fetch, key)
+            except Exception:
+                # Don't crash the sync over one chunk, but leave a trace
+                logger.warning("Upstream fetch failed for %s", key, exc_info=True)
+                SYNC_ERRORS.inc(stage='fetch')
+                with self._calls_lock:
+                    self.fetch_errors += 1
+                return []
+        
+        if self.max_workers <= 1:
+            for key in keys:
+                yield guarded(key)
+            return
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(guarded, key) for key in keys]
+            for future in as_completed(futures):
+                yield future.result()
+    
+    def _iter_daily(self, start_day: date, end_day: date):
+        """One call per day in the range"""
+        days = []
+        current_day = start_day
+        while current_day <= end_day:
+            days.append(current_day.isoformat())
+            current_day += timedelta(days=1)
+        
+        yield from self._fetch_concurrently(self._fetch_day, days)
+    
+    def _fetch_day(self, date_str: str) -> List[dict]:
+        """Fetch the raw games scheduled on one day"""
+        daily_games = self.client.schedule.daily_schedule(date=date_str)
+        return daily_games if isinstance(daily_games, list) else daily_games.get('games', [])
+    
+    def _iter_weekly(self, start_day: date, end_day: date, season: str):
+        """
+        One call per week. The first week's payload carries the season's
+        start and end dates, which are used to drop pre-season and
+        off-season days before planning the remaining weeks.
+        """
+        try:
+            first_week = self._call_upstream(self.client.schedule.weekly_schedule, start_day.isoformat())
+        except Exception:
+            logger.warning("Weekly schedule probe failed for %s", start_day, exc_info=True)
+            SYNC_ERRORS.inc(stage='fetch')
+            with self._calls_lock:
+                self.fetch_errors += 1
+            first_week = {}
+        
+        season_start = self._parse_day(first_week.get('regularSeasonStartDate'))
+        season_end = self._parse_day(first_week.get('playoffEndDate') or first_week.get('regularSeasonEndDate'))
+        
+        # Off-season probes can describe a neighbouring season - only clamp to our own
+        if season_start and season_end and season_start.year == int(season[:4]):
+            start_day = max(start_day, season_start)
+            end_day = min(end_day, season_end)
+        
+        if start_day > end_day:
+            return
+        
+        week_starts = []
+        current_day = start_day
+        while current_day <= end_day:
+            week_starts.append(current_day)
+            current_day += timedelta(days=7)
+        
+        # Reuse the first payload when it already covers the first planned week
+        if first_week.get('gameWeek') and week_starts[0] == self._parse_day(first_week['gameWeek'][0].get('date')):
+            yield self._games_in_week(first_week, start_day, end_day)
+            week_starts = week_starts[1:]
+        
+        fetch_week = lambda week_start: self._games_in_week(
+            self.client.schedule.weekly_schedule(week_start.isoformat()), start_day, end_day
+        )
+        yield from self._fetch_concurrently(fetch_week, week_starts)
+    
+    def _games_in_week(self, week: dict, start_day: date, end_day: date) -> List[dict]:
+        """Flatten a weekly payload into games, keeping only days inside the range"""
+        games = []
+        for day in week.get('gameWeek', []):
+            game_day = self._parse_day(day.get('date'))
+            if game_day and start_day <= game_day <= end_day:
+                games.extend(day.get('games', []))
+        return games
+    
+    def _iter_team_season(self, db: Session, start_day: date, end_day: date, season: str):
+        """
+        One call per team for the whole season, de-duplicated by game id
+        since every game appears in both teams' schedules.
+        """
+        abbrevs = list(get_team_directory(db).by_abbrev)
+        if not abbrevs:
+            abbrevs = [team.get('abbr') for team in self._call_upstream(self.client.teams.teams)]
+        
+        fetch_team = lambda abbrev: self.client.schedule.team_season_schedule(abbrev, season).get('games', [])
+        
+        seen = set()
+        for games_list in self._fetch_concurrently(fetch_team, abbrevs):
+            games = []
+            for game in games_list:
+                game_day = self._parse_day(game.get('gameDate') or game.get('startTimeUTC', '')[:10])
+                if game.get('id') in seen or not game_day or not start_day <= game_day <= end_day:
+                    continue
+                seen.add(game.get('id'))
+                games.append(game)
+            yield games
+    
+    @staticmethod
+    def _parse_day(value: Optional[str]) -> Optional[date]:
+        """Parse a YYYY-MM-DD string from the API, tolerating missing values"""
+        try:
+            return date.fromisoformat(value[:10]) if value else None
+        except ValueError:
+            return None
+    
+    def _schedule_day(self, game: dict) -> Optional[date]:
+        """
+        The date a game is listed under in the schedule (US Eastern), which
+        can differ from the UTC date stored in games.game_date.
+        """
+        if game.get('gameDate'):
+            return self._parse_day(game['gameDate'])
+        
+        start_time_str = game.get('startTimeUTC', '')
+        try:
+            start_time = datetime.fromisoformat(start_time_str.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+        offset = game.get('easternUTCOffset')
+        if offset:
+            sign = -1 if offset.startswith('-') else 1
+            hours, minutes = offset.lstrip('+-').split(':')
+            start_time += sign * timedelta(hours=int(hours), minutes=int(minutes))
+        return start_time.date()
+    
+    def _track_schedule(self, games_list: List[dict], schedule: dict):
+        """Note each NHL game's schedule date and whether it needs syncing again"""
+        for game in games_list:
+            if game.get('gameType', 0) not in [2, 3]:
+                continue
+            day = self._schedule_day(game)
+            if day is None:
+                continue
+            finished = (
+                game.get('gameState') in FINAL_GAME_STATES
+                or game.get('gameScheduleState') in FINAL_SCHEDULE_STATES
+            )
+            schedule.setdefault(day, []).append((game.get('id'), finished))
+    
+    def _record_ledger(
+        self,
+        db: Session,
+        season: str,
+        start_day: date,
+        end_day: date,
+        schedule: dict,
+        complete: bool
+    ):
+        """
+        Write the ledger for every date in the synced range. A date is final
+        when the fetch was complete, none of its games are unfinished and it
+        isn't today or later with nothing played yet.
+        """
+        today = datetime.now().date()
+        days = {}
+        current_day = start_day
+        while current_day <= end_day:
+            games = schedule.get(current_day, [])
+            unfinished = sorted(game_id for game_id, finished in games if not finished)
+            is_final = complete and not unfinished and (current_day < today or bool(games))
+            days[current_day] = (is_final, unfinished)
+            current_day += timedelta(days=1)
+        record_sync_ledger(db, season, days)
+    
+    def _parse_games(self, games_list: List[dict], season: str) -> List[dict]:
+        """Turn raw schedule games into rows for the games table"""
+        games_to_upsert = []
+        for game in games_list:
+            # SKIP non-NHL games (game_type 2 = regular season, 3 = playoffs)
+            game_type = game.get('gameType', 0)
+            if game_type not in [2, 3]:
+                continue
+            
+            start_time_str = game.get('startTimeUTC', '')
+            if not start_time_str:
+                continue
+            
+            try:
+                game_date = datetime.fromisoformat(start_time_str.replace('Z', '+00:00')).date()
+            except:
+                continue
+            
+            home_abbrev = game.get('homeTeam', {}).get('abbrev')
+            away_abbrev = game.get('awayTeam', {}).get('abbrev')
             
-            except Exception as e:
-                # Silently continue on errors (don't crash sync)
-                pass
+            if not home_abbrev or not away_abbrev:
+                continue
             
-            current_date += timedelta(days=1)
+            games_to_upsert.append({
+                'id': game.get('id'),
+                'game_date': game_date,
+                'season': season,
+                'game_type': game_type,
+                'game_state': game.get('gameState', ''),
+                'home_team_abbrev': home_abbrev,
+                'away_team_abbrev': away_abbrev,
+                'home_score': game.get('homeTeam', {}).get('score', 0),
+                'away_score': game.get('awayTeam', {}).get('score', 0),
+                'period_type': game.get('periodDescriptor', {}).get('periodType', 'REG')
+            })
+        return games_to_upsert
+    
+    def _write_games(self, db: Session, games_to_upsert: List[dict], counts: dict) -> Tuple[int, bool]:
+        """
+        Write one batch of parsed games and add its counts to the running
+        totals. Returns (games written, whether the write failed).
+        """
+        if not games_to_upsert:
+            return 0, False
+        try:
+            result = bulk_upsert_games(db, games_to_upsert)
+        except Exception:
+            logger.error("Writing %d games failed", len(games_to_upsert), exc_info=True)
+            SYNC_ERRORS.inc(stage='write')
+            db.rollback()
+            return 0, True
         
-        print(f"   Completed: {days_checked} days checked, {games_synced} total games synced")
-        return games_synced
+        self._tally(counts, result)
+        changed = set(result['changed'])
+        counts['changed_dates'].update(g['game_date'] for g in games_to_upsert if g['id'] in changed)
+        return len(games_to_upsert), False
+    
+    @staticmethod
+    def _tally(totals: dict, counts: dict) -> dict:
+        """Add one bulk upsert result into running inserted/updated/unchanged totals"""
+        for key in ('inserted', 'updated', 'unchanged'):
+            totals[key] = totals.get(key, 0) + counts.get(key, 0)
+        return totals
     
     def sync_current_season(self, db: Session, season: str = "20242025"):
-        """Sync entire current season"""
-        latest_date = get_latest_game_date(db, season)
+        """
+        Catch a season up using the sync ledger: dates that still hold
+        unfinished (live, scheduled, delayed) games are fetched again along
+        with dates past the last synced one. Without a ledger the whole
+        season is synced once to build it.
+        """
+        through = min(datetime.now().date(), season_last_day(season))
+        ledger_end = get_ledger_end(db, season)
         
-        if latest_date:
-            start_date = datetime.combine(latest_date, datetime.min.time()) + timedelta(days=1)
-            print(f"   Database has games up to {latest_date}")
-            print(f"   Syncing new games from {start_date.date()} onwards...")
+        if ledger_end is None:
+            first_day = season_first_day(season)
+            print(f"   No sync ledger for {season}, syncing full season from {first_day}")
+            days = self._days_between(first_day, through)
         else:
-            start_date = datetime(int(season[:4]), 10, 1)
-            print(f"   No games in database, syncing full season from {start_date.date()}")
+            unfinished = get_unfinished_dates(db, season, through)
+            new_days = self._days_between(ledger_end + timedelta(days=1), through)
+            print(f"   Ledger synced through {ledger_end}: re-checking {len(unfinished)} unfinished dates, "
+                  f"{len(new_days)} new dates")
+            days = sorted(set(unfinished) | set(new_days))
+        
+        games_synced = 0
+        for first_day, last_day in self._contiguous_ranges(days):
+            games_synced += self.sync_games_for_date_range(
+                db,
+                datetime.combine(first_day, datetime.min.time()),
+                datetime.combine(last_day, datetime.min.time()),
+                season
+            )
+        
+        pending_games = get_pending_game_ids(db, season)
+        if pending_games:
+            print(f"   {len(pending_games)} games not final yet - they'll be re-fetched next sync")
         
-        end_date = datetime.now()
+        # Official standings as of the last day with games (today, mid-season)
+        snapshot_date = min(through, get_latest_game_date(db, season) or through)
+        try:
+            self.sync_standings_snapshots(db, season, end_date=snapshot_date)
+        except Exception:
+            logger.warning("Standings snapshot for %s failed", season, exc_info=True)
+            SYNC_ERRORS.inc(stage='standings')
+            db.rollback()
         
-        return self.sync_games_for_date_range(db, start_date, end_date, season)
\ No newline at end of file
+        return games_synced
\ No newline at end of file
@@ -0,0 +1,82 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select
+from types import MappingProxyType
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+import threading
+from .models import SyncGeneration, Team
+
+class TeamInfo(NamedTuple):
+    """Compact, immutable copy of a teams row"""
+    id: int
+    abbrev: str
+    name: str
+    franchise_id: Optional[int]
+    division: Optional[str]
+    conference: Optional[str]
+
+    def to_dict(self) -> Dict:
+        """Same shape as Team.to_dict()"""
+        return self._asdict()
+
+class TeamDirectory:
+    """
+    Immutable in-process snapshot of all teams, ordered by id, with
+    division/conference indexes keyed by lower-cased name so standings
+    filters are dictionary lookups. Refreshed by swapping in a new instance.
+    """
+
+    def __init__(self, teams: Iterable[TeamInfo], generation: int = 0):
+        # teams sync generation this snapshot was loaded at
+        self.generation = generation
+        self.teams: Tuple[TeamInfo, ...] = tuple(sorted(teams, key=lambda t: t.id))
+        self.by_abbrev = MappingProxyType({t.abbrev: t for t in self.teams})
+        self.by_division = MappingProxyType(self._index(lambda t: t.division))
+        self.by_conference = MappingProxyType(self._index(lambda t: t.conference))
+
+    def _index(self, field) -> Dict[str, Tuple[TeamInfo, ...]]:
+        index = {}
+        for team in self.teams:
+            if field(team):
+                index.setdefault(field(team).lower(), []).append(team)
+        return {key: tuple(teams) for key, teams in index.items()}
+
+    def select(self, division: Optional[str] = None, conference: Optional[str] = None) -> Tuple[TeamInfo, ...]:
+        """Teams matching the (case-insensitive) filters, in id order"""
+        teams = self.teams
+        if division:
+            teams = self.by_division.get(division.lower(), ())
+        if conference:
+            in_conference = self.by_conference.get(conference.lower(), ())
+            teams = tuple(t for t in teams if t in in_conference)
+        return teams
+
+    @classmethod
+    def from_db(cls, db: Session) -> "TeamDirectory":
+        rows = db.execute(
+            select(Team.id, Team.abbrev, Team.name, Team.franchise_id, Team.division, Team.conference)
+        ).all()
+        generation = db.execute(
+            select(SyncGeneration.generation).where(SyncGeneration.scope == 'teams')
+        ).scalar()
+        return cls((TeamInfo(*row) for row in rows), generation or 0)
+
+_directory: Optional[TeamDirectory] = None
+_lock = threading.Lock()
+
+def load_team_directory(db: Session) -> TeamDirectory:
+    """(Re)load the directory from the teams table - call at startup and after syncing teams"""
+    global _directory
+    directory = TeamDirectory.from_db(db)
+    with _lock:
+        _directory = directory
+    return directory
+
+def get_team_directory(db: Optional[Session] = None) -> TeamDirectory:
+    """
+    The current directory. Loaded on first use when a session is given,
+    and retried while the teams table is still empty (e.g. during setup).
+    """
+    directory = _directory
+    if (directory is None or not directory.teams) and db is not None:
+        directory = load_team_directory(db)
+    return directory or TeamDirectory(())
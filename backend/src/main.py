@@ -1,13 +1,38 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-import os
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import PlainTextResponse
+import time
 from dotenv import load_dotenv
-from src.sports.nhl.routes import router as nhl_router
+from src.sports.nhl.routes import router as nhl_router, nhl_service
+from src.sports.nhl.live import LIVE_UPDATES_ENABLED
+from src.database.config import SessionLocal, get_pool_stats
+from src.database.team_directory import load_team_directory
+from src.core.metrics import HTTP_REQUEST_SECONDS, register_gauge_callback, render_metrics
 
 # Load environment variables
 load_dotenv()
 
-app = FastAPI(title="Kimmetrics API", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Team metadata rarely changes - keep it in memory so requests only query games
+    db = SessionLocal()
+    try:
+        load_team_directory(db)
+    except Exception as e:
+        print(f"Team directory not loaded at startup ({e}); will load on first request")
+    finally:
+        db.close()
+    # Game-night poller; idles (no upstream calls) while no games are pending
+    if LIVE_UPDATES_ENABLED:
+        nhl_service.live_updater.start()
+    yield
+    await nhl_service.live_updater.stop()
+    # Don't leave background season syncs queued past shutdown
+    nhl_service.refresh_scheduler.shutdown()
+
+app = FastAPI(title="Kimmetrics API", version="1.0.0", lifespan=lifespan)
 
 # Configure CORS
 origins = [
@@ -23,13 +48,61 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger payloads (full standings); small ones aren't worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include NHL routes
 app.include_router(nhl_router, prefix="/api/nhl", tags=["NHL"])
 
+@app.middleware("http")
+async def time_requests(request: Request, call_next):
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # Label by route template, not raw path, to keep the series count bounded
+        route = request.scope.get("route")
+        HTTP_REQUEST_SECONDS.observe(
+            time.perf_counter() - started,
+            method=request.method,
+            route=route.path if route else "unmatched",
+            status=status
+        )
+
+# Pool and cache state are read at scrape time
+register_gauge_callback(
+    "db_pool_stat", "Connection pool gauges and checkout counters",
+    lambda: {(k,): v for k, v in get_pool_stats().items() if isinstance(v, (int, float))},
+    ("stat",)
+)
+register_gauge_callback(
+    "standings_cache_stat", "Standings cache counters",
+    lambda: {(k,): v for k, v in nhl_service.standings_cache.stats().items()},
+    ("stat",)
+)
+
+register_gauge_callback(
+    "live_updates_stat", "Live update event stream counters",
+    lambda: {
+        ("clients",): nhl_service.live_updater.broadcaster.client_count,
+        ("published",): nhl_service.live_updater.broadcaster.published,
+        ("dropped",): nhl_service.live_updater.broadcaster.dropped
+    },
+    ("stat",)
+)
+
 @app.get("/")
 async def root():
     return {"message": "Kimmetrics API is running!"}
 
 @app.get("/api/health")
 async def health_check():
-    return {"status": "healthy"}
+    return {"status": "healthy", "dbPool": get_pool_stats()}
+
+@app.get("/api/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus text exposition of request, upstream, DB and sync metrics"""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
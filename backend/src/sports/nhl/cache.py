@@ -0,0 +1,127 @@
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import os
+import threading
+import time
+
+# Most standings responses kept in memory at once
+STANDINGS_CACHE_SIZE = int(os.getenv("STANDINGS_CACHE_SIZE", "256"))
+
+# Lifetime of entries that can still change (ranges reaching today or later, live API data)
+STANDINGS_CACHE_TTL_SECONDS = int(os.getenv("STANDINGS_CACHE_TTL_SECONDS", "60"))
+
+# (season, start_date, end_date, division, conference) - official standings have no start_date and
+# their as-of date (or None for the latest) as end_date
+CacheKey = Tuple[str, Optional[date], Optional[date], Optional[str], Optional[str]]
+
+class StandingsCache:
+    """
+    LRU cache of computed standings.
+    Fully historical ranges never expire - they only change when the sync
+    rewrites games inside them, which calls invalidate(). Anything touching
+    today or later (and the live league feed) expires after the TTL.
+    """
+
+    def __init__(self, max_entries: int = STANDINGS_CACHE_SIZE, ttl_seconds: int = STANDINGS_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # key -> (value, expires_at, data version it was computed from)
+        self._entries: "OrderedDict[CacheKey, Tuple[Dict, Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(
+        season: str,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        division: Optional[str],
+        conference: Optional[str]
+    ) -> CacheKey:
+        return (
+            season,
+            start_date,
+            end_date,
+            division.lower() if division else None,
+            conference.lower() if conference else None
+        )
+
+    def get(self, key: CacheKey, version: Any = None) -> Optional[Dict]:
+        """
+        Cached value for key, or None. An entry computed from a different
+        data version (e.g. another process synced in between) is a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and (entry[1] is not None and entry[1] < time.monotonic() or entry[2] != version):
+                del self._entries[key]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: CacheKey, value: Dict, version: Any = None, volatile: bool = False):
+        """Store a value; volatile ones (e.g. live API data) expire after the TTL even for past dates"""
+        end_date = key[2]
+        is_historical = not volatile and end_date is not None and end_date < datetime.now().date()
+        expires_at = None if is_historical else time.monotonic() + self.ttl_seconds
+
+        with self._lock:
+            self._entries[key] = (value, expires_at, version)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, season: str, dates: Iterable[date]):
+        """Drop cached ranges of the season that contain any of the given game dates"""
+        dates = list(dates)
+        with self._lock:
+            stale = [
+                key for key in self._entries
+                if key[0] == season and key[1] is not None
+                and any(key[1] <= day <= key[2] for day in dates)
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def covering(self, season: str, dates: Iterable[date]) -> List[Tuple[CacheKey, Dict, Any]]:
+        """(key, value, version) of cached ranges of the season containing any of the dates"""
+        dates = list(dates)
+        with self._lock:
+            return [
+                (key, entry[0], entry[2]) for key, entry in self._entries.items()
+                if key[0] == season and key[1] is not None
+                and any(key[1] <= day <= key[2] for day in dates)
+            ]
+
+    def invalidate_official(self, season: str):
+        """Drop the season's cached official (snapshot/live feed) standings"""
+        with self._lock:
+            stale = [key for key in self._entries if key[0] == season and key[1] is None]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hitRate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'size': len(self._entries),
+                'maxSize': self.max_entries,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations
+            }
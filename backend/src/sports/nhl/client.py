@@ -0,0 +1,50 @@
+"""
+The NHL API surface the app depends on, and the factory that picks an
+implementation. Services take any object matching NHLClientProtocol, so
+nhlpy's NHLClient can be swapped for a recorded stand-in (benchmarks,
+offline development) without touching them.
+"""
+
+from typing import List, Optional, Protocol
+import os
+
+# Which client create_nhl_client() builds:
+#   live                - nhlpy's NHLClient (default)
+#   recorded:<fixtures> - RecordedNHLClient replaying the fixtures directory
+NHL_CLIENT = os.getenv("NHL_CLIENT", "live")
+NHL_CLIENT_LATENCY_SECONDS = float(os.getenv("NHL_CLIENT_LATENCY_SECONDS", "0"))
+NHL_CLIENT_ERROR_RATE = float(os.getenv("NHL_CLIENT_ERROR_RATE", "0"))
+
+class ScheduleAPI(Protocol):
+    def daily_schedule(self, date: Optional[str] = None) -> dict: ...
+    def weekly_schedule(self, date: Optional[str] = None) -> dict: ...
+    def team_season_schedule(self, team_abbr: str, season: str) -> dict: ...
+
+class TeamsAPI(Protocol):
+    def teams(self, date: str = "now") -> List[dict]: ...
+
+class StandingsAPI(Protocol):
+    def league_standings(self, date: Optional[str] = None, season: Optional[str] = None) -> dict: ...
+    def season_standing_manifest(self) -> List[dict]: ...
+
+class NHLClientProtocol(Protocol):
+    schedule: ScheduleAPI
+    teams: TeamsAPI
+    standings: StandingsAPI
+
+def create_nhl_client(spec: Optional[str] = None) -> NHLClientProtocol:
+    """Build the client named by spec (default: the NHL_CLIENT setting)"""
+    spec = spec or NHL_CLIENT
+    if spec == "live":
+        from nhlpy import NHLClient
+        return NHLClient()
+
+    if spec.startswith("recorded:"):
+        from .recorded_client import RecordedNHLClient
+        return RecordedNHLClient.from_fixtures(
+            spec.split(":", 1)[1],
+            latency=NHL_CLIENT_LATENCY_SECONDS,
+            error_rate=NHL_CLIENT_ERROR_RATE
+        )
+
+    raise ValueError(f"Unknown NHL_CLIENT '{spec}', expected 'live' or 'recorded:<fixtures dir>'")
@@ -0,0 +1,211 @@
+"""
+Game-night live mode: keeps games currently being played, and the cached
+standings they feed, up to date without waiting for a request, and pushes
+what changed to browsers over server-sent events.
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import logging
+import os
+import time
+from ...core.concurrency import run_blocking
+from ...core.events import EventBroadcaster
+from ...database.config import SessionLocal
+from ...database.queries import (
+    get_game_seasons,
+    get_games_by_ids,
+    get_ledger_end,
+    get_unfinished_days,
+    season_last_day
+)
+from ...database.queries.standings_queries import (
+    COMPLETED_STATES,
+    add_game_result,
+    needs_head_to_head,
+    new_standings_row,
+    sort_standings
+)
+from ...database.team_directory import get_team_directory
+
+logger = logging.getLogger(__name__)
+
+LIVE_UPDATES_ENABLED = os.getenv("LIVE_UPDATES_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# How often days with a game in progress are re-fetched
+LIVE_POLL_SECONDS = int(os.getenv("LIVE_POLL_SECONDS", "30"))
+
+# How often days whose games haven't started yet are checked for a start
+LIVE_IDLE_POLL_SECONDS = int(os.getenv("LIVE_IDLE_POLL_SECONDS", "300"))
+
+LIVE_GAME_STATES = ('LIVE', 'CRIT')
+
+# Standings fields a finished game changes, sent as per-team increments
+DELTA_FIELDS = (
+    'gamesPlayed', 'wins', 'losses', 'otLosses', 'points',
+    'regulationWins', 'regulationPlusOtWins', 'goalFor', 'goalAgainst'
+)
+
+def apply_final_games(standings: Dict, games: List[Dict], teams: Dict) -> Optional[Dict]:
+    """
+    Cached standings with newly finished games added (teams: abbrev ->
+    TeamInfo of everyone in the table). Only the two teams of each game
+    change. None when the result has teams tied on record - the cache keeps
+    no head-to-head matrix to break them, so the table must be recomputed.
+    """
+    team_stats = {row['teamAbbrev']['default']: dict(row) for row in standings['standings']}
+    for abbrev, team in teams.items():
+        team_stats.setdefault(abbrev, new_standings_row(team.to_dict()))
+
+    for game in games:
+        add_game_result(
+            team_stats, {}, game['home_team_abbrev'], game['away_team_abbrev'],
+            game['home_score'], game['away_score'], game['period_type']
+        )
+    if needs_head_to_head(team_stats):
+        return None
+    return dict(standings, standings=sort_standings(team_stats))
+
+class LiveGameUpdater:
+    """
+    Polls the schedule dates of today and yesterday that still have
+    unfinished games (per the sync ledger): every LIVE_POLL_SECONDS while one
+    of their games is in progress, every LIVE_IDLE_POLL_SECONDS while they
+    wait to start. A poll re-syncs just that day. Cached standings covering
+    it are patched with newly finished games instead of being recomputed,
+    and 'scores' / 'standings' events go out to every SSE client.
+    """
+
+    def __init__(
+        self,
+        service,
+        broadcaster: Optional[EventBroadcaster] = None,
+        session_factory=SessionLocal,
+        poll_seconds: int = LIVE_POLL_SECONDS,
+        idle_poll_seconds: int = LIVE_IDLE_POLL_SECONDS
+    ):
+        self.service = service
+        self.broadcaster = broadcaster or EventBroadcaster()
+        self.session_factory = session_factory
+        self.poll_seconds = poll_seconds
+        self.idle_poll_seconds = idle_poll_seconds
+        self._last_polled: Dict[date, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start polling on the running event loop"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                for event, data in await run_blocking(self.poll_once):
+                    self.broadcaster.publish(event, data)
+            except Exception:
+                logger.warning("Live update poll failed", exc_info=True)
+            await asyncio.sleep(self.poll_seconds)
+
+    def poll_once(self, today: Optional[date] = None) -> List[Tuple[str, Dict]]:
+        """Re-sync whichever live days are due; returns the events to publish"""
+        today = today or datetime.now().date()
+        db = self.session_factory()
+        try:
+            self._request_catch_up(db, today)
+            events = []
+            for season, day, pending_ids in get_unfinished_days(db, today - timedelta(days=1), today):
+                games = {game.id: game.to_dict() for game in get_games_by_ids(db, pending_ids)}
+                in_progress = any(game['game_state'] in LIVE_GAME_STATES for game in games.values())
+                last_polled = self._last_polled.get(day)
+                if not in_progress and last_polled and time.monotonic() - last_polled < self.idle_poll_seconds:
+                    continue
+                self._last_polled[day] = time.monotonic()
+                events.extend(self._update_day(db, season, day, games))
+            return events
+        finally:
+            db.close()
+
+    def _request_catch_up(self, db, today: date):
+        """Live days come from the ledger - have the regular sync extend it to today first"""
+        seasons = get_game_seasons(db)
+        if not seasons or today > season_last_day(seasons[-1]):
+            return
+        ledger_end = get_ledger_end(db, seasons[-1])
+        if ledger_end is None or ledger_end < today:
+            self.service.refresh_scheduler.request_refresh(seasons[-1])
+
+    def _update_day(self, db, season: str, day: date, before: Dict[int, Dict]) -> List[Tuple[str, Dict]]:
+        cache = self.service.standings_cache
+        game_dates = {date.fromisoformat(game['game_date']) for game in before.values()}
+        version_before = self.service._data_version(db, season)
+        # The sync drops cached ranges over these dates - keep them to patch afterwards
+        cached = cache.covering(season, game_dates)
+
+        start = datetime.combine(day, datetime.min.time())
+        self.service.sync_service.sync_games_for_date_range(db, start, start, season, strategy='daily')
+
+        after = {game.id: game.to_dict() for game in get_games_by_ids(db, list(before))}
+        changed = [game for game_id, game in after.items() if game != before.get(game_id)]
+        if not changed:
+            return []
+
+        was_final = lambda game: before[game['id']]['game_state'] in COMPLETED_STATES
+        finished = [g for g in changed if g['game_state'] in COMPLETED_STATES and not was_final(g)]
+        corrected = [g for g in changed if was_final(g)]
+        version_after = self.service._data_version(db, season)
+        # Patch only if this sync was the season's single change since the entries were computed
+        if not corrected and version_after == (version_before[0] + 1, version_before[1]):
+            self._patch_cached(cached, finished, version_before, version_after)
+
+        events = [('scores', {'season': season, 'date': day.isoformat(), 'games': changed})]
+        if finished:
+            # Official standings move too - record today's snapshot for the default view
+            self.service.sync_service.sync_standings_snapshots(db, season, day, day)
+            cache.invalidate_official(season)
+            events.append(('standings', {
+                'season': season,
+                'dates': sorted({game['game_date'] for game in finished}),
+                'games': [game['id'] for game in finished],
+                'deltas': self._deltas(finished)
+            }))
+        return events
+
+    def _patch_cached(self, cached, finished: List[Dict], version_before, version_after):
+        """Put cached standings back at the new data version, with finished games applied"""
+        directory = get_team_directory()
+        for key, standings, version in cached:
+            if version != version_before:
+                continue
+            _, start_date, end_date, division, conference = key
+            teams = {team.abbrev: team for team in directory.select(division, conference)}
+            games = [
+                game for game in finished
+                if start_date <= date.fromisoformat(game['game_date']) <= end_date
+                and game['home_team_abbrev'] in teams and game['away_team_abbrev'] in teams
+            ]
+            patched = apply_final_games(standings, games, teams) if games else standings
+            if patched is not None:
+                self.service.standings_cache.put(key, patched, version_after)
+
+    def _deltas(self, finished: List[Dict]) -> Dict[str, Dict]:
+        """Per-team standings increments from the finished games"""
+        directory = get_team_directory()
+        rows = {}
+        for game in finished:
+            home, away = game['home_team_abbrev'], game['away_team_abbrev']
+            if home not in directory.by_abbrev or away not in directory.by_abbrev:
+                continue
+            for abbrev in (home, away):
+                rows.setdefault(abbrev, new_standings_row(directory.by_abbrev[abbrev].to_dict()))
+            add_game_result(rows, {}, home, away, game['home_score'], game['away_score'], game['period_type'])
+        return {abbrev: {field: row[field] for field in DELTA_FIELDS} for abbrev, row in rows.items()}
@@ -0,0 +1,186 @@
+"""
+Offline stand-in for nhlpy's NHLClient that replays recorded JSON.
+
+Fixture layout (see benchmarks/generate_fixtures.py):
+    teams.json                  - teams.teams() payload
+    <season>/schedule.json      - every raw schedule game of the season
+    <season>/standings.json     - {date: league_standings payload}
+
+Schedule endpoints are answered by slicing the recorded games the way the
+API does (by day, week or team), standings by the latest recorded date.
+Every call can be delayed and made to fail at a configurable rate.
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+import json
+import os
+import random
+import threading
+import time
+
+class RecordedUpstreamError(Exception):
+    """Injected failure standing in for an upstream error"""
+
+class _RecordedSchedule:
+    def __init__(self, client: "RecordedNHLClient"):
+        self._client = client
+
+    def daily_schedule(self, date: Optional[str] = None) -> dict:
+        self._client._call('schedule.daily_schedule')
+        return {'date': date, 'games': self._client.games_by_date.get(date, [])}
+
+    def weekly_schedule(self, date: Optional[str] = None) -> dict:
+        self._client._call('schedule.weekly_schedule')
+        first_day = datetime.fromisoformat(date).date()
+        week = [(first_day + timedelta(days=i)).isoformat() for i in range(7)]
+        payload = {
+            'gameWeek': [{'date': day, 'games': self._client.games_by_date.get(day, [])} for day in week],
+        }
+        bounds = self._client.season_bounds(first_day)
+        if bounds:
+            payload['regularSeasonStartDate'], payload['regularSeasonEndDate'] = bounds
+            payload['playoffEndDate'] = bounds[1]
+        return payload
+
+    def team_season_schedule(self, team_abbr: str, season: str) -> dict:
+        self._client._call('schedule.team_season_schedule')
+        games = [
+            dict(game, gameDate=self._client.schedule_day(game))
+            for game in self._client.games_by_season.get(season, [])
+            if team_abbr in (game['homeTeam']['abbrev'], game['awayTeam']['abbrev'])
+        ]
+        return {'games': games}
+
+class _RecordedTeams:
+    def __init__(self, client: "RecordedNHLClient"):
+        self._client = client
+
+    def teams(self, date: str = "now") -> List[dict]:
+        self._client._call('teams.teams')
+        return self._client.teams_data
+
+class _RecordedStandings:
+    def __init__(self, client: "RecordedNHLClient"):
+        self._client = client
+
+    def league_standings(self, date: Optional[str] = None, season: Optional[str] = None) -> dict:
+        self._client._call('standings.league_standings')
+        standings = self._client.standings_by_season
+        if season:
+            dates = sorted(standings.get(season, {}))
+            date = dates[-1] if dates else None
+        return self._client.standings_on(date)
+
+    def season_standing_manifest(self) -> List[dict]:
+        self._client._call('standings.season_standing_manifest')
+        manifest = []
+        for season, by_date in sorted(self._client.standings_by_season.items()):
+            dates = sorted(by_date)
+            manifest.append({
+                'id': int(season),
+                'standingsStart': dates[0] if dates else None,
+                'standingsEnd': dates[-1] if dates else None
+            })
+        return manifest
+
+class RecordedNHLClient:
+    """Replays recorded teams, schedule and standings data through the NHLClient surface"""
+
+    def __init__(
+        self,
+        games_by_season: Dict[str, List[dict]],
+        teams: List[dict],
+        standings_by_season: Optional[Dict[str, Dict[str, dict]]] = None,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0
+    ):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.calls = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+        self._rng = random.Random(seed)
+
+        self.teams_data = teams
+        self.games_by_season = games_by_season
+        self.standings_by_season = standings_by_season or {}
+        self.games_by_date: Dict[str, List[dict]] = {}
+        self._season_bounds = {}
+        for season, games in games_by_season.items():
+            days = sorted(self.schedule_day(game) for game in games)
+            if days:
+                self._season_bounds[season] = (days[0], days[-1])
+            for game in games:
+                self.games_by_date.setdefault(self.schedule_day(game), []).append(game)
+
+        self.schedule = _RecordedSchedule(self)
+        self.teams = _RecordedTeams(self)
+        self.standings = _RecordedStandings(self)
+
+    @classmethod
+    def from_fixtures(cls, path: str, **kwargs) -> "RecordedNHLClient":
+        """Load a fixtures directory written by save_fixtures()"""
+        with open(os.path.join(path, 'teams.json')) as f:
+            teams = json.load(f)
+
+        games_by_season, standings_by_season = {}, {}
+        for season in sorted(os.listdir(path)):
+            season_dir = os.path.join(path, season)
+            if not os.path.isdir(season_dir):
+                continue
+            with open(os.path.join(season_dir, 'schedule.json')) as f:
+                games_by_season[season] = json.load(f)
+            standings_file = os.path.join(season_dir, 'standings.json')
+            if os.path.exists(standings_file):
+                with open(standings_file) as f:
+                    standings_by_season[season] = json.load(f)
+
+        return cls(games_by_season, teams, standings_by_season, **kwargs)
+
+    def save_fixtures(self, path: str):
+        """Write everything this client replays as a fixtures directory"""
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, 'teams.json'), 'w') as f:
+            json.dump(self.teams_data, f)
+        for season, games in self.games_by_season.items():
+            os.makedirs(os.path.join(path, season), exist_ok=True)
+            with open(os.path.join(path, season, 'schedule.json'), 'w') as f:
+                json.dump(games, f)
+            if season in self.standings_by_season:
+                with open(os.path.join(path, season, 'standings.json'), 'w') as f:
+                    json.dump(self.standings_by_season[season], f)
+
+    @staticmethod
+    def schedule_day(game: dict) -> str:
+        """The date a game is listed under (recorded gameDate, else its UTC start date)"""
+        return game.get('gameDate') or game['startTimeUTC'][:10]
+
+    def season_bounds(self, day: date):
+        """(first, last) game dates of the season containing day (July-June), as the API reports them"""
+        season_year = day.year if day.month > 6 else day.year - 1
+        return self._season_bounds.get(f"{season_year}{season_year + 1}")
+
+    def standings_on(self, day: Optional[str]) -> dict:
+        """Latest recorded standings on or before day (or overall)"""
+        best = None
+        for by_date in self.standings_by_season.values():
+            for recorded_day in by_date:
+                if (day is None or recorded_day <= day) and (best is None or recorded_day > best):
+                    best = recorded_day
+        if best is None:
+            return {'standings': []}
+        season = next(s for s, by_date in self.standings_by_season.items() if best in by_date)
+        return self.standings_by_season[season][best]
+
+    def _call(self, endpoint: str):
+        with self._lock:
+            self.calls += 1
+            fail = self.error_rate and self._rng.random() < self.error_rate
+            if fail:
+                self.errors += 1
+        if self.latency:
+            time.sleep(self.latency)
+        if fail:
+            raise RecordedUpstreamError(f"Injected failure calling {endpoint}")
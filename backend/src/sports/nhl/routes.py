@@ -1,36 +1,207 @@
-from fastapi import APIRouter, Query, Depends
-from typing import Optional
+from fastapi import APIRouter, Query, Depends, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import List, Optional
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from .services import NHLService
+from ...core.concurrency import iterate_blocking, run_blocking
+from ...core.export import EXPORT_MEDIA_TYPES
+from ...core.http_cache import conditional_json, etag_matches, not_modified
 from ...database.config import get_db
 
 router = APIRouter()
 nhl_service = NHLService()
 
+class DateRange(BaseModel):
+    start_date: str
+    end_date: str
+
+class StandingsRangesRequest(BaseModel):
+    season: str = "20242025"
+    ranges: List[DateRange]
+    division: Optional[str] = None
+    conference: Optional[str] = None
+
+class StandingsView(BaseModel):
+    season: str = "20242025"
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    division: Optional[str] = None
+    conference: Optional[str] = None
+
+class StandingsBatchRequest(BaseModel):
+    views: List[StandingsView]
+
 @router.get("/standings")
 async def get_standings(
+    request: Request,
     season: str = Query("20242025", description="NHL season (e.g., 20242025)"),
     start_date: Optional[str] = Query(None, description="Start date for filtering (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="End date for filtering (YYYY-MM-DD)"),
     division: Optional[str] = Query(None, description="Filter by division"),
     conference: Optional[str] = Query(None, description="Filter by conference"),
+    as_of: Optional[str] = Query(None, description="Official standings as of this date (YYYY-MM-DD); ignored with start/end dates"),
     db: Session = Depends(get_db)
 ):
     """Get NHL standings with optional filtering - uses database for speed"""
     try:
-        standings = await nhl_service.get_standings(
+        # Repeat polls with an unchanged data version get a 304 before any standings work
+        etag = await run_blocking(
+            nhl_service.get_standings_etag,
             season, start_date, end_date, division, conference, db
         )
-        return standings
+        if etag and etag_matches(request, etag):
+            return not_modified(etag)
+        
+        standings = await run_blocking(
+            nhl_service.get_standings,
+            season, start_date, end_date, division, conference, db, as_of
+        )
+        return conditional_json(request, standings, etag)
+    except ValueError as e:
+        # Bad date or an as_of outside the season
+        return JSONResponse({"error": str(e)}, status_code=400)
     except Exception as e:
         return {"error": str(e)}
 
+@router.get("/standings/timeline")
+async def get_standings_timeline(
+    request: Request,
+    season: str = Query("20242025", description="NHL season (e.g., 20242025)"),
+    start_date: Optional[str] = Query(None, description="First date to include (YYYY-MM-DD)"),
+    end_date: Optional[str] = Query(None, description="Last date to include (YYYY-MM-DD)"),
+    division: Optional[str] = Query(None, description="Filter by division"),
+    conference: Optional[str] = Query(None, description="Filter by conference"),
+    db: Session = Depends(get_db)
+):
+    """Cumulative points, games played and rank per team for every game date (columnar)"""
+    try:
+        etag = await run_blocking(
+            nhl_service.get_standings_timeline_etag,
+            season, start_date, end_date, division, conference, db
+        )
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        
+        timeline = await run_blocking(
+            nhl_service.get_standings_timeline,
+            season, start_date, end_date, division, conference, db
+        )
+        return conditional_json(request, timeline, etag)
+    except Exception as e:
+        return {"error": str(e)}
+
+@router.post("/standings/batch")
+async def get_standings_batch(body: StandingsBatchRequest, db: Session = Depends(get_db)):
+    """Several standings tables (league, conferences, divisions, recent form...) in one request"""
+    try:
+        return await run_blocking(
+            nhl_service.get_standings_batch, [v.model_dump() for v in body.views], db
+        )
+    except Exception as e:
+        return {"error": str(e)}
+
+@router.get("/matchups")
+async def get_matchup(
+    request: Request,
+    team: str = Query(..., description="Team abbreviation (e.g., TOR)"),
+    opponent: Optional[str] = Query(None, description="Opponent team abbreviation"),
+    division: Optional[str] = Query(None, description="Opponents from this division"),
+    conference: Optional[str] = Query(None, description="Opponents from this conference"),
+    seasons: Optional[List[str]] = Query(None, description="Seasons to include (repeatable); default: those the dates cover, else 20242025"),
+    start_date: Optional[str] = Query(None, description="First date to include (YYYY-MM-DD)"),
+    end_date: Optional[str] = Query(None, description="Last date to include (YYYY-MM-DD)"),
+    game_type: Optional[int] = Query(None, description="2 = regular season, 3 = playoffs (default: both)"),
+    db: Session = Depends(get_db)
+):
+    """Team-vs-team (or vs division/conference) record and game list"""
+    try:
+        etag = await run_blocking(
+            nhl_service.get_matchup_etag,
+            team, opponent, division, conference, seasons, start_date, end_date, game_type, db
+        )
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        
+        matchup = await run_blocking(
+            nhl_service.get_matchup,
+            team, opponent, division, conference, seasons, start_date, end_date, game_type, db
+        )
+        return conditional_json(request, matchup, etag)
+    except Exception as e:
+        return {"error": str(e)}
+
+@router.post("/standings/ranges")
+async def get_standings_for_ranges(body: StandingsRangesRequest, db: Session = Depends(get_db)):
+    """Standings for many date ranges at once (columnar, unsorted) - for batch analytics"""
+    try:
+        return await run_blocking(
+            nhl_service.get_standings_for_ranges,
+            body.season, [r.model_dump() for r in body.ranges], body.division, body.conference, db
+        )
+    except Exception as e:
+        return {"error": str(e)}
+
+async def _export(kind: str, fmt: str, seasons, start_date, end_date, team, db: Session):
+    """Stream an export chunk by chunk, straight off the database cursor"""
+    try:
+        chunks = await run_blocking(
+            nhl_service.export_rows, kind, fmt, seasons, start_date, end_date, team, db
+        )
+    except Exception as e:
+        return {"error": str(e)}
+    return StreamingResponse(
+        iterate_blocking(chunks),
+        media_type=EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{kind}.{fmt}"'}
+    )
+
+@router.get("/games/export")
+async def export_games(
+    fmt: str = Query("ndjson", alias="format", description="ndjson or csv"),
+    seasons: Optional[List[str]] = Query(None, description="Seasons to include (repeatable); default: all"),
+    start_date: Optional[str] = Query(None, description="First date to include (YYYY-MM-DD)"),
+    end_date: Optional[str] = Query(None, description="Last date to include (YYYY-MM-DD)"),
+    team: Optional[str] = Query(None, description="Only games this team played (home or away)"),
+    db: Session = Depends(get_db)
+):
+    """Stream stored games as NDJSON or CSV"""
+    return await _export("games", fmt, seasons, start_date, end_date, team, db)
+
+@router.get("/standings/export")
+async def export_standings(
+    fmt: str = Query("ndjson", alias="format", description="ndjson or csv"),
+    seasons: Optional[List[str]] = Query(None, description="Seasons to include (repeatable); default: all"),
+    start_date: Optional[str] = Query(None, description="First date to include (YYYY-MM-DD)"),
+    end_date: Optional[str] = Query(None, description="Last date to include (YYYY-MM-DD)"),
+    team: Optional[str] = Query(None, description="Only this team's rows"),
+    db: Session = Depends(get_db)
+):
+    """Stream season-to-date team standings for every date each team played, as NDJSON or CSV"""
+    return await _export("standings", fmt, seasons, start_date, end_date, team, db)
+
+@router.get("/live")
+async def live_updates():
+    """
+    Server-sent events while games are on: 'scores' with changed games and
+    'standings' with per-team deltas when games finish
+    """
+    return StreamingResponse(
+        nhl_service.live_updater.broadcaster.stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.get("/teams")
-async def get_teams(db: Session = Depends(get_db)):
+async def get_teams(request: Request, db: Session = Depends(get_db)):
     """Get all NHL teams"""
     try:
-        teams = await nhl_service.get_teams(db)
-        return teams
+        etag = await run_blocking(nhl_service.get_teams_etag, db)
+        if etag and etag_matches(request, etag):
+            return not_modified(etag)
+        
+        teams = await run_blocking(nhl_service.get_teams, db)
+        return conditional_json(request, teams, etag)
     except Exception as e:
         return {"error": str(e)}
 
@@ -38,11 +209,16 @@ async def get_teams(db: Session = Depends(get_db)):
 async def get_available_seasons():
     """Get available seasons"""
     try:
-        seasons = await nhl_service.get_available_seasons()
+        seasons = await run_blocking(nhl_service.get_available_seasons)
         return seasons
     except Exception as e:
         return {"error": str(e)}
 
+@router.get("/cache")
+async def get_cache_stats():
+    """Standings cache hit/miss counters"""
+    return nhl_service.get_cache_stats()
+
 @router.post("/sync")
 async def sync_data(
     season: str = Query("20242025", description="Season to sync"),
@@ -50,7 +226,7 @@ async def sync_data(
 ):
     """Manually trigger data sync (admin endpoint)"""
     try:
-        result = await nhl_service.sync_current_season_data(db, season)
+        result = await run_blocking(nhl_service.sync_current_season_data, db, season)
         return result
     except Exception as e:
         return {"error": str(e)}
@@ -1,89 +1,448 @@
-from nhlpy import NHLClient
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from datetime import datetime
+from typing import Iterator, List, Dict, Optional, Tuple
 from sqlalchemy.orm import Session
-from ...database.config import get_db
+import logging
+import os
+import threading
+from ...database.config import SessionLocal
 from ...database.queries import (
-    calculate_standings_from_db,
+    calculate_standings,
+    calculate_standings_batch,
+    calculate_standings_timeline,
+    calculate_standings_ranges,
+    get_game_seasons,
     get_latest_game_date,
-    get_all_teams
+    get_matchup,
+    get_standings_snapshot,
+    season_first_day,
+    season_last_day,
+    has_game_participants,
+    has_team_daily_cumulative,
+    iter_games_export,
+    iter_standings_export,
+    refresh_game_participants,
+    refresh_team_daily_cumulative,
+    GAME_EXPORT_COLUMNS,
+    STANDINGS_EXPORT_COLUMNS,
+    get_sync_generation,
+    ledger_covers,
+    TEAMS_SCOPE
 )
 from ...database.sync_service import DatabaseSyncService
+from ...database.refresh_scheduler import RefreshScheduler
+from ...database.team_directory import get_team_directory
+from .cache import StandingsCache
+from .live import LiveGameUpdater
+from .client import NHLClientProtocol, create_nhl_client
+from ...core.export import EXPORT_MEDIA_TYPES, encode_export
+from ...core.http_cache import make_etag
+from ...core.metrics import STANDINGS_CALCULATION_SECONDS, instrument_client
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on date ranges accepted by one batch standings call
+STANDINGS_MAX_RANGES = int(os.getenv("STANDINGS_MAX_RANGES", "5000"))
+# Upper bound on views accepted by one batched standings call
+STANDINGS_MAX_BATCH = int(os.getenv("STANDINGS_MAX_BATCH", "50"))
 
 class NHLService:
-    def __init__(self):
-        self.client = NHLClient()
-        self.sync_service = DatabaseSyncService()
+    """
+    NHL standings/teams logic. Every method is blocking (SQLAlchemy and
+    NHLClient are synchronous) - call them through run_blocking from async code.
+    """
     
-    async def get_standings(
+    def __init__(self, client: Optional[NHLClientProtocol] = None, sync_service: Optional[DatabaseSyncService] = None):
+        self.client = instrument_client(client or create_nhl_client())
+        self.sync_service = sync_service or DatabaseSyncService(client=self.client)
+        self.refresh_scheduler = RefreshScheduler(self.sync_service)
+        self.standings_cache = StandingsCache()
+        self.sync_service.write_listeners.append(self.standings_cache.invalidate)
+        self._derived_lock = threading.Lock()
+        self.live_updater = LiveGameUpdater(self)
+    
+    def get_standings(
         self, 
         season: str = "20242025", 
         start_date: Optional[str] = None, 
         end_date: Optional[str] = None, 
         division: Optional[str] = None, 
         conference: Optional[str] = None,
-        db: Session = None
+        db: Session = None,
+        as_of: Optional[str] = None
     ):
-        """Get NHL standings - uses database for custom date ranges"""
+        """
+        Get NHL standings - uses database for custom date ranges.
+        Without dates, the official standings come from stored snapshots
+        (latest, or as of a date), falling back to the live league feed.
+        """
         try:
             if start_date or end_date:
                 # Use database for custom date ranges (FAST!)
                 if not db:
                     # Fallback to old method if no db connection
-                    return await self._get_standings_fallback(
+                    return self._get_standings_fallback(
                         season, start_date, end_date, division, conference
                     )
                 
-                return await self._get_standings_from_db(
+                return self._get_standings_from_db(
                     season, start_date, end_date, division, conference, db
                 )
             else:
-                # Use league standings API for full season (still fast)
-                standings = self.client.standings.league_standings(season=season)
-                return self._filter_standings(standings, division, conference)
+                as_of_dt = self._parse_optional_date(as_of)
+                if as_of_dt and not season_first_day(season) <= as_of_dt <= season_last_day(season):
+                    raise ValueError(f"as_of {as_of_dt} is outside season {season}")
+                cache_key = self.standings_cache.make_key(season, None, as_of_dt, division, conference)
+                standings = self.standings_cache.get(cache_key)
+                if standings is None:
+                    standings, from_snapshot = self._get_official_standings(season, as_of_dt, db)
+                    standings = self._filter_standings(standings, division, conference)
+                    # The live feed isn't a captured snapshot - keep it only briefly
+                    self.standings_cache.put(cache_key, standings, volatile=not from_snapshot)
+                return standings
+        except ValueError:
+            raise
         except Exception as e:
             raise Exception(f"Failed to fetch standings: {str(e)}")
     
-    async def _get_standings_from_db(
+    def get_standings_etag(
         self,
         season: str,
         start_date: Optional[str],
         end_date: Optional[str],
         division: Optional[str],
         conference: Optional[str],
-        db: Session
-    ):
-        """Calculate standings from database (instant!)"""
+        db: Session = None
+    ) -> Optional[str]:
+        """
+        ETag for a DB-backed standings query, built from the data versions
+        and freshness only - no standings are computed. None for the live
+        league feed, whose version we don't know up front.
+        """
+        if not (start_date or end_date) or not db:
+            return None
+        
+        start_dt, end_dt, latest_in_db = self._prepare_db_range(season, start_date, end_date, db)
+        return make_etag(
+            self.standings_cache.make_key(season, start_dt, end_dt, division, conference),
+            self._data_version(db, season),
+            sorted(self._freshness(season, latest_in_db).items())
+        )
+    
+    def _prepare_db_range(self, season: str, start_date: Optional[str], end_date: Optional[str], db: Session):
+        """Resolve date defaults and queue a background sync if stored data is behind"""
         # Apply smart date defaults
         if start_date and not end_date:
             end_date = datetime.now().strftime('%Y-%m-%d')
         elif end_date and not start_date:
             start_date = f"{season[:4]}-10-01"
         
-        # Ensure data is synced up to end_date
+        # Serve what's stored right away; missing days are synced in the background
         latest_in_db = get_latest_game_date(db, season)
         end_dt = datetime.fromisoformat(end_date).date()
         
-        if not latest_in_db or latest_in_db < end_dt:
-            # Sync missing data
-            sync_start = latest_in_db + timedelta(days=1) if latest_in_db else datetime(int(season[:4]), 10, 1)
-            sync_end = min(end_dt, datetime.now().date())
-            
-            self.sync_service.sync_games_for_date_range(
-                db,
-                datetime.combine(sync_start, datetime.min.time()),
-                datetime.combine(sync_end, datetime.min.time()),
-                season
-            )
+        # The ledger knows whether any date in range still has unfinished games
+        if not ledger_covers(db, season, min(end_dt, datetime.now().date())):
+            self.refresh_scheduler.request_refresh(season)
         
-        # Calculate standings from database
         start_dt = datetime.fromisoformat(start_date).date()
+        return start_dt, end_dt, latest_in_db
+    
+    def _data_version(self, db: Session, season: str):
+        """Sync generations the season's standings depend on (games and teams)"""
+        return (get_sync_generation(db, season), get_sync_generation(db, TEAMS_SCOPE))
+    
+    def _get_standings_from_db(
+        self,
+        season: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        division: Optional[str],
+        conference: Optional[str],
+        db: Session
+    ):
+        """Calculate standings from database (instant!)"""
+        start_dt, end_dt, latest_in_db = self._prepare_db_range(season, start_date, end_date, db)
+        
+        # Calculate standings from database (or reuse an identical earlier query)
+        version = self._data_version(db, season)
+        cache_key = self.standings_cache.make_key(season, start_dt, end_dt, division, conference)
+        standings = self.standings_cache.get(cache_key, version)
+        if standings is None:
+            standings = calculate_standings(
+                db, start_dt, end_dt, season, division, conference
+            )
+            self.standings_cache.put(cache_key, standings, version)
+        return dict(standings, **self._freshness(season, latest_in_db))
+    
+    def _freshness(self, season: str, latest_in_db) -> Dict:
+        """Tell clients how current DB-backed standings are and whether a sync is underway"""
+        last_synced = self.refresh_scheduler.last_synced_at(season)
+        return {
+            'dataAsOf': latest_in_db.isoformat() if latest_in_db else None,
+            'lastSyncedAt': last_synced.isoformat() if last_synced else None,
+            'refreshing': self.refresh_scheduler.is_refreshing(season)
+        }
+    
+    def _parse_optional_date(self, value: Optional[str]):
+        return datetime.fromisoformat(value).date() if value else None
+    
+    def get_standings_timeline_etag(
+        self,
+        season: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        division: Optional[str],
+        conference: Optional[str],
+        db: Session
+    ) -> str:
+        """ETag for a timeline query - changes whenever the season's games or teams are re-synced"""
+        return make_etag(
+            'timeline', season, start_date, end_date,
+            division.lower() if division else None,
+            conference.lower() if conference else None,
+            self._data_version(db, season)
+        )
+    
+    def get_standings_timeline(
+        self,
+        season: str = "20242025",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        division: Optional[str] = None,
+        conference: Optional[str] = None,
+        db: Session = None
+    ) -> Dict:
+        """Points, games played and rank for every team as of every game date"""
+        latest_in_db = get_latest_game_date(db, season)
+        if not latest_in_db:
+            self.refresh_scheduler.request_refresh(season)
+        
+        timeline = calculate_standings_timeline(
+            db, season,
+            self._parse_optional_date(start_date),
+            self._parse_optional_date(end_date),
+            division, conference
+        )
+        return dict(timeline, **self._freshness(season, latest_in_db))
+    
+    def get_standings_for_ranges(
+        self,
+        season: str,
+        ranges: List[Dict],
+        division: Optional[str] = None,
+        conference: Optional[str] = None,
+        db: Session = None
+    ) -> Dict:
+        """Unsorted columnar standings for many {start_date, end_date} ranges in one call"""
+        if len(ranges) > STANDINGS_MAX_RANGES:
+            raise ValueError(f"At most {STANDINGS_MAX_RANGES} ranges per request, got {len(ranges)}")
+        
+        parsed = [
+            (datetime.fromisoformat(r['start_date']).date(), datetime.fromisoformat(r['end_date']).date())
+            for r in ranges
+        ]
+        latest_in_db = get_latest_game_date(db, season)
+        result = calculate_standings_ranges(db, season, parsed, division, conference)
+        return dict(result, **self._freshness(season, latest_in_db))
+    
+    def get_standings_batch(self, views: List[Dict], db: Session = None) -> Dict:
+        """
+        Several standings tables in one call, in request order. Each view is
+        {season, start_date, end_date, division, conference} and is answered
+        exactly as GET /standings would answer it. Cached views are reused;
+        the rest share one league-wide aggregation per distinct date window.
+        """
+        if len(views) > STANDINGS_MAX_BATCH:
+            raise ValueError(f"At most {STANDINGS_MAX_BATCH} views per request, got {len(views)}")
         
-        return calculate_standings_from_db(
-            db, start_dt, end_dt, season, division, conference
+        results = [None] * len(views)
+        versions, windows = {}, {}
+        to_calculate = []
+        for i, view in enumerate(views):
+            season = view.get('season') or "20242025"
+            division, conference = view.get('division'), view.get('conference')
+            if not (view.get('start_date') or view.get('end_date')):
+                # Official standings - served from snapshots like the plain endpoint
+                results[i] = self.get_standings(season, None, None, division, conference, db)
+                continue
+            
+            window = (season, view.get('start_date'), view.get('end_date'))
+            if window not in windows:
+                windows[window] = self._prepare_db_range(*window, db)
+            start_dt, end_dt, latest_in_db = windows[window]
+            if season not in versions:
+                versions[season] = self._data_version(db, season)
+            cache_key = self.standings_cache.make_key(season, start_dt, end_dt, division, conference)
+            standings = self.standings_cache.get(cache_key, versions[season])
+            if standings is None:
+                to_calculate.append((i, cache_key, versions[season], latest_in_db, {
+                    'season': season, 'start_date': start_dt, 'end_date': end_dt,
+                    'division': division, 'conference': conference
+                }))
+            else:
+                results[i] = dict(standings, **self._freshness(season, latest_in_db))
+        
+        if to_calculate:
+            with STANDINGS_CALCULATION_SECONDS.time(engine='batch'):
+                calculated = calculate_standings_batch(db, [view for *_, view in to_calculate])
+            for (i, cache_key, version, latest_in_db, view), standings in zip(to_calculate, calculated):
+                self.standings_cache.put(cache_key, standings, version)
+                results[i] = dict(standings, **self._freshness(view['season'], latest_in_db))
+        
+        return {'views': results}
+    
+    def _ensure_derived(self, db: Session, seasons: List[str], has_rows, refresh):
+        """Build a derived table for seasons whose games were synced before it existed"""
+        for season in seasons:
+            if not has_rows(db, season) and get_latest_game_date(db, season):
+                with self._derived_lock:
+                    if not has_rows(db, season):
+                        refresh(db, season)
+    
+    def _matchup_scope(
+        self,
+        team: str,
+        opponent: Optional[str],
+        division: Optional[str],
+        conference: Optional[str],
+        seasons: Optional[List[str]],
+        start_date: Optional[str],
+        end_date: Optional[str],
+        db: Session
+    ):
+        """Resolve a matchup request to (team, opponents or None, seasons, start, end)"""
+        directory = get_team_directory(db)
+        team = team.upper()
+        if team not in directory.by_abbrev:
+            raise ValueError(f"Unknown team '{team}'")
+        
+        opponents = None
+        if opponent:
+            opponent = opponent.upper()
+            if opponent not in directory.by_abbrev:
+                raise ValueError(f"Unknown team '{opponent}'")
+            opponents = [opponent]
+        elif division or conference:
+            opponents = [t.abbrev for t in directory.select(division, conference) if t.abbrev != team]
+        
+        start_dt = self._parse_optional_date(start_date)
+        end_dt = self._parse_optional_date(end_date)
+        if not seasons:
+            if start_dt or end_dt:
+                # Every season (July-June) the date range touches
+                first = start_dt or end_dt
+                last = end_dt or datetime.now().date()
+                first_year = first.year if first.month > 6 else first.year - 1
+                last_year = last.year if last.month > 6 else last.year - 1
+                seasons = [f"{year}{year + 1}" for year in range(first_year, last_year + 1)]
+            else:
+                seasons = ["20242025"]
+        return team, opponents, sorted(set(seasons)), start_dt, end_dt
+    
+    def get_matchup_etag(
+        self,
+        team: str,
+        opponent: Optional[str],
+        division: Optional[str],
+        conference: Optional[str],
+        seasons: Optional[List[str]],
+        start_date: Optional[str],
+        end_date: Optional[str],
+        game_type: Optional[int],
+        db: Session
+    ) -> str:
+        """ETag for a matchup query - changes whenever one of its seasons or the teams are re-synced"""
+        team, opponents, seasons, start_dt, end_dt = self._matchup_scope(
+            team, opponent, division, conference, seasons, start_date, end_date, db
+        )
+        return make_etag(
+            'matchup', team, opponents, seasons, start_dt, end_dt, game_type,
+            [get_sync_generation(db, season) for season in seasons],
+            get_sync_generation(db, TEAMS_SCOPE)
+        )
+    
+    def get_matchup(
+        self,
+        team: str,
+        opponent: Optional[str] = None,
+        division: Optional[str] = None,
+        conference: Optional[str] = None,
+        seasons: Optional[List[str]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        game_type: Optional[int] = None,
+        db: Session = None
+    ) -> Dict:
+        """
+        A team's record and games against one opponent, a division or
+        conference, or the whole league, over seasons and/or a date range.
+        """
+        team, opponents, seasons, start_dt, end_dt = self._matchup_scope(
+            team, opponent, division, conference, seasons, start_date, end_date, db
         )
+        
+        self._ensure_derived(db, seasons, has_game_participants, refresh_game_participants)
+        matchup = get_matchup(db, team, opponents, seasons, start_dt, end_dt, game_type)
+        return dict(
+            matchup,
+            team=team,
+            opponents=opponents,
+            seasons=seasons,
+            startDate=start_dt.isoformat() if start_dt else None,
+            endDate=end_dt.isoformat() if end_dt else None
+        )
+    
+    def export_rows(
+        self,
+        kind: str,
+        fmt: str,
+        seasons: Optional[List[str]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        team: Optional[str] = None,
+        db: Session = None
+    ) -> Iterator[str]:
+        """
+        Validate an export request and return an iterator of NDJSON/CSV text
+        chunks: 'games' rows, or 'standings' season-to-date team totals for
+        every date played. Nothing is read until the first chunk is pulled,
+        and the rows come through a session of the iterator's own, since the
+        request's session is closed before the response body is sent.
+        """
+        exports = {
+            'games': (iter_games_export, GAME_EXPORT_COLUMNS),
+            'standings': (iter_standings_export, STANDINGS_EXPORT_COLUMNS)
+        }
+        if kind not in exports:
+            raise ValueError(f"Unknown export '{kind}', expected one of {list(exports)}")
+        if fmt not in EXPORT_MEDIA_TYPES:
+            raise ValueError(f"Unknown export format '{fmt}', expected one of {list(EXPORT_MEDIA_TYPES)}")
+        
+        start_dt = self._parse_optional_date(start_date)
+        end_dt = self._parse_optional_date(end_date)
+        if team:
+            team = team.upper()
+            if team not in get_team_directory(db).by_abbrev:
+                raise ValueError(f"Unknown team '{team}'")
+        
+        involved = seasons or get_game_seasons(db)
+        if kind == 'standings':
+            self._ensure_derived(db, involved, has_team_daily_cumulative, refresh_team_daily_cumulative)
+        elif team:
+            self._ensure_derived(db, involved, has_game_participants, refresh_game_participants)
+        
+        query, columns = exports[kind]
+        
+        def generate():
+            export_db = SessionLocal()
+            try:
+                yield from encode_export(query(export_db, seasons, start_dt, end_dt, team), columns, fmt)
+            finally:
+                export_db.close()
+        
+        return generate()
     
-    async def _get_standings_fallback(
+    def _get_standings_fallback(
         self,
         season: str,
         start_date: Optional[str],
@@ -96,6 +455,27 @@ class NHLService:
         standings = self.client.standings.league_standings(season=season)
         return self._filter_standings(standings, division, conference)
     
+    def _get_official_standings(self, season: str, as_of, db: Session = None) -> Tuple[Dict, bool]:
+        """
+        League standings from the stored snapshots, or live from the API if
+        that date wasn't captured (a past date is captured on the spot
+        first). Also returns whether they came from a snapshot - anything
+        else may only be cached briefly.
+        """
+        if db:
+            snapshot = get_standings_snapshot(db, season, as_of)
+            if snapshot is None and as_of and as_of <= datetime.now().date():
+                self.sync_service.sync_standings_snapshots(db, season, as_of, as_of)
+                snapshot = get_standings_snapshot(db, season, as_of)
+            if snapshot:
+                return snapshot, True
+            # Have the background sync start recording snapshots for this season
+            self.refresh_scheduler.request_refresh(season)
+        
+        if as_of:
+            return self.client.standings.league_standings(date=as_of.isoformat()), False
+        return self.client.standings.league_standings(season=season), False
+    
     def _filter_standings(self, standings: Dict, division: Optional[str], conference: Optional[str]) -> Dict:
         """Filter full season standings by division/conference"""
         if not division and not conference:
@@ -109,13 +489,20 @@ class NHLService:
                 continue
             filtered_standings.append(team)
         
-        return {'standings': filtered_standings}
+        return dict(standings, standings=filtered_standings)
     
-    async def get_teams(self, db: Session = None):
+    def get_teams_etag(self, db: Session = None) -> Optional[str]:
+        """ETag for the stored team list; None if teams come from the live API"""
+        if not db:
+            return None
+        directory = get_team_directory(db)
+        return make_etag('teams', directory.generation) if directory.teams else None
+    
+    def get_teams(self, db: Session = None):
         """Get all NHL teams - from database if available"""
         try:
             if db:
-                teams = get_all_teams(db)
+                teams = get_team_directory(db).teams
                 if teams:
                     return {'teams': [t.to_dict() for t in teams]}
             
@@ -125,12 +512,13 @@ class NHLService:
         except Exception as e:
             raise Exception(f"Failed to fetch teams: {str(e)}")
     
-    async def get_available_seasons(self):
+    def get_available_seasons(self):
         """Get available seasons"""
         try:
             season_info = self.client.standings.season_standing_manifest()
             return season_info
-        except Exception as e:
+        except Exception:
+            logger.warning("Season manifest unavailable, serving the built-in list", exc_info=True)
             return {
                 'seasons': [
                     '20242025', '20232024', '20222023', '20212022', '20202021',
@@ -138,12 +526,16 @@ class NHLService:
                 ]
             }
     
-    async def sync_current_season_data(self, db: Session, season: str = "20242025"):
-        """Manually trigger sync of current season"""
+    def sync_current_season_data(self, db: Session, season: str = "20242025"):
+        """Manually trigger sync of current season (joins a sync already in progress)"""
         teams_synced = self.sync_service.sync_teams(db)
-        games_synced = self.sync_service.sync_current_season(db, season)
+        games_synced = self.refresh_scheduler.request_refresh(season, force=True).result()
         
         return {
             'teams_synced': teams_synced,
             'games_synced': games_synced
-        }
\ No newline at end of file
+        }
+    
+    def get_cache_stats(self) -> Dict:
+        """Standings cache hit/miss counters"""
+        return {'standings': self.standings_cache.stats()}
\ No newline at end of file
@@ -0,0 +1,35 @@
+"""
+Shared fixtures. Tests run against a throwaway SQLite database (never
+DATABASE_URL - seeding drops every table) filled with synthetic seasons
+from benchmarks/fake_nhl_client.py through the regular sync path.
+"""
+
+import os
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.join(BACKEND_DIR, "benchmarks"))
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'test.db')}"
+
+import pytest
+
+from src.database.config import SessionLocal
+from seed_data import seed_seasons
+
+# Season loaded for every test session; others are left for tests to sync themselves
+SEASON = "20232024"
+
+@pytest.fixture(scope="session")
+def fake_client():
+    """FakeNHLClient serving SEASON, after its teams and games were synced"""
+    return seed_seasons([SEASON])
+
+@pytest.fixture
+def db(fake_client):
+    """Session on the seeded database; uncommitted changes are rolled back"""
+    session = SessionLocal()
+    yield session
+    session.rollback()
+    session.close()
@@ -0,0 +1,62 @@
+"""Backfill checkpoints only chunks that fully synced, and revisits a chunk that has grown"""
+
+from datetime import date, datetime
+from functools import partial
+from unittest import mock
+
+from sqlalchemy import func, select
+
+import backfill
+from fake_nhl_client import FakeNHLClient
+from src.database.models import Game
+from src.database.queries import get_completed_chunks
+from src.database.sync_service import DatabaseSyncService
+
+def frozen_now(day: date):
+    """datetime whose now() is the given day, for the backfill module"""
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.combine(day, datetime.min.time())
+    return mock.patch.object(backfill, 'datetime', FrozenDatetime)
+
+def games_through(db, season: str, last_day: date) -> int:
+    return db.execute(
+        select(func.count()).select_from(Game).where(Game.season == season, Game.game_date <= last_day)
+    ).scalar()
+
+def test_chunk_cut_off_at_today_is_synced_again(db):
+    season = "20242025"
+    client_factory = partial(FakeNHLClient, seasons=(season,), latency=0)
+
+    with frozen_now(date(2024, 10, 18)):
+        backfill.backfill_season(season, 14, client_factory=client_factory)
+    assert get_completed_chunks(db, season)[date(2024, 10, 13)] == date(2024, 10, 18)
+
+    with frozen_now(date(2024, 11, 30)):
+        stats = backfill.backfill_season(season, 14, client_factory=client_factory)
+    assert stats['failed'] == 0
+    assert get_completed_chunks(db, season)[date(2024, 10, 13)] == date(2024, 10, 26)
+
+    client = client_factory()
+    scheduled = [game for game in client.games_by_season[season] if client.schedule_day(game) <= '2024-11-30']
+    assert games_through(db, season, date(2024, 11, 30)) == len(scheduled)
+
+def test_failed_fetches_are_not_checkpointed(db):
+    season = "20212022"
+    client_factory = partial(FakeNHLClient, seasons=(season,), latency=0, error_rate=1.0)
+
+    with frozen_now(date(2021, 10, 31)):
+        stats = backfill.backfill_season(season, 14, client_factory=client_factory)
+    assert stats['chunks'] == 0 and stats['failed'] > 0
+    assert get_completed_chunks(db, season) == {}
+
+def test_failed_writes_are_not_checkpointed(db):
+    season = "20222023"
+    client_factory = partial(FakeNHLClient, seasons=(season,), latency=0)
+
+    with frozen_now(date(2022, 10, 31)), \
+            mock.patch.object(DatabaseSyncService, '_write_games', return_value=(0, True)):
+        stats = backfill.backfill_season(season, 14, client_factory=client_factory)
+    assert stats['failed'] > 0
+    assert get_completed_chunks(db, season) == {}
@@ -0,0 +1,40 @@
+"""Every standings engine must return exactly what calculate_standings_from_db does"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import update
+
+from src.database.models import Game
+from src.database.queries import calculate_standings
+from conftest import SEASON
+
+ENGINES = ['sql', 'cumulative', 'vectorized']
+
+YEAR = int(SEASON[:4])
+FULL_SEASON = (date(YEAR, 10, 1), date(YEAR + 1, 6, 30))
+ONE_MONTH = (date(YEAR, 12, 1), date(YEAR, 12, 31))
+
+CASES = [
+    (FULL_SEASON, None, None),
+    (ONE_MONTH, None, None),
+    (FULL_SEASON, 'Metropolitan', None),
+    (ONE_MONTH, None, 'western'),
+    (FULL_SEASON, 'Atlantic', 'Eastern'),
+    ((date(YEAR + 1, 7, 1), date(YEAR + 1, 7, 31)), None, None),
+]
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("dates, division, conference", CASES)
+def test_engine_matches_python(db, engine, dates, division, conference):
+    start, end = dates
+    expected = calculate_standings(db, start, end, SEASON, division, conference, engine='python')
+    assert expected['standings'] or start.month == 7
+    assert calculate_standings(db, start, end, SEASON, division, conference, engine=engine) == expected
+
+def test_sql_counts_missing_period_type_as_regulation(db):
+    # Rolled back by the db fixture
+    db.execute(update(Game).where(Game.season == SEASON, Game.period_type == 'OT').values(period_type=None))
+    start, end = FULL_SEASON
+    expected = calculate_standings(db, start, end, SEASON, engine='python')
+    assert calculate_standings(db, start, end, SEASON, engine='sql') == expected
@@ -0,0 +1,82 @@
+"""Official standings snapshots are only served for dates that were captured"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import delete
+
+from src.database.models import StandingsSnapshot, StandingsSnapshotDay
+from src.database.queries import get_standings_snapshot, store_standings_snapshot
+from src.sports.nhl.cache import StandingsCache
+from src.sports.nhl.services import NHLService
+from conftest import SEASON
+
+YEAR = int(SEASON[:4])
+NOV_1, DEC_1, DEC_15, JAN_1 = date(YEAR, 11, 1), date(YEAR, 12, 1), date(YEAR, 12, 15), date(YEAR + 1, 1, 1)
+
+@pytest.fixture
+def snapshot_db(db):
+    db.execute(delete(StandingsSnapshot))
+    db.execute(delete(StandingsSnapshotDay))
+    db.commit()
+    return db
+
+def feed(client, day: date):
+    return client.standings.league_standings(date=day.isoformat())
+
+def points(standings):
+    return {team['teamAbbrev']['default']: team['points'] for team in standings['standings']}
+
+def test_uncaptured_date_is_not_served(snapshot_db, fake_client):
+    store_standings_snapshot(snapshot_db, SEASON, NOV_1, feed(fake_client, NOV_1))
+    store_standings_snapshot(snapshot_db, SEASON, JAN_1, feed(fake_client, JAN_1))
+
+    assert get_standings_snapshot(snapshot_db, SEASON, DEC_15) is None
+    assert get_standings_snapshot(snapshot_db, SEASON)['asOfDate'] == JAN_1.isoformat()
+
+def test_capturing_an_earlier_date_keeps_later_ones(snapshot_db, fake_client):
+    store_standings_snapshot(snapshot_db, SEASON, NOV_1, feed(fake_client, NOV_1))
+    store_standings_snapshot(snapshot_db, SEASON, JAN_1, feed(fake_client, JAN_1))
+    store_standings_snapshot(snapshot_db, SEASON, DEC_15, feed(fake_client, DEC_15))
+
+    for day in (NOV_1, DEC_15, JAN_1):
+        assert points(get_standings_snapshot(snapshot_db, SEASON, day)) == points(feed(fake_client, day))
+
+def test_earlier_date_does_not_leak_into_unchanged_later_date(snapshot_db):
+    team = lambda pts: {'standings': [{'teamAbbrev': {'default': 'TOR'}, 'points': pts}]}
+    store_standings_snapshot(snapshot_db, SEASON, NOV_1, team(10))
+    # Unchanged on Jan 1, so only the date is recorded
+    store_standings_snapshot(snapshot_db, SEASON, JAN_1, team(10))
+    store_standings_snapshot(snapshot_db, SEASON, DEC_15, team(12))
+
+    assert points(get_standings_snapshot(snapshot_db, SEASON, DEC_15)) == {'TOR': 12}
+    assert points(get_standings_snapshot(snapshot_db, SEASON, JAN_1)) == {'TOR': 10}
+
+def test_snapshot_outside_season_is_rejected(snapshot_db):
+    with pytest.raises(ValueError):
+        store_standings_snapshot(snapshot_db, SEASON, date(YEAR + 1, 9, 1), {'standings': []})
+
+def test_service_captures_missing_date(snapshot_db, fake_client):
+    service = NHLService(client=fake_client)
+    standings = service.get_standings(SEASON, db=snapshot_db, as_of=DEC_1.isoformat())
+
+    assert standings['asOfDate'] == DEC_1.isoformat()
+    assert points(standings) == points(feed(fake_client, DEC_1))
+    assert get_standings_snapshot(snapshot_db, SEASON, DEC_1) is not None
+
+def test_service_rejects_as_of_from_another_season(snapshot_db, fake_client):
+    service = NHLService(client=fake_client)
+    with pytest.raises(ValueError):
+        service.get_standings(SEASON, db=snapshot_db, as_of=date(YEAR + 1, 10, 15).isoformat())
+
+    assert get_standings_snapshot(snapshot_db, SEASON) is None
+    assert service.standings_cache.stats()['size'] == 0
+
+def test_volatile_entries_expire_for_past_dates():
+    cache = StandingsCache(ttl_seconds=-1)
+    key = cache.make_key(SEASON, None, NOV_1, None, None)
+    cache.put(key, {'standings': []}, volatile=True)
+    assert cache.get(key) is None
+
+    cache.put(key, {'standings': []})
+    assert cache.get(key) == {'standings': []}
@@ -1,19 +1,55 @@
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import type { NHLStandingsResponse, NHLFilters } from '../../../types/nhl';
-import api from '../../../utils/api';
+import api, { API_BASE_URL } from '../../../utils/api';
+
+interface LiveStandingsUpdate {
+  season: string;
+  dates: string[];
+  games: number[];
+  deltas: Record<string, Record<string, number>>;
+}
 
 export function useNHLStandings(filters: NHLFilters) {
   const [data, setData] = useState<NHLStandingsResponse | undefined>(undefined);
   const [error, setError] = useState<string | undefined>(undefined);
   const [loading, setLoading] = useState(true);
   const [timeoutOccurred, setTimeoutOccurred] = useState(false);
+  const [liveVersion, setLiveVersion] = useState(0);
+  const liveRefresh = useRef(false);
+
+  // The server pushes an event when games finish - refetch only if they fall in the shown range
+  useEffect(() => {
+    const source = new EventSource(`${API_BASE_URL}/nhl/live`);
+
+    source.addEventListener('standings', (event) => {
+      const update: LiveStandingsUpdate = JSON.parse((event as MessageEvent).data);
+      if (update.season !== (filters.season || '20242025')) return;
+
+      const touchesRange = update.dates.some((date) =>
+        (!filters.startDate || date >= filters.startDate) &&
+        (!filters.endDate || date <= filters.endDate)
+      );
+      if (touchesRange) {
+        liveRefresh.current = true;
+        setLiveVersion((version) => version + 1);
+      }
+    });
+
+    return () => {
+      source.close();
+    };
+  }, [filters.season, filters.startDate, filters.endDate]);
 
   useEffect(() => {
     let isCancelled = false;
 
     const fetchData = async () => {
+      // Live refreshes update the table in place, without the loading state
+      const isLiveRefresh = liveRefresh.current;
+      liveRefresh.current = false;
+
       try {
-        setLoading(true);
+        if (!isLiveRefresh) setLoading(true);
         setError(undefined);
         setTimeoutOccurred(false);
         
@@ -84,7 +120,7 @@ export function useNHLStandings(filters: NHLFilters) {
     return () => {
       isCancelled = true;
     };
-  }, [filters.season, filters.startDate, filters.endDate, filters.division, filters.conference]);
+  }, [filters.season, filters.startDate, filters.endDate, filters.division, filters.conference, liveVersion]);
 
   return { data, error, loading, timeoutOccurred };
 }